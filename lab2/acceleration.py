@@ -0,0 +1,124 @@
+"""
+Ускорение Андерсона для метода релаксации.
+
+Один проход G(x) — циклическая релаксация всех n компонент из точки x
+(relax_sweep; выбор по наибольшей невязке нелинеен и для экстраполяции
+не годится). Вместо
+G(x_k) следующим приближением берётся экстраполяция по depth последним
+проходам: x_{k+1} = G(x_k) - sum_j gamma_j ΔG_j, где gamma минимизирует
+||f_k - sum_j gamma_j Δf_j||_2 для f = G(x) - x.
+
+Страховка: если экстраполированная точка имеет невязку больше, чем
+обычный проход G(x_k), она отбрасывается, история очищается и счёт
+продолжается обычными проходами релаксации.
+"""
+
+from __future__ import annotations
+
+from operator import mul
+
+from .relaxation import build_iteration_matrix, initial_residual, relax_sweep
+from .sparse import matrix_diagonal
+
+
+def _small_lstsq(columns: list[list[float]], f: list[float]) -> list[float]:
+    """
+    Решение min ||f - sum_j gamma_j columns[j]||_2 через нормальные
+    уравнения; m = len(columns) мало, поэтому хватает метода Гаусса.
+    Возвращает пустой список, если система вырождена.
+    """
+    m = len(columns)
+    G = [[sum(map(mul, columns[i], columns[j])) for j in range(m)] for i in range(m)]
+    rhs = [sum(map(mul, columns[i], f)) for i in range(m)]
+    # Небольшая регуляризация от почти линейно зависимых разностей
+    scale = max((G[i][i] for i in range(m)), default=0.0)
+    for i in range(m):
+        G[i][i] += 1e-12 * scale
+
+    for k in range(m):
+        p = max(range(k, m), key=lambda i: abs(G[i][k]))
+        if G[p][k] == 0.0:
+            return []
+        G[k], G[p] = G[p], G[k]
+        rhs[k], rhs[p] = rhs[p], rhs[k]
+        for i in range(k + 1, m):
+            factor = G[i][k] / G[k][k]
+            for j in range(k, m):
+                G[i][j] -= factor * G[k][j]
+            rhs[i] -= factor * rhs[k]
+    gamma = [0.0] * m
+    for i in range(m - 1, -1, -1):
+        acc = rhs[i] - sum(G[i][j] * gamma[j] for j in range(i + 1, m))
+        gamma[i] = acc / G[i][i]
+    return gamma
+
+
+def anderson_relax(P, c, eps=1e-6, max_iter=10000, x0=None, depth=5):
+    """
+    Релаксация с ускорением Андерсона для итерационной формы x = Px + c.
+    depth — число хранимых последних проходов.
+    Возвращает (x, iter_count), где iter_count — общее число обновлений
+    компонент (n за проход), то есть сопоставимо с relax.
+    """
+    n = len(c)
+    if x0 is None:
+        x = [0.0] * n
+        R = c[:]
+    else:
+        x = [float(v) for v in x0]
+        R = initial_residual(P, c, x)
+
+    dF: list[list[float]] = []
+    dG: list[list[float]] = []
+    f_prev = g_prev = None
+    iter_count = 0
+    while True:
+        if max(map(abs, R), default=0.0) < eps:
+            break
+        if iter_count >= max_iter:
+            print("Достигнуто максимальное количество итераций.")
+            break
+
+        # Обычный проход релаксации: g = G(x)
+        g = x[:]
+        Rg = R[:]
+        iter_count += relax_sweep(P, g, Rg)
+        max_rg = max(map(abs, Rg), default=0.0)
+        if max_rg < eps:
+            x, R = g, Rg
+            break
+
+        f = [g[i] - x[i] for i in range(n)]
+        if f_prev is not None:
+            dF.append([f[i] - f_prev[i] for i in range(n)])
+            dG.append([g[i] - g_prev[i] for i in range(n)])
+            if len(dF) > depth:
+                dF.pop(0)
+                dG.pop(0)
+        f_prev, g_prev = f, g
+
+        gamma = _small_lstsq(dF, f) if dF else []
+        if gamma:
+            x_acc = g[:]
+            for gj, col in zip(gamma, dG):
+                for i in range(n):
+                    x_acc[i] -= gj * col[i]
+            R_acc = initial_residual(P, c, x_acc)
+            if max(map(abs, R_acc)) <= max_rg:
+                x, R = x_acc, R_acc
+                continue
+            # Экстраполяция ухудшила невязку: откат к обычной релаксации
+            dF.clear()
+            dG.clear()
+            f_prev = g_prev = None
+        x, R = g, Rg
+
+    return x, iter_count
+
+
+def anderson_relaxation_method(A, b, eps=1e-6, max_iter=10000, x0=None, depth=5):
+    n = len(b)
+    P = build_iteration_matrix(A)
+    diag = matrix_diagonal(A)
+    c = [b[i] / diag[i] for i in range(n)]
+    return anderson_relax(P, c, eps=eps, max_iter=max_iter, x0=x0, depth=depth)
@@ -0,0 +1,153 @@
+"""
+Пакетное решение множества независимых систем.
+
+    python -m lab2.batch systems.jsonl --workers 8 --out solutions.jsonl
+    python -m lab2.batch systems/ --method gauss_seidel
+
+Манифест — файл JSONL, по системе на строку:
+  {"id": "s1", "A": "s1/A.npy" | [[...]], "b": "s1/B.txt" | [...],
+   "method": "...", "eps": 1e-9, "max_iter": 10000}
+(id, method, eps, max_iter — необязательны; относительные пути
+отсчитываются от каталога манифеста), либо каталог, каждый подкаталог
+которого содержит файлы A.* и B.* в любом формате load_matrix/load_vector
+(id — имя подкаталога).
+
+Системы распределяются по пулу процессов порциями по chunksize: запуск
+интерпретатора и импорт lab2 оплачиваются один раз на процесс, а не на
+систему. Результат — JSONL в порядке манифеста:
+  {"id": ..., "x": [...], "iterations": k, "time_s": t}
+или {"id": ..., "error": "..."} для систем, не прошедших проверку.
+Сообщения решателя (например, о достижении max_iter) попадают в поле
+"messages", а не в вывод, чтобы не портить JSONL в stdout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .main import METHODS, solve_relaxation
+
+
+def read_manifest(path: str) -> list[dict]:
+    """Список заданий манифеста с абсолютными путями к файлам."""
+    root = Path(path)
+    tasks = []
+    if root.is_dir():
+        for sub in sorted(p for p in root.iterdir() if p.is_dir()):
+            a_files = sorted(sub.glob("A.*"))
+            b_files = sorted(sub.glob("B.*"))
+            if a_files and b_files:
+                tasks.append({"id": sub.name, "A": str(a_files[0]), "b": str(b_files[0])})
+        return tasks
+
+    with open(root, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            task = json.loads(line)
+            if "A" not in task or "b" not in task:
+                raise ValueError(f"Строка {number} манифеста: нужны поля A и b.")
+            task.setdefault("id", str(number))
+            for key in ("A", "b"):
+                if isinstance(task[key], str):
+                    task[key] = str(root.parent / task[key])
+            tasks.append(task)
+    return tasks
+
+
+def solve_task(task: dict, defaults: dict) -> dict:
+    """Решение одной системы манифеста; ошибки проверки — в поле error."""
+    options = {key: task.get(key, value) for key, value in defaults.items()}
+    inputs = {}
+    for key, file_key in (("A", "A_file"), ("b", "B_file")):
+        value = task[key]
+        inputs[file_key if isinstance(value, str) else key] = value
+
+    record: dict = {"id": task["id"]}
+    messages = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(messages):
+            x, iterations = solve_relaxation(**inputs, **options)
+    except (ValueError, OSError) as e:
+        record["error"] = str(e)
+    else:
+        record["x"] = x
+        record["iterations"] = iterations
+    record["time_s"] = time.perf_counter() - start
+    if messages.getvalue():
+        record["messages"] = messages.getvalue().splitlines()
+    return record
+
+
+def _solve_packed(args: tuple[dict, dict]) -> dict:
+    return solve_task(*args)
+
+
+def run_batch(
+    tasks: list[dict],
+    *,
+    method: str = "relaxation",
+    eps: float = 1e-9,
+    max_iter: int = 10000,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> Iterator[dict]:
+    """Результаты по мере готовности, в порядке заданий."""
+    defaults = {"method": method, "eps": eps, "max_iter": max_iter}
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        for task in tasks:
+            yield solve_task(task, defaults)
+        return
+    with mp.Pool(workers) as pool:
+        yield from pool.imap(_solve_packed, ((task, defaults) for task in tasks), chunksize=chunksize)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Пакетное решение СЛАУ по манифесту")
+    parser.add_argument("manifest", help="файл JSONL или каталог с подкаталогами A.*, B.*")
+    parser.add_argument("--method", choices=list(METHODS) + ["auto"], default="relaxation")
+    parser.add_argument("--eps", type=float, default=1e-9)
+    parser.add_argument("--max-iter", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None, help="число процессов (по умолчанию — число ядер)")
+    parser.add_argument("--chunksize", type=int, default=16)
+    parser.add_argument("--out", help="файл результатов JSONL (по умолчанию stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        tasks = read_manifest(args.manifest)
+    except (ValueError, OSError) as e:
+        print(str(e), file=sys.stderr)
+        raise SystemExit(1)
+
+    results = run_batch(
+        tasks,
+        method=args.method,
+        eps=args.eps,
+        max_iter=args.max_iter,
+        workers=args.workers,
+        chunksize=args.chunksize,
+    )
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for record in results:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if args.out:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
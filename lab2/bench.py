@@ -0,0 +1,239 @@
+"""
+Нагрузочное тестирование решателей lab2.
+
+Генерирует системы с диагональным преобладанием (плотные случайные,
+трёхдиагональные, пятиточечный 2D-оператор типа Пуассона), записывает их
+во временные файлы и замеряет для solve_relaxation:
+  load_s           — чтение A и b через load_matrix/load_vector;
+  validate_s       — validate_inputs;
+  determinant_s    — LU-определитель (только для плотных систем);
+  solve_s, iterations, iterations_per_s;
+  peak_memory_bytes — пик выделенной памяти при решении (tracemalloc,
+                      отдельный прогон; отключается --no-memory);
+  error            — max |x - x_true|.
+Отчёт — JSON, который удобно сравнивать между версиями:
+
+    python -m lab2.bench --kinds tridiagonal poisson --sizes 10 1000 100000 \\
+        --method gauss_seidel --out report.json
+
+Плотные системы больше dense_limit пропускаются: n² элементов не помещаются
+в память. Для n = 10^5 используйте разреженные виды и методы с проходами.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+from .binary import write_npy
+from .main import determinant, load_matrix, load_vector, solve_relaxation, validate_inputs
+from .methods import matvec
+from .sparse import CSRMatrix, csr_from_coo
+
+KINDS = ("random", "tridiagonal", "poisson")
+
+
+def random_dense(n: int, seed: int = 0) -> list[list[float]]:
+    rng = random.Random(seed)
+    A = [[rng.uniform(-1.0, 1.0) for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        # Запас преобладания 10% от суммы внедиагональных модулей
+        others = sum(abs(v) for j, v in enumerate(A[i]) if j != i)
+        A[i][i] = 1.1 * others + 1.0
+    return A
+
+
+def tridiagonal(n: int) -> CSRMatrix:
+    rows: list[int] = []
+    cols: list[int] = []
+    vals: list[float] = []
+    for i in range(n):
+        for j, v in ((i - 1, -1.0), (i, 4.0), (i + 1, -1.0)):
+            if 0 <= j < n:
+                rows.append(i)
+                cols.append(j)
+                vals.append(v)
+    return csr_from_coo(n, rows, cols, vals)
+
+
+def poisson2d(n: int, shift: float = 0.1) -> CSRMatrix:
+    """
+    Пятиточечный оператор на сетке m×m (m = isqrt(n)).
+    Диагональ 4 + shift даёт строгое преобладание, которого у
+    чистого оператора Пуассона нет.
+    """
+    m = max(1, math.isqrt(n))
+    rows: list[int] = []
+    cols: list[int] = []
+    vals: list[float] = []
+    for r in range(m):
+        for q in range(m):
+            i = r * m + q
+            rows.append(i)
+            cols.append(i)
+            vals.append(4.0 + shift)
+            for dr, dq in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                rr, qq = r + dr, q + dq
+                if 0 <= rr < m and 0 <= qq < m:
+                    rows.append(i)
+                    cols.append(rr * m + qq)
+                    vals.append(-1.0)
+    return csr_from_coo(m * m, rows, cols, vals)
+
+
+def generate(kind: str, n: int, seed: int = 0):
+    if kind == "random":
+        return random_dense(n, seed)
+    if kind == "tridiagonal":
+        return tridiagonal(n)
+    if kind == "poisson":
+        return poisson2d(n)
+    raise ValueError(f"Неизвестный вид системы: {kind}.")
+
+
+def _write_system(directory: Path, A, b: list[float]) -> tuple[str, str]:
+    b_path = directory / "B.npy"
+    write_npy(str(b_path), b)
+    if isinstance(A, CSRMatrix):
+        a_path = directory / "A.mtx"
+        with open(a_path, "w") as f:
+            f.write("%%MatrixMarket matrix coordinate real general\n")
+            f.write(f"{A.n} {A.n} {A.nnz}\n")
+            for i in range(A.n):
+                for j, v in A.row(i):
+                    f.write(f"{i + 1} {j + 1} {v!r}\n")
+    else:
+        a_path = directory / "A.npy"
+        write_npy(str(a_path), A)
+    return str(a_path), str(b_path)
+
+
+def run_case(
+    kind: str,
+    n: int,
+    *,
+    method: str,
+    eps: float,
+    max_iter: int,
+    seed: int = 0,
+    memory: bool = True,
+) -> dict:
+    A = generate(kind, n, seed)
+    size = A.n if isinstance(A, CSRMatrix) else len(A)
+    rng = random.Random(seed)
+    x_true = [rng.uniform(-1.0, 1.0) for _ in range(size)]
+    b = matvec(A, x_true)
+
+    record: dict = {"kind": kind, "n": size, "method": method}
+    if isinstance(A, CSRMatrix):
+        record["nnz"] = A.nnz
+
+    with tempfile.TemporaryDirectory() as tmp:
+        a_path, b_path = _write_system(Path(tmp), A, b)
+        start = time.perf_counter()
+        A_loaded = load_matrix(a_path)
+        b_loaded = list(load_vector(b_path))
+        record["load_s"] = time.perf_counter() - start
+        if not isinstance(A_loaded, CSRMatrix):
+            # Строки-представления mmap не переживут удаление каталога
+            A_loaded = [list(row) for row in A_loaded]
+
+    start = time.perf_counter()
+    validate_inputs(A_loaded, b_loaded, eps=eps, max_iter=max_iter)
+    record["validate_s"] = time.perf_counter() - start
+
+    if not isinstance(A_loaded, CSRMatrix):
+        start = time.perf_counter()
+        determinant(A_loaded)
+        record["determinant_s"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    x, iterations = solve_relaxation(A=A_loaded, b=b_loaded, eps=eps, max_iter=max_iter, method=method)
+    solve_s = time.perf_counter() - start
+    record["solve_s"] = solve_s
+    record["iterations"] = iterations
+    record["iterations_per_s"] = iterations / solve_s if solve_s > 0 else None
+    record["error"] = max(abs(g - e) for g, e in zip(x, x_true))
+
+    if not memory:
+        return record
+
+    # Память измеряется отдельным прогоном: tracemalloc заметно замедляет код
+    tracemalloc.start()
+    try:
+        solve_relaxation(A=A_loaded, b=b_loaded, eps=eps, max_iter=max_iter, method=method)
+        record["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return record
+
+
+def run_benchmark(
+    *,
+    kinds: tuple[str, ...] = KINDS,
+    sizes: tuple[int, ...] = (10, 100, 1000),
+    method: str = "relaxation",
+    eps: float = 1e-9,
+    max_iter: int = 10**6,
+    dense_limit: int = 2000,
+    seed: int = 0,
+    memory: bool = True,
+) -> dict:
+    results = []
+    for kind in kinds:
+        for n in sizes:
+            if kind == "random" and n > dense_limit:
+                continue
+            results.append(
+                run_case(kind, n, method=method, eps=eps, max_iter=max_iter, seed=seed, memory=memory)
+            )
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "eps": eps,
+        "max_iter": max_iter,
+        "results": results,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Нагрузочное тестирование solve_relaxation")
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=list(KINDS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--method", default="relaxation")
+    parser.add_argument("--eps", type=float, default=1e-9)
+    parser.add_argument("--max-iter", type=int, default=10**6)
+    parser.add_argument("--dense-limit", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="не замерять пик памяти (быстрее)")
+    parser.add_argument("--out", help="файл отчёта JSON (по умолчанию stdout)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        kinds=tuple(args.kinds),
+        sizes=tuple(args.sizes),
+        method=args.method,
+        eps=args.eps,
+        max_iter=args.max_iter,
+        dense_limit=args.dense_limit,
+        seed=args.seed,
+        memory=not args.no_memory,
+    )
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import ast
+import math
+import mmap
+import struct
+import sys
+from array import array
+from typing import Sequence
+
+NPY_MAGIC = b"\x93NUMPY"
+
+
+def _map_file(filename: str) -> memoryview:
+    """Отображение файла в память только для чтения (без копирования)."""
+    with open(filename, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Пустой файл нельзя отобразить
+            return memoryview(b"")
+    return memoryview(mm)
+
+
+def _as_doubles(buf: memoryview, swap: bool) -> Sequence[float]:
+    if len(buf) % 8 != 0:
+        raise ValueError("Размер двоичных данных не кратен 8 байтам (float64).")
+    if not swap:
+        return buf.cast("d")
+    # Чужой порядок байт: без копирования не обойтись
+    values = array("d")
+    values.frombytes(buf)
+    values.byteswap()
+    return values
+
+
+def _parse_npy_header(buf: bytes, filename: str) -> tuple[tuple[int, ...], int, bool]:
+    if bytes(buf[:6]) != NPY_MAGIC:
+        raise ValueError(f"Файл {filename} не является файлом .npy.")
+    major = buf[6]
+    if major == 1:
+        (header_len,) = struct.unpack("<H", buf[8:10])
+        offset = 10
+    else:
+        (header_len,) = struct.unpack("<I", buf[8:12])
+        offset = 12
+    header = ast.literal_eval(bytes(buf[offset : offset + header_len]).decode("latin1"))
+    offset += header_len
+
+    descr = header["descr"]
+    if descr not in ("<f8", ">f8", "=f8", "|f8"):
+        raise ValueError(f"Поддерживается только тип float64, в файле {descr}.")
+    shape = tuple(header["shape"])
+    if header["fortran_order"] and len(shape) > 1:
+        raise ValueError("Поддерживается только построчный (C) порядок хранения .npy.")
+
+    swap = (descr == ">f8") != (sys.byteorder == "big")
+    return shape, offset, swap
+
+
+def npy_header(filename: str) -> tuple[tuple[int, ...], int, bool]:
+    """
+    Заголовок .npy без чтения данных: (форма, смещение данных в байтах,
+    нужна ли перестановка байт).
+    """
+    with open(filename, "rb") as f:
+        head = f.read(12)
+        if len(head) < 12:
+            raise ValueError(f"Файл {filename} не является файлом .npy.")
+        if head[6] == 1:
+            size = 10 + struct.unpack("<H", head[8:10])[0]
+        else:
+            size = 12 + struct.unpack("<I", head[8:12])[0]
+        f.seek(0)
+        return _parse_npy_header(f.read(size), filename)
+
+
+def read_npy(filename: str) -> tuple[tuple[int, ...], Sequence[float]]:
+    """
+    Чтение массива float64 из файла .npy (формат NumPy, версии 1–3).
+    Данные не копируются: возвращается плоское представление поверх mmap
+    и форма массива из заголовка.
+    """
+    buf = _map_file(filename)
+    shape, offset, swap = _parse_npy_header(buf, filename)
+    values = _as_doubles(buf[offset:], swap)
+    if len(values) != math.prod(shape):
+        raise ValueError(f"Размер данных в {filename} не совпадает с формой {shape}.")
+    return shape, values
+
+
+def write_npy(filename: str, data: Sequence[float] | Sequence[Sequence[float]]) -> None:
+    """Запись вектора или матрицы float64 в файл .npy (версия 1.0)."""
+    is_matrix = len(data) > 0 and not isinstance(data[0], (int, float))
+    if is_matrix:
+        shape: tuple[int, ...] = (len(data), len(data[0]))
+        values = array("d")
+        for row in data:
+            values.extend(row)
+    else:
+        shape = (len(data),)
+        values = array("d", data)
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    header = f"{{'descr': '<f8', 'fortran_order': False, 'shape': {shape}, }}"
+    # Заголовок дополняется пробелами до границы 64 байт, как в NumPy
+    pad = 64 - (len(NPY_MAGIC) + 4 + len(header) + 1) % 64
+    header = header + " " * pad + "\n"
+    with open(filename, "wb") as f:
+        f.write(NPY_MAGIC + b"\x01\x00")
+        f.write(struct.pack("<H", len(header)))
+        f.write(header.encode("latin1"))
+        f.write(values.tobytes())
+
+
+def read_raw(filename: str) -> Sequence[float]:
+    """Плоский массив float64 (порядок байт платформы) поверх mmap."""
+    return _as_doubles(_map_file(filename), swap=False)
+
+
+def write_raw(filename: str, data: Sequence[float] | Sequence[Sequence[float]]) -> None:
+    values = array("d")
+    if len(data) > 0 and not isinstance(data[0], (int, float)):
+        for row in data:
+            values.extend(row)
+    else:
+        values.extend(data)
+    with open(filename, "wb") as f:
+        values.tofile(f)
+
+
+def matrix_rows(values: Sequence[float], n_rows: int, n_cols: int) -> list[Sequence[float]]:
+    """
+    Разбиение плоского массива на строки.
+    Срезы memoryview не копируют данные, поэтому матрица остаётся в mmap.
+    """
+    return [values[i * n_cols : (i + 1) * n_cols] for i in range(n_rows)]
+
+
+def read_binary_matrix(filename: str) -> list[Sequence[float]]:
+    if filename.endswith(".npy"):
+        shape, values = read_npy(filename)
+        if len(shape) != 2:
+            raise ValueError(f"Ожидалась двумерная матрица, форма в файле {shape}.")
+        n_rows, n_cols = shape
+    else:
+        values = read_raw(filename)
+        n_rows = math.isqrt(len(values))
+        if n_rows * n_rows != len(values):
+            raise ValueError("Матрица A не является квадратной")
+        n_cols = n_rows
+    return matrix_rows(values, n_rows, n_cols)
+
+
+def read_binary_vector(filename: str) -> Sequence[float]:
+    if filename.endswith(".npy"):
+        shape, values = read_npy(filename)
+        if len(shape) != 1:
+            raise ValueError(f"Ожидался вектор, форма в файле {shape}.")
+        return values
+    return read_raw(filename)
@@ -0,0 +1,53 @@
+"""
+Контрольные точки метода релаксации.
+
+Состояние итераций полностью задаётся (x, R, iter_count), поэтому
+продолжение с контрольной точки даёт ровно тот же результат, что и
+непрерывный счёт. Формат файла (порядок байт платформы):
+  8 байт   — сигнатура b"RLXCKPT1";
+  int64    — n;  int64 — iter_count;
+  32 байта — SHA-256 вектора c (проверка, что система та же);
+  n float64 — x;  n float64 — R.
+Запись атомарна: данные пишутся во временный файл и заменяют старый.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+from array import array
+
+MAGIC = b"RLXCKPT1"
+_HEADER = struct.Struct("=8sqq32s")
+
+
+def fingerprint(c: list[float]) -> bytes:
+    return hashlib.sha256(array("d", c).tobytes()).digest()
+
+
+def save_checkpoint(path: str, x: list[float], R: list[float], iter_count: int, digest: bytes) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(x), iter_count, digest))
+        array("d", x).tofile(f)
+        array("d", R).tofile(f)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: str) -> tuple[list[float], list[float], int, bytes]:
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError(f"Файл {path} не является контрольной точкой.")
+        magic, n, iter_count, digest = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"Файл {path} не является контрольной точкой.")
+        x = array("d")
+        R = array("d")
+        try:
+            x.fromfile(f, n)
+            R.fromfile(f, n)
+        except EOFError:
+            raise ValueError(f"Контрольная точка {path} повреждена.")
+    return x.tolist(), R.tolist(), iter_count, digest
@@ -0,0 +1,161 @@
+"""
+Постоянный кэш подготовленных матриц на диске.
+
+Повторный запуск с той же A не разбирает текст заново и не повторяет
+проверки (преобладание, определитель): в каталоге кэша хранятся A в
+двоичном виде и вердикт validate_matrix.
+
+Ключ записи — SHA-256 содержимого файла A вместе с расширением и
+параметрами проверки. Чтобы не хэшировать файл при каждом запуске,
+index.json запоминает для каждого пути (размер, mtime_ns, хэш): если
+размер и время изменения совпали, хэш берётся из индекса.
+
+Файлы записи <key>:
+  <key>.json — {"format": "dense" | "csr" | null, "error": str | null};
+  <key>.npy  — плотная A (читается через mmap без копирования);
+  <key>.csr  — разреженная A: int64 n, nnz, затем indptr, indices (int64)
+               и data (float64), порядок байт платформы.
+Суммарный размер ограничен max_bytes; при превышении удаляются записи,
+которые дольше всех не использовались (время изменения .json
+обновляется при каждом попадании). Запись атомарна, как у контрольных
+точек: временный файл заменяет старый через os.replace.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Optional
+
+from .binary import read_binary_matrix, write_npy
+from .sparse import CSRMatrix
+
+_CSR_HEADER = struct.Struct("=qq")
+
+
+def _write_atomic(path: Path, write) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def _write_csr(path: Path, A: CSRMatrix) -> None:
+    def write(f) -> None:
+        f.write(_CSR_HEADER.pack(A.n, A.nnz))
+        array("q", A.indptr).tofile(f)
+        array("q", A.indices).tofile(f)
+        array("d", A.data).tofile(f)
+
+    _write_atomic(path, write)
+
+
+def _read_csr(path: Path) -> CSRMatrix:
+    with open(path, "rb") as f:
+        n, nnz = _CSR_HEADER.unpack(f.read(_CSR_HEADER.size))
+        indptr, indices, data = array("q"), array("q"), array("d")
+        indptr.fromfile(f, n + 1)
+        indices.fromfile(f, nnz)
+        data.fromfile(f, nnz)
+    return CSRMatrix(n, indptr.tolist(), indices.tolist(), data.tolist())
+
+
+class PreparedCache:
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.directory / "index.json"
+
+    def _load_index(self) -> dict:
+        try:
+            return json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # Нет индекса или он повреждён: хэши просто посчитаются заново
+            return {}
+
+    def content_hash(self, filename: str) -> str:
+        """Хэш содержимого с быстрой проверкой по размеру и mtime."""
+        path = str(Path(filename).resolve())
+        st = os.stat(path)
+        index = self._load_index()
+        known = index.get(path)
+        if known is not None and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        index[path] = [st.st_size, st.st_mtime_ns, digest.hexdigest()]
+        _write_atomic(self._index_path, lambda f: f.write(json.dumps(index).encode("utf-8")))
+        return digest.hexdigest()
+
+    def key(self, filename: str, tag: str = "") -> str:
+        # Расширение входит в ключ: одни и те же байты в разных форматах —
+        # разные матрицы; tag — параметры проверки
+        digest = hashlib.sha256(f"{Path(filename).suffix}:{tag}:".encode())
+        digest.update(self.content_hash(filename).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        """
+        (A, error) для известного ключа или None. Для матрицы, не
+        прошедшей проверку, A = None, а error — сообщение проверки.
+        """
+        meta_path = self.directory / f"{key}.json"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta["format"] == "dense":
+                A = read_binary_matrix(str(self.directory / f"{key}.npy"))
+            elif meta["format"] == "csr":
+                A = _read_csr(self.directory / f"{key}.csr")
+            else:
+                A = None
+        except (OSError, ValueError, KeyError, struct.error, EOFError):
+            return None
+        os.utime(meta_path)  # отметка использования для вытеснения
+        return A, meta["error"]
+
+    def put(self, key: str, A=None, error: Optional[str] = None) -> None:
+        fmt = None
+        if error is None and isinstance(A, CSRMatrix):
+            fmt = "csr"
+            _write_csr(self.directory / f"{key}.csr", A)
+        elif error is None:
+            fmt = "dense"
+            tmp = self.directory / f"{key}.npy.tmp"
+            write_npy(str(tmp), A)
+            os.replace(tmp, self.directory / f"{key}.npy")
+        meta = json.dumps({"format": fmt, "error": error}, ensure_ascii=False)
+        _write_atomic(self.directory / f"{key}.json", lambda f: f.write(meta.encode("utf-8")))
+        self.evict(keep=key)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Удаление давно не использованных записей сверх max_bytes."""
+        entries = []
+        total = 0
+        for meta_path in self.directory.glob("*.json"):
+            if meta_path == self._index_path:
+                continue
+            key = meta_path.stem
+            files = [meta_path] + [
+                p for p in (self.directory / f"{key}.npy", self.directory / f"{key}.csr") if p.exists()
+            ]
+            size = sum(p.stat().st_size for p in files)
+            total += size
+            entries.append((meta_path.stat().st_mtime_ns, key, size, files))
+
+        entries.sort()
+        for _, key, size, files in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            for p in files:
+                p.unlink(missing_ok=True)
+            total -= size
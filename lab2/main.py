@@ -1,70 +1,151 @@
 from __future__ import annotations
 
-from typing import Optional
+import argparse
+import math
+from typing import Optional, Union
+
+from .acceleration import anderson_relaxation_method
+from .amg import amg_method
+from .analysis import predict_convergence
+from .binary import read_binary_matrix, read_binary_vector
+from .diskcache import PreparedCache
+from .methods import conjugate_gradient_method, gauss_seidel_method, jacobi_method, sor_method
+from .packed import (
+    PACKED_TYPES,
+    BandMatrix,
+    SymmetricPackedMatrix,
+    is_tridiagonal,
+    packed_relaxation_method,
+    read_packed_matrix,
+    thomas_solve,
+)
+from .outofcore import out_of_core_relaxation_method, validate_out_of_core
+from .parallel import colored_gauss_seidel_method, parallel_jacobi_method
+from .randomized import coordinate_descent_method, kaczmarz_method, matrix_shape, validate_general
+from .relaxation import (
+    block_relaxation_method,
+    build_iteration_matrix,
+    initial_residual,
+    iter_relaxation,
+    mixed_precision_relaxation_method,
+    relax,
+    relaxation_method,
+)
+from .sparse import (
+    CSRMatrix,
+    csr_from_coo,
+    matrix_diagonal,
+    permute_matrix,
+    reverse_cuthill_mckee,
+)
+
+Matrix = Union[list[list[float]], CSRMatrix, BandMatrix, SymmetricPackedMatrix]
+
+# Хранения с доступом к строкам через A.n и A.row(i)
+ROW_STORAGE = (CSRMatrix,) + PACKED_TYPES
 
 def read_matrix(filename):
+    """
+    Разбор одним проходом по буферу: длина строки m берётся из первой
+    непустой строки, остаток файла разбирается одним split() и
+    нарезается на строки по m значений. Если число значений или строк
+    не сходится (пустые строки, строки разной длины), остаток
+    разбирается построчно, чтобы проверки увидели настоящие строки.
+    """
     with open(filename, 'r') as f:
-        lines = f.readlines()
-    matrix = []
-    for line in lines:
-        row = list(map(float, line.split()))
-        if row:
-            matrix.append(row)
-    return matrix
+        first = []
+        for line in f:
+            first = list(map(float, line.split()))
+            if first:
+                break
+        rest = f.read()
+    if not first:
+        return []
+
+    m = len(first)
+    values = list(map(float, rest.split()))
+    lines = rest.count('\n') + (1 if rest and not rest.endswith('\n') else 0)
+    if len(values) == lines * m:
+        return [first] + [values[k:k + m] for k in range(0, len(values), m)]
+    return [first] + [row for row in (list(map(float, line.split())) for line in rest.splitlines()) if row]
 
 def read_vector(filename):
+    # Весь вектор разбирается одним проходом по буферу
     with open(filename, 'r') as f:
-        lines = f.readlines()
-    vec = []
-    for line in lines:
-        val = line.strip()
-        if val:
-            vec.append(float(val))
-    return vec
-
-def relaxation_method(A, b, eps=1e-6, max_iter=10000):
-    n = len(b)
-
-    # Подготовка P и c
-    P = [[0.0 for _ in range(n)] for _ in range(n)]
-    c = [0.0 for _ in range(n)]
-    for i in range(n):
-        c[i] = b[i] / A[i][i]
-        for j in range(n):
-            P[i][j] = -1.0 if i == j else -A[i][j] / A[i][i]
-
-    # Начальное приближение
-    x = [0.0 for _ in range(n)]
-    R = c[:]  # копия c
-
-    iter_count = 0
-    while iter_count < max_iter:
-        # Находим индекс максимальной по модулю невязки
-        max_r = abs(R[0])
-        s = 0
-        for i in range(1, n):
-            if abs(R[i]) > max_r:
-                max_r = abs(R[i])
-                s = i
-
-        if max_r < eps:
-            break
+        return list(map(float, f.read().split()))
 
-        delta = R[s]          # величина поправки
-        x[s] += delta         # обновление переменной
+def read_coo_matrix(filename):
+    """
+    Чтение разреженной матрицы в координатном формате.
+    Поддерживается Matrix Market (`%%MatrixMarket matrix coordinate real ...`,
+    строка размеров `M N NNZ`) и простой список строк `i j value`.
+    Индексы в файле нумеруются с 1.
+    """
+    symmetric = False
+    size = None
+    rows: list[int] = []
+    cols: list[int] = []
+    vals: list[float] = []
+    with open(filename, 'r') as f:
+        for k, line in enumerate(f):
+            if k == 0 and line.startswith('%%MatrixMarket'):
+                header = line.lower().split()
+                if 'coordinate' not in header:
+                    raise ValueError("Поддерживается только координатный формат Matrix Market.")
+                if 'complex' in header or 'pattern' in header:
+                    raise ValueError("Поддерживаются только вещественные матрицы Matrix Market.")
+                symmetric = 'symmetric' in header
+                size = []  # следующая значимая строка — размеры
+                continue
+            parts = line.split()
+            if not parts or parts[0].startswith('%'):
+                continue
+            if size == []:
+                size = [int(parts[0]), int(parts[1])]
+                continue
+            i, j, v = int(parts[0]) - 1, int(parts[1]) - 1, float(parts[2])
+            rows.append(i)
+            cols.append(j)
+            vals.append(v)
+            if symmetric and i != j:
+                rows.append(j)
+                cols.append(i)
+                vals.append(v)
 
-        # Обновляем остальные невязки
-        for i in range(n):
-            if i != s:
-                R[i] += P[i][s] * delta
-        R[s] = 0.0
+    if size:
+        n_rows, n_cols = size
+    else:
+        n_rows = max(rows, default=-1) + 1
+        n_cols = max(cols, default=-1) + 1
+    if n_rows != n_cols or n_rows == 0:
+        raise ValueError("Матрица A не является квадратной")
+    return csr_from_coo(n_rows, rows, cols, vals)
 
-        iter_count += 1
+BINARY_EXTENSIONS = ('.npy', '.bin', '.f64')
+COORDINATE_EXTENSIONS = ('.mtx', '.coo')
 
-    if iter_count >= max_iter:
-        print("Достигнуто максимальное количество итераций.")
+def load_matrix(filename, packed=False):
+    """
+    Загрузка A с выбором формата по расширению:
+      .npy        — NumPy float64, отображается в память без копирования;
+      .bin, .f64  — сырые float64 (n*n значений), тоже через mmap;
+      .mtx, .coo  — координатный формат, результат в CSR;
+      иначе       — текст, строка файла = строка матрицы.
+    packed=True — для текста определить ленточную или симметричную
+    структуру и вернуть компактную форму (lab2/packed.py).
+    """
+    if filename.endswith(BINARY_EXTENSIONS):
+        return read_binary_matrix(filename)
+    if filename.endswith(COORDINATE_EXTENSIONS):
+        return read_coo_matrix(filename)
+    if packed:
+        return read_packed_matrix(filename)
+    return read_matrix(filename)
 
-    return x, iter_count
+def load_vector(filename):
+    if filename.endswith(BINARY_EXTENSIONS):
+        return read_binary_vector(filename)
+    return read_vector(filename)
 
 def is_square_matrix(matrix):
     n = len(matrix)
@@ -77,14 +158,29 @@ def is_square_matrix(matrix):
 
 
 def is_diagonally_dominant(
-    A: list[list[float]],
+    A: Matrix,
     tol: float = 0.0,
 ) -> bool:
     """
     Проверка диагонального преобладания по строкам:
       |a_ii| > sum_{j != i} |a_ij|
     tol — допуск для вещественных чисел.
+    Для CSR и компактных форм проверка проходит только по хранимым
+    элементам.
     """
+    if isinstance(A, ROW_STORAGE):
+        for i in range(A.n):
+            diag = 0.0
+            others = 0.0
+            for j, v in A.row(i):
+                if j == i:
+                    diag = abs(v)
+                else:
+                    others += abs(v)
+            if not (diag > others + tol):
+                return False
+        return True
+
     n = len(A)
     for i in range(n):
         diag = abs(A[i][i])
@@ -97,80 +193,407 @@ def is_diagonally_dominant(
     return True
 
 
-def determinant(matrix: list[list[float]]) -> float:
+def lu_decompose(matrix: list[list[float]]) -> tuple[list[list[float]], list[int], int]:
+    """
+    LU-разложение с частичным выбором ведущего элемента, O(n^3).
+    Возвращает (LU, perm, sign): L (без единичной диагонали) и U хранятся
+    в одной матрице, perm — перестановка строк, sign — её чётность (±1).
+    Если ведущий элемент столбца равен 0, sign = 0 (матрица вырождена).
+    """
     if not matrix or not matrix[0]:
         raise ValueError("Нельзя вычислить определитель пустой матрицы.")
-    ln = len(matrix)
-    if ln == 1:
-        return matrix[0][0]
-    if ln == 2:
-        return matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
-
-    det = 0.0
-    for k in range(ln):
-        minor = [matrix[i][:k] + matrix[i][k + 1 :] for i in range(1, ln)]
-        det += matrix[0][k] * ((-1.0) ** k) * determinant(minor)
+    n = len(matrix)
+    LU = [list(row) for row in matrix]
+    perm = list(range(n))
+    sign = 1
+    for k in range(n):
+        # Выбор ведущего элемента по модулю в столбце k
+        p = max(range(k, n), key=lambda i: abs(LU[i][k]))
+        if LU[p][k] == 0.0:
+            return LU, perm, 0
+        if p != k:
+            LU[k], LU[p] = LU[p], LU[k]
+            perm[k], perm[p] = perm[p], perm[k]
+            sign = -sign
+        pivot_row = LU[k]
+        pivot = pivot_row[k]
+        for i in range(k + 1, n):
+            row = LU[i]
+            factor = row[k] / pivot
+            if factor == 0.0:
+                continue
+            row[k] = factor
+            for j in range(k + 1, n):
+                row[j] -= factor * pivot_row[j]
+    return LU, perm, sign
+
+
+def log_determinant(matrix: list[list[float]]) -> tuple[float, float]:
+    """
+    Знак и натуральный логарифм модуля определителя: det = sign * exp(logabs).
+    Не переполняется для больших n, где само произведение выходит за float.
+    Для вырожденной матрицы возвращает (0.0, -inf).
+    """
+    LU, _, sign = lu_decompose(matrix)
+    if sign == 0:
+        return 0.0, -math.inf
+    logabs = 0.0
+    for k in range(len(LU)):
+        u = LU[k][k]
+        if u < 0:
+            sign = -sign
+        logabs += math.log(abs(u))
+    return float(sign), logabs
+
+
+def determinant(matrix: list[list[float]]) -> float:
+    LU, _, sign = lu_decompose(matrix)
+    det = float(sign)
+    for k in range(len(LU)):
+        det *= LU[k][k]
     return det
 
 
-def validate_inputs(
-    A: list[list[float]],
-    b: list[float],
+def is_nonsingular(matrix: list[list[float]], tol: float = 1e-12) -> bool:
+    """
+    Проверка невырожденности: |det(A)| >= tol.
+    Сравнение ведётся в логарифмах, поэтому не зависит от переполнения.
+    """
+    sign, logabs = log_determinant(matrix)
+    return sign != 0.0 and logabs >= math.log(tol)
+
+
+def validate_matrix(
+    A: Matrix,
     *,
-    eps: float,
-    max_iter: int,
     dominance_tol: float = 0.0,
 ) -> None:
-    n = len(A)
-    if len(b) != n:
-        raise ValueError(f"Размерность b ({len(b)}) не совпадает с размерностью A ({n}x{n}).")
+    """
+    Проверки, зависящие только от A: квадратность, ненулевая диагональ,
+    диагональное преобладание и невырожденность.
+    """
+    sparse = isinstance(A, ROW_STORAGE)
+    # CSR всегда квадратная по построению; для плотной A проверяем до
+    # обращения к диагонали, иначе A[i][i] может выйти за границы строки
+    if not sparse and not is_square_matrix(A):
+        raise ValueError("Матрица A не является квадратной")
 
     # Проверка ненулевой диагонали
-    for i in range(n):
-        if A[i][i] == 0:
+    diag = matrix_diagonal(A)
+    for i in range(len(diag)):
+        if diag[i] == 0:
             raise ValueError(f"Диагональный элемент A[{i}][{i}] равен 0.")
 
     if not is_diagonally_dominant(A, tol=dominance_tol):
         raise ValueError("Матрица A не удовлетворяет условию диагонального преобладания")
 
-    if not is_square_matrix(A):
-        raise ValueError("Матрица A не является квадратной")
+    # Строгое диагональное преобладание (tol >= 0) само доказывает
+    # невырожденность (теорема Леви–Деспланка), определитель не нужен.
+    # Для разреженной A плотное LU не строим.
+    if dominance_tol >= 0 or sparse:
+        return
 
     # Проверка невырожденности
-    det = determinant(A)
-    if abs(det) < 1e-12:
+    if not is_nonsingular(A):
         raise ValueError("Матрица A является вырожденной")
 
 
+def validate_inputs(
+    A: Matrix,
+    b: list[float],
+    *,
+    eps: float,
+    max_iter: int,
+    dominance_tol: float = 0.0,
+    check_matrix: bool = True,
+) -> None:
+    """check_matrix=False — A уже проверена (например, взята из кэша)."""
+    sparse = isinstance(A, ROW_STORAGE)
+    if not sparse and not is_square_matrix(A):
+        raise ValueError("Матрица A не является квадратной")
+
+    n = A.n if sparse else len(A)
+    if len(b) != n:
+        raise ValueError(f"Размерность b ({len(b)}) не совпадает с размерностью A ({n}x{n}).")
+
+    if check_matrix:
+        validate_matrix(A, dominance_tol=dominance_tol)
+
+
+def load_validated_matrix(filename, cache_dir, *, dominance_tol=0.0, max_bytes=256 * 1024 * 1024):
+    """
+    Загрузка и проверка A через постоянный кэш (lab2/diskcache.py).
+    При попадании A читается из двоичной копии, а проверки не
+    повторяются; для отвергнутой матрицы повторяется сохранённая ошибка.
+    """
+    cache = PreparedCache(cache_dir, max_bytes=max_bytes)
+    key = cache.key(filename, f"dominance_tol={dominance_tol!r}")
+    entry = cache.get(key)
+    if entry is not None:
+        A, error = entry
+        if error is not None:
+            raise ValueError(error)
+        return A
+
+    A = load_matrix(filename)
+    try:
+        validate_matrix(A, dominance_tol=dominance_tol)
+    except ValueError as e:
+        cache.put(key, error=str(e))
+        raise
+    cache.put(key, A)
+    return A
+
+
+METHODS = {
+    "relaxation": relaxation_method,
+    "jacobi": jacobi_method,
+    "gauss_seidel": gauss_seidel_method,
+    "sor": sor_method,
+    "cg": conjugate_gradient_method,
+    "parallel_jacobi": parallel_jacobi_method,
+    "block_relaxation": block_relaxation_method,
+    "amg": amg_method,
+    "colored_gauss_seidel": colored_gauss_seidel_method,
+    "kaczmarz": kaczmarz_method,
+    "coordinate_descent": coordinate_descent_method,
+}
+
+# Методы, не требующие диагонального преобладания и квадратной A
+GENERAL_METHODS = ("kaczmarz", "coordinate_descent")
+
+
 def solve_relaxation(
     *,
-    A: Optional[list[list[float]]] = None,
+    A: Optional[Matrix] = None,
     b: Optional[list[float]] = None,
     A_file: str = "A.txt",
     B_file: str = "B.txt",
     eps: float = 1e-9,
     max_iter: int = 10000,
     dominance_tol: float = 0.0,
+    method: str = "relaxation",
+    omega: float = 1.0,
+    workers: Optional[int] = None,
+    callback=None,
+    callback_every: int = 1,
+    x0: Optional[list[float]] = None,
+    reorder: Optional[str] = None,
+    accelerate: Optional[str] = None,
+    block_size: Optional[int] = None,
+    precision: Optional[str] = None,
+    checkpoint: Optional[str] = None,
+    checkpoint_every: Optional[int] = None,
+    checkpoint_seconds: Optional[float] = None,
+    resume_from: Optional[str] = None,
+    out_of_core: bool = False,
+    block_rows: Optional[int] = None,
+    cache_dir: Optional[str] = None,
 ) -> tuple[list[float], int]:
-    if A is None:
-        A = read_matrix(A_file)
+    """
+    method — итерационный метод: "relaxation" (по умолчанию), "jacobi",
+    "gauss_seidel", "sor" (с параметром omega), "cg" (для симметричной A),
+    "parallel_jacobi" (блочный Якоби на workers процессах) или
+    "block_relaxation" (block_size компонент с наибольшей невязкой за один
+    просмотр; None — адаптивный выбор) или "amg" (V-циклы сглаженной
+    агрегации со сглаживателем-релаксацией, lab2/amg.py) или
+    "colored_gauss_seidel" (Гаусс–Зейдель по цветам раскраски шаблона A
+    на workers процессах, см. lab2/parallel.py).
+    "kaczmarz" и "coordinate_descent" — рандомизированные методы
+    (lab2/randomized.py) для систем без диагонального преобладания, в том
+    числе прямоугольных m×n при m >= n: проверка преобладания и
+    квадратности для них не выполняется.
+    Стоимость итерации разных методов сравнивается в lab2/methods.py.
+    callback и callback_every передаются в relax (только для "relaxation"),
+    готовый регистратор — lab2.telemetry.ConvergenceRecorder.
+    x0 — начальное приближение для всех методов (по умолчанию нулевое).
+    reorder="rcm" — решать в перестановке Reverse Cuthill–McKee, которая
+    сужает ленту A и делает обновления невязки локальными; x возвращается
+    в исходной нумерации.
+    accelerate="anderson" — ускорение Андерсона поверх циклических проходов
+    релаксации (только для "relaxation"), см. lab2/acceleration.py.
+    precision="float32" | "float64" — хранить P компактным массивом
+    (только для "relaxation"); x и невязки остаются в float64,
+    финальное уточнение по A восстанавливает точность eps.
+    checkpoint, checkpoint_every, checkpoint_seconds, resume_from —
+    контрольные точки (только для "relaxation"), см. relax.
+    Текстовый A_file читается с определением структуры: ленточная и
+    симметричная A хранятся компактно (lab2/packed.py), обычная
+    релаксация идёт прямо по ним, а трёхдиагональная система решается
+    методом прогонки за O(n) (число итераций 0). Прочие методы получают
+    такую A в CSR.
+    method="auto" — перед решением оценить спектральный радиус и число
+    итераций (lab2/analysis.py), выбрать самый дешёвый метод и бюджет
+    max_iter по прогнозу; прогноз печатается рядом с фактическим числом
+    итераций.
+    out_of_core=True — не загружать A в память, а читать её из двоичного
+    A_file (.npy, .bin, .f64) блоками по block_rows строк при каждом
+    проходе релаксации, см. lab2/outofcore.py.
+    cache_dir — каталог постоянного кэша: A из A_file хранится там в
+    двоичном виде вместе с результатом проверки, и повторные запуски с
+    той же A пропускают разбор файла и проверки.
+    """
+    if reorder not in (None, "rcm"):
+        raise ValueError(f"Неизвестный способ перенумерации: {reorder}.")
+    if method not in METHODS and method != "auto":
+        raise ValueError(f"Неизвестный метод: {method}. Допустимые: {', '.join(METHODS)}, auto.")
+    if callback is not None and method != "relaxation":
+        raise ValueError("callback поддерживается только методом релаксации.")
+    if accelerate not in (None, "anderson"):
+        raise ValueError(f"Неизвестный способ ускорения: {accelerate}.")
+    if accelerate is not None and (method != "relaxation" or callback is not None):
+        raise ValueError("Ускорение поддерживается только методом релаксации без callback.")
+    if precision is not None and (method != "relaxation" or callback is not None or accelerate is not None):
+        raise ValueError("Компактное хранение P поддерживается только методом релаксации без callback и ускорения.")
+    checkpointing = checkpoint is not None or resume_from is not None
+    if checkpointing and (method != "relaxation" or accelerate is not None or precision is not None):
+        raise ValueError("Контрольные точки поддерживаются только обычным методом релаксации.")
+    if out_of_core:
+        return _solve_out_of_core(
+            A=A,
+            b=b,
+            A_file=A_file,
+            B_file=B_file,
+            eps=eps,
+            max_iter=max_iter,
+            dominance_tol=dominance_tol,
+            x0=x0,
+            block_rows=block_rows,
+            other_options=(
+                method != "relaxation"
+                or callback is not None
+                or reorder is not None
+                or accelerate is not None
+                or precision is not None
+                or checkpointing
+            ),
+        )
+    general = method in GENERAL_METHODS
+    if general and (reorder is not None or cache_dir is not None):
+        raise ValueError("Перенумерация и кэш проверок не поддерживаются рандомизированными методами.")
+    validated = False
+    if A is None and cache_dir is not None:
+        A = load_validated_matrix(A_file, cache_dir, dominance_tol=dominance_tol)
+        validated = True
+    elif A is None:
+        A = load_matrix(A_file, packed=not general)
     if b is None:
-        b = read_vector(B_file)
+        b = load_vector(B_file)
+
+    if general:
+        validate_general(A, b)
+        m, n = matrix_shape(A)
+        if x0 is not None and len(x0) != n:
+            raise ValueError(f"Размерность x0 ({len(x0)}) не совпадает с размерностью A ({m}x{n}).")
+    else:
+        validate_inputs(
+            A,
+            b,
+            eps=eps,
+            max_iter=max_iter,
+            dominance_tol=dominance_tol,
+            check_matrix=not validated,
+        )
+        if x0 is not None and len(x0) != len(b):
+            raise ValueError(f"Размерность x0 ({len(x0)}) не совпадает с размерностью A ({len(b)}x{len(b)}).")
+
+    if isinstance(A, PACKED_TYPES):
+        plain = (
+            method == "relaxation"
+            and callback is None
+            and accelerate is None
+            and precision is None
+            and reorder is None
+            and not checkpointing
+        )
+        if plain and is_tridiagonal(A):
+            # Прямой метод прогонки: итерации не нужны
+            return thomas_solve(A, b), 0
+        if plain:
+            return packed_relaxation_method(A, b, eps=eps, max_iter=max_iter, x0=x0)
+        # Остальные методы и режимы работают с CSR
+        A = A.to_csr()
 
-    validate_inputs(
-        A,
-        b,
-        eps=eps,
-        max_iter=max_iter,
+    prediction = None
+    if method == "auto":
+        prediction = predict_convergence(A, b, eps=eps, x0=x0)
+        method = prediction.method
+        max_iter = prediction.budget(max_iter)
+
+    # Параметры, специфичные для метода, передаются только ему
+    options = {"eps": eps, "max_iter": max_iter}
+    if method == "sor":
+        options["omega"] = omega
+    elif method in ("parallel_jacobi", "colored_gauss_seidel"):
+        options["workers"] = workers
+    elif method == "block_relaxation":
+        options["block_size"] = block_size
+    elif method == "relaxation" and precision is not None:
+        options["precision"] = precision
+    elif method == "relaxation" and accelerate is None:
+        options["callback"] = callback
+        options["callback_every"] = callback_every
+        options["checkpoint"] = checkpoint
+        options["checkpoint_every"] = checkpoint_every
+        options["checkpoint_seconds"] = checkpoint_seconds
+        options["resume_from"] = resume_from
+
+    if accelerate == "anderson":
+        solver = anderson_relaxation_method
+    elif precision is not None:
+        solver = mixed_precision_relaxation_method
+    else:
+        solver = METHODS[method]
+
+    if reorder == "rcm":
+        perm = reverse_cuthill_mckee(A)
+        A = permute_matrix(A, perm)
+        b = [b[old] for old in perm]
+        if x0 is not None:
+            x0 = [x0[old] for old in perm]
+        x, iter_count = solver(A, b, x0=x0, **options)
+        # Возврат к исходной нумерации неизвестных
+        x_orig = [0.0] * len(x)
+        for k, old in enumerate(perm):
+            x_orig[old] = x[k]
+        x = x_orig
+    else:
+        x, iter_count = solver(A, b, x0=x0, **options)
+
+    if prediction is not None:
+        print(prediction.report(iter_count))
+    return x, iter_count
+
+def _solve_out_of_core(*, A, b, A_file, B_file, eps, max_iter, dominance_tol, x0, block_rows, other_options):
+    if A is not None:
+        raise ValueError("В режиме out_of_core матрица A читается только из файла A_file.")
+    if not A_file.endswith(BINARY_EXTENSIONS):
+        raise ValueError(f"Режим out_of_core требует двоичный файл A ({', '.join(BINARY_EXTENSIONS)}).")
+    if other_options:
+        raise ValueError("Режим out_of_core поддерживается только обычным методом релаксации.")
+    if b is None:
+        b = load_vector(B_file)
+
+    diag = validate_out_of_core(A_file, dominance_tol=dominance_tol, block_rows=block_rows)
+    n = len(diag)
+    if len(b) != n:
+        raise ValueError(f"Размерность b ({len(b)}) не совпадает с размерностью A ({n}x{n}).")
+    if x0 is not None and len(x0) != n:
+        raise ValueError(f"Размерность x0 ({len(x0)}) не совпадает с размерностью A ({n}x{n}).")
+    return out_of_core_relaxation_method(
+        A_file, b, eps=eps, max_iter=max_iter, x0=x0, block_rows=block_rows
     )
-    return relaxation_method(A, b, eps=eps, max_iter=max_iter)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Решение СЛАУ методом релаксации (A.txt, B.txt)")
+    parser.add_argument("--cache-dir", help="каталог кэша подготовленных матриц (по умолчанию кэш не используется)")
+    args = parser.parse_args()
     try:
         solution, iterations = solve_relaxation(
             A_file="A.txt",
             B_file="B.txt",
             eps=1e-9,
+            cache_dir=args.cache_dir,
         )
         for i, val in enumerate(solution, start=1):
             print(f"x{i} = {val:.4g}")
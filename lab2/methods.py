@@ -0,0 +1,167 @@
+"""
+Итерационные методы решения СЛАУ, альтернативные методу релаксации.
+
+Все методы принимают плотную матрицу или CSR, возвращают (x, iter_count)
+и останавливаются по тому же критерию, что и relaxation_method:
+  max_i |(b - Ax)_i / a_ii| < eps.
+
+Стоимость одной итерации в единицах "итераций релаксации" (одна итерация
+релаксации — выбор индекса s и обновление столбца P, O(n) для плотной A):
+  relaxation          — 1;
+  block_relaxation    — k обновлений за один просмотр невязки
+                        (k = block_size или число компонент с
+                        |R_i| >= max|R| / 2);
+  jacobi              — n (полный проход по всем строкам A);
+  gauss_seidel, sor,
+  colored_gauss_seidel — n;
+  cg                  — около n + 5 (умножение на A и несколько
+                        скалярных произведений длины n);
+  kaczmarz            — 1 (одна строка A, O(n) для плотной);
+  coordinate_descent  — 1 (один столбец A, O(m));
+  amg                 — несколько n на V-цикл (сглаживающие проходы и
+                        две невязки на каждом уровне, уровни убывают
+                        геометрически).
+Для сравнения методов число итераций jacobi/gauss_seidel/sor/cg/amg нужно
+умножать на n.
+"""
+
+from __future__ import annotations
+
+import math
+from operator import mul
+
+from .sparse import CSRMatrix, matrix_diagonal
+
+
+def row_dot(A, i: int, x: list[float]) -> float:
+    if isinstance(A, CSRMatrix):
+        acc = 0.0
+        for k in range(A.indptr[i], A.indptr[i + 1]):
+            acc += A.data[k] * x[A.indices[k]]
+        return acc
+    return sum(map(mul, A[i], x))
+
+
+def matvec(A, x: list[float]) -> list[float]:
+    if isinstance(A, CSRMatrix):
+        return A.matvec(x)
+    return [sum(map(mul, row, x)) for row in A]
+
+
+def is_symmetric(A, tol: float = 1e-12) -> bool:
+    if isinstance(A, CSRMatrix):
+        for i in range(A.n):
+            for j, v in A.row(i):
+                if abs(v - A.get(j, i)) > tol:
+                    return False
+        return True
+    n = len(A)
+    for i in range(n):
+        for j in range(i + 1, n):
+            if abs(A[i][j] - A[j][i]) > tol:
+                return False
+    return True
+
+
+def _max_iter_reached() -> None:
+    print("Достигнуто максимальное количество итераций.")
+
+
+def jacobi_method(A, b, eps=1e-6, max_iter=10000, x0=None):
+    n = len(b)
+    diag = matrix_diagonal(A)
+    x = [0.0] * n if x0 is None else [float(v) for v in x0]
+
+    iter_count = 0
+    while True:
+        # Масштабированная невязка при текущем x
+        R = [(b[i] - row_dot(A, i, x)) / diag[i] for i in range(n)]
+        if max(map(abs, R), default=0.0) < eps:
+            break
+        if iter_count >= max_iter:
+            _max_iter_reached()
+            break
+        # Все компоненты обновляются по значениям предыдущего прохода
+        x = [x[i] + R[i] for i in range(n)]
+        iter_count += 1
+
+    return x, iter_count
+
+
+def sor_method(A, b, eps=1e-6, max_iter=10000, omega=1.0, x0=None):
+    """
+    Метод последовательной верхней релаксации (SOR).
+    При omega = 1 совпадает с методом Гаусса–Зейделя.
+    Невязка каждой компоненты вычисляется непосредственно перед её
+    обновлением, критерий проверяется по максимуму за проход.
+    """
+    if not 0.0 < omega < 2.0:
+        raise ValueError("Параметр релаксации omega должен лежать в интервале (0, 2).")
+    n = len(b)
+    diag = matrix_diagonal(A)
+    x = [0.0] * n if x0 is None else [float(v) for v in x0]
+
+    iter_count = 0
+    while True:
+        max_r = 0.0
+        if iter_count >= max_iter:
+            _max_iter_reached()
+            break
+        for i in range(n):
+            r = (b[i] - row_dot(A, i, x)) / diag[i]
+            if abs(r) > max_r:
+                max_r = abs(r)
+            x[i] += omega * r
+        if max_r < eps:
+            break
+        iter_count += 1
+
+    return x, iter_count
+
+
+def gauss_seidel_method(A, b, eps=1e-6, max_iter=10000, x0=None):
+    return sor_method(A, b, eps=eps, max_iter=max_iter, omega=1.0, x0=x0)
+
+
+def conjugate_gradient_method(A, b, eps=1e-6, max_iter=10000, x0=None):
+    """
+    Метод сопряжённых градиентов. Требует симметричной положительно
+    определённой A: симметрия проверяется явно, а положительная
+    определённость следует из диагонального преобладания при a_ii > 0.
+    """
+    diag = matrix_diagonal(A)
+    if any(d <= 0 for d in diag) or not is_symmetric(A):
+        raise ValueError(
+            "Метод сопряжённых градиентов требует симметричной положительно определённой матрицы A."
+        )
+    n = len(b)
+    x = [0.0] * n if x0 is None else [float(v) for v in x0]
+    if x0 is None:
+        r = [float(v) for v in b]
+    else:
+        r = [b[i] - v for i, v in enumerate(matvec(A, x))]
+    p = r[:]
+    rr = sum(v * v for v in r)
+
+    iter_count = 0
+    while True:
+        if max((abs(r[i] / diag[i]) for i in range(n)), default=0.0) < eps:
+            break
+        if iter_count >= max_iter:
+            _max_iter_reached()
+            break
+        Ap = matvec(A, p)
+        pAp = sum(map(mul, p, Ap))
+        if pAp == 0.0 or not math.isfinite(pAp):
+            break
+        alpha = rr / pAp
+        for i in range(n):
+            x[i] += alpha * p[i]
+            r[i] -= alpha * Ap[i]
+        rr_new = sum(v * v for v in r)
+        beta = rr_new / rr
+        rr = rr_new
+        p = [r[i] + beta * p[i] for i in range(n)]
+        iter_count += 1
+
+    return x, iter_count
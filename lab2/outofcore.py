@@ -0,0 +1,160 @@
+"""
+Релаксация для плотных матриц, не помещающихся в память.
+
+A читается из двоичного файла (.npy или сырые float64, см. lab2/binary.py)
+блоками по block_rows строк в один переиспользуемый буфер. В памяти
+находятся только x, b, диагональ и текущий блок, поэтому объём A
+ограничен диском, а не ОЗУ.
+
+Выбор компоненты с наибольшей невязкой требует обновлять столбец P на
+каждом шаге, то есть читать всю A ради одной компоненты. Вместо этого
+выполняются циклические проходы релаксации: за один последовательный
+проход по файлу каждая компонента сводит свою невязку к нулю
+(x_i += (b_i - a_i·x) / a_ii, как в Гауссе–Зейделе). Проход читает файл
+ровно один раз подряд, и скорость определяется пропускной способностью
+диска. Критерий остановки тот же, что у остальных методов:
+max_i |(b - Ax)_i / a_ii| < eps, проверяется по максимуму за проход.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from array import array
+from operator import mul
+from typing import Iterator, Optional, Sequence
+
+from .binary import npy_header
+
+# Размер буфера блока по умолчанию
+BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def matrix_file_shape(filename: str) -> tuple[int, int, bool]:
+    """
+    Размер n квадратной матрицы в файле, смещение данных в байтах и
+    признак чужого порядка байт. Сами данные не читаются.
+    """
+    if filename.endswith(".npy"):
+        shape, offset, swap = npy_header(filename)
+        if len(shape) != 2:
+            raise ValueError(f"Ожидалась двумерная матрица, форма в файле {shape}.")
+        if shape[0] != shape[1] or shape[0] == 0:
+            raise ValueError("Матрица A не является квадратной")
+        n = shape[0]
+    else:
+        offset, swap = 0, False
+        size = os.path.getsize(filename)
+        if size % 8 != 0:
+            raise ValueError("Размер двоичных данных не кратен 8 байтам (float64).")
+        n = math.isqrt(size // 8)
+        if n == 0 or n * n != size // 8:
+            raise ValueError("Матрица A не является квадратной")
+
+    if os.path.getsize(filename) < offset + 8 * n * n:
+        raise ValueError(f"Размер данных в {filename} не совпадает с формой ({n}, {n}).")
+    return n, offset, swap
+
+
+def default_block_rows(n: int) -> int:
+    return max(1, min(n, BLOCK_BYTES // (8 * n)))
+
+
+def row_blocks(
+    filename: str,
+    block_rows: Optional[int] = None,
+) -> Iterator[tuple[int, list[Sequence[float]]]]:
+    """
+    Последовательное чтение A блоками строк: (номер первой строки, строки).
+    Строки — срезы memoryview одного буфера, который перезаписывается
+    следующим блоком, поэтому хранить их между шагами нельзя.
+    """
+    n, offset, swap = matrix_file_shape(filename)
+    if block_rows is None:
+        block_rows = default_block_rows(n)
+    if block_rows < 1:
+        raise ValueError("Число строк в блоке должно быть не меньше 1.")
+    block_rows = min(block_rows, n)
+
+    buf = array("d", bytes(8 * block_rows * n))
+    raw = memoryview(buf).cast("B")
+    values = memoryview(buf)
+    with open(filename, "rb", buffering=0) as f:
+        f.seek(offset)
+        for start in range(0, n, block_rows):
+            rows = min(block_rows, n - start)
+            size = 8 * rows * n
+            view = raw[:size]
+            got = 0
+            while got < size:
+                k = f.readinto(view[got:])
+                if not k:
+                    raise ValueError(f"Файл {filename} обрезан: не хватает данных матрицы.")
+                got += k
+            if swap:
+                buf.byteswap()
+            yield start, [values[k * n : (k + 1) * n] for k in range(rows)]
+
+
+def validate_out_of_core(
+    filename: str,
+    *,
+    dominance_tol: float = 0.0,
+    block_rows: Optional[int] = None,
+) -> list[float]:
+    """
+    Проверки validate_matrix одним проходом по файлу: квадратность,
+    ненулевая диагональ, диагональное преобладание. Невырожденность
+    через LU для такой матрицы недоступна, поэтому требуется строгое
+    преобладание (dominance_tol >= 0). Возвращает диагональ A.
+    """
+    if dominance_tol < 0:
+        raise ValueError("Для матрицы вне памяти требуется строгое диагональное преобладание (dominance_tol >= 0).")
+    diag: list[float] = []
+    for start, rows in row_blocks(filename, block_rows):
+        for k, row in enumerate(rows):
+            i = start + k
+            d = row[i]
+            if d == 0:
+                raise ValueError(f"Диагональный элемент A[{i}][{i}] равен 0.")
+            others = sum(map(abs, row)) - abs(d)
+            if not (abs(d) > others + dominance_tol):
+                raise ValueError("Матрица A не удовлетворяет условию диагонального преобладания")
+            diag.append(d)
+    return diag
+
+
+def out_of_core_relaxation_method(
+    filename: str,
+    b: Sequence[float],
+    eps: float = 1e-6,
+    max_iter: int = 10000,
+    x0: Optional[list[float]] = None,
+    block_rows: Optional[int] = None,
+) -> tuple[list[float], int]:
+    """
+    Проходы релаксации по матрице из файла filename.
+    Возвращает (x, iter_count), где iter_count — число проходов
+    (каждый проход — n обновлений компонент, как у gauss_seidel).
+    """
+    n = len(b)
+    x = [0.0] * n if x0 is None else [float(v) for v in x0]
+
+    iter_count = 0
+    while True:
+        if iter_count >= max_iter:
+            print("Достигнуто максимальное количество итераций.")
+            break
+        max_r = 0.0
+        for start, rows in row_blocks(filename, block_rows):
+            for k, row in enumerate(rows):
+                i = start + k
+                r = (b[i] - sum(map(mul, row, x))) / row[i]
+                if abs(r) > max_r:
+                    max_r = abs(r)
+                x[i] += r
+        if max_r < eps:
+            break
+        iter_count += 1
+
+    return x, iter_count
@@ -0,0 +1,268 @@
+"""
+Компактное хранение ленточных и симметричных матриц.
+
+BandMatrix — лента с lower поддиагоналями и upper наддиагоналями:
+строка i хранит элементы столбцов i-lower..i+upper подряд в array("d")
+(n * (lower + upper + 1) чисел вместо n^2).
+SymmetricPackedMatrix — верхний треугольник по строкам: строка i хранит
+a_ii..a_i,n-1, всего n(n+1)/2 чисел; нижняя половина берётся из верхней.
+
+Обе формы предоставляют тот же интерфейс строк, что и CSRMatrix
+(n, row, get, diagonal, matvec), поэтому проверки из main работают с
+ними без изменений. Структура определяется при чтении текстового файла
+(read_packed_matrix) за один проход по строкам, без плотной копии A.
+
+Для трёхдиагональной матрицы релаксация не нужна: метод прогонки
+(алгоритм Томаса) решает систему за O(n) и при диагональном
+преобладании устойчив без выбора ведущего элемента.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Iterator, Union
+
+from .sparse import CSRMatrix, csr_from_coo
+
+
+@dataclass
+class BandMatrix:
+    n: int
+    lower: int
+    upper: int
+    data: array
+
+    @property
+    def width(self) -> int:
+        return self.lower + self.upper + 1
+
+    def get(self, i: int, j: int) -> float:
+        if -self.lower <= j - i <= self.upper:
+            return self.data[i * self.width + j - i + self.lower]
+        return 0.0
+
+    def row(self, i: int) -> Iterator[tuple[int, float]]:
+        base = i * self.width - i + self.lower
+        for j in range(max(0, i - self.lower), min(self.n, i + self.upper + 1)):
+            v = self.data[base + j]
+            if v != 0.0:
+                yield j, v
+
+    def diagonal(self) -> list[float]:
+        w = self.width
+        return [self.data[i * w + self.lower] for i in range(self.n)]
+
+    def matvec(self, x: list[float]) -> list[float]:
+        return [sum(v * x[j] for j, v in self.row(i)) for i in range(self.n)]
+
+    def to_csr(self) -> CSRMatrix:
+        return _to_csr(self)
+
+    def to_dense(self) -> list[list[float]]:
+        return [[self.get(i, j) for j in range(self.n)] for i in range(self.n)]
+
+
+@dataclass
+class SymmetricPackedMatrix:
+    n: int
+    data: array
+
+    def _offset(self, i: int) -> int:
+        # Начало строки i верхнего треугольника (элемент a_ii)
+        return i * self.n - i * (i - 1) // 2
+
+    def get(self, i: int, j: int) -> float:
+        if j < i:
+            i, j = j, i
+        return self.data[self._offset(i) + j - i]
+
+    def row(self, i: int) -> Iterator[tuple[int, float]]:
+        for j in range(i):
+            v = self.data[self._offset(j) + i - j]
+            if v != 0.0:
+                yield j, v
+        base = self._offset(i) - i
+        for j in range(i, self.n):
+            v = self.data[base + j]
+            if v != 0.0:
+                yield j, v
+
+    def diagonal(self) -> list[float]:
+        return [self.data[self._offset(i)] for i in range(self.n)]
+
+    def matvec(self, x: list[float]) -> list[float]:
+        # Каждый внедиагональный элемент верхнего треугольника работает дважды
+        y = [0.0] * self.n
+        for i in range(self.n):
+            base = self._offset(i) - i
+            acc = self.data[base + i] * x[i]
+            xi = x[i]
+            for j in range(i + 1, self.n):
+                v = self.data[base + j]
+                if v != 0.0:
+                    acc += v * x[j]
+                    y[j] += v * xi
+            y[i] += acc
+        return y
+
+    def to_csr(self) -> CSRMatrix:
+        return _to_csr(self)
+
+    def to_dense(self) -> list[list[float]]:
+        return [[self.get(i, j) for j in range(self.n)] for i in range(self.n)]
+
+
+PackedMatrix = Union[BandMatrix, SymmetricPackedMatrix]
+PACKED_TYPES = (BandMatrix, SymmetricPackedMatrix)
+
+
+def _to_csr(A: PackedMatrix) -> CSRMatrix:
+    rows: list[int] = []
+    cols: list[int] = []
+    vals: list[float] = []
+    for i in range(A.n):
+        for j, v in A.row(i):
+            rows.append(i)
+            cols.append(j)
+            vals.append(v)
+    return csr_from_coo(A.n, rows, cols, vals)
+
+
+def read_packed_matrix(filename: str):
+    """
+    Чтение текстовой матрицы с определением структуры. Каждая строка
+    сразу сокращается до отрезка от первого до последнего ненулевого
+    элемента; симметрия проверяется по уже прочитанным строкам.
+    Результат: BandMatrix, если лента не шире n / 2 (трёхдиагональная —
+    при n >= 6, меньшие системы экономии не дают), иначе
+    SymmetricPackedMatrix для симметричной A, иначе обычный список строк.
+    Неквадратная матрица возвращается списком строк исходной длины, чтобы
+    проверка выдала обычную ошибку.
+    """
+    starts: list[int] = []
+    segments: list[array] = []
+    lengths: list[int] = []
+    lower = upper = 0
+    symmetric = True
+
+    with open(filename, "r") as f:
+        for line in f:
+            row = list(map(float, line.split()))
+            if not row:
+                continue
+            i = len(starts)
+            nonzero = [j for j, v in enumerate(row) if v != 0.0]
+            lo = nonzero[0] if nonzero else i
+            hi = nonzero[-1] if nonzero else i - 1
+            if nonzero:
+                lower = max(lower, i - lo)
+                upper = max(upper, hi - i)
+            if symmetric:
+                for j in range(i):
+                    seg_start = starts[j]
+                    k = i - seg_start
+                    above = segments[j][k] if 0 <= k < len(segments[j]) else 0.0
+                    left = row[j] if j < len(row) else 0.0
+                    if above != left:
+                        symmetric = False
+                        break
+            starts.append(lo)
+            segments.append(array("d", row[lo : hi + 1]))
+            lengths.append(len(row))
+
+    n = len(starts)
+
+    def value(i: int, j: int) -> float:
+        k = j - starts[i]
+        return segments[i][k] if 0 <= k < len(segments[i]) else 0.0
+
+    if n == 0 or any(length != n for length in lengths):
+        return [[value(i, j) for j in range(lengths[i])] for i in range(n)]
+
+    if lower + upper + 1 <= n // 2:
+        w = lower + upper + 1
+        data = array("d", bytes(8 * n * w))
+        for i in range(n):
+            for j in range(max(0, i - lower), min(n, i + upper + 1)):
+                data[i * w + j - i + lower] = value(i, j)
+        return BandMatrix(n, lower, upper, data)
+
+    if symmetric:
+        data = array("d")
+        for i in range(n):
+            data.extend(value(i, j) for j in range(i, n))
+        return SymmetricPackedMatrix(n, data)
+
+    return [[value(i, j) for j in range(n)] for i in range(n)]
+
+
+def is_tridiagonal(A) -> bool:
+    return isinstance(A, BandMatrix) and A.lower <= 1 and A.upper <= 1
+
+
+def thomas_solve(A: BandMatrix, b: list[float]) -> list[float]:
+    """Метод прогонки для трёхдиагональной A, O(n) операций и памяти."""
+    if not is_tridiagonal(A):
+        raise ValueError("Метод прогонки применим только к трёхдиагональной матрице.")
+    n = A.n
+    cp = [0.0] * n
+    dp = [0.0] * n
+    for i in range(n):
+        a = A.get(i, i - 1) if i > 0 else 0.0
+        denom = A.get(i, i) - (a * cp[i - 1] if i > 0 else 0.0)
+        if denom == 0.0:
+            raise ValueError("Матрица A является вырожденной")
+        cp[i] = (A.get(i, i + 1) if i + 1 < n else 0.0) / denom
+        dp[i] = (b[i] - (a * dp[i - 1] if i > 0 else 0.0)) / denom
+    x = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        x[i] = dp[i] - (cp[i] * x[i + 1] if i + 1 < n else 0.0)
+    return x
+
+
+def packed_relaxation_method(A: PackedMatrix, b, eps=1e-6, max_iter=10000, x0=None):
+    """
+    Метод релаксации прямо на компактной A. Столбец P[:, s] не хранится:
+    P_is = -a_is / a_ii берётся из ленты (строки s-upper..s+lower) или,
+    для симметричной A, из строки s (a_is = a_si).
+    """
+    n = A.n
+    diag = A.diagonal()
+    if x0 is None:
+        x = [0.0] * n
+        R = [b[i] / diag[i] for i in range(n)]
+    else:
+        x = [float(v) for v in x0]
+        Ax = A.matvec(x)
+        R = [(b[i] - Ax[i]) / diag[i] for i in range(n)]
+    band = isinstance(A, BandMatrix)
+
+    iter_count = 0
+    while iter_count < max_iter:
+        max_r = abs(R[0])
+        s = 0
+        for i in range(1, n):
+            if abs(R[i]) > max_r:
+                max_r = abs(R[i])
+                s = i
+        if max_r < eps:
+            break
+
+        delta = R[s]
+        x[s] += delta
+        if band:
+            w = A.width
+            for i in range(max(0, s - A.upper), min(n, s + A.lower + 1)):
+                if i != s:
+                    R[i] -= A.data[i * w + s - i + A.lower] * delta / diag[i]
+        else:
+            for i, v in A.row(s):
+                if i != s:
+                    R[i] -= v * delta / diag[i]
+        R[s] = 0.0
+        iter_count += 1
+
+    if iter_count >= max_iter:
+        print("Достигнуто максимальное количество итераций.")
+    return x, iter_count
@@ -0,0 +1,345 @@
+"""
+Параллельный блочный метод Якоби на нескольких процессах.
+
+Неизвестные делятся на непрерывные блоки строк, по одному на процесс.
+A, b, диагональ, два буфера x (текущий и следующий проход) и максимумы
+невязок по блокам лежат в multiprocessing.shared_memory, поэтому матрица
+не копируется в процессы-исполнители. Процессы синхронизируются барьером
+только на границах проходов; после каждого прохода главный процесс
+вычисляет глобальный максимум невязки и решает, продолжать ли итерации.
+
+Параллельный Гаусс–Зейдель по раскраске: неизвестные одного цвета
+(greedy_coloring) не связаны между собой, поэтому их можно обновлять
+одновременно прямо в общем x. Проход — последовательность цветов,
+внутри цвета индексы делятся между процессами, между цветами стоит
+барьер. Результат совпадает с последовательным Гауссом–Зейделем в
+порядке цветов и не зависит от числа процессов.
+
+Если исполнитель погибает (нехватка памяти, kill), сторожевой поток
+главного процесса ломает барьер, и решение завершается RuntimeError
+вместо вечного ожидания.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import threading
+from array import array
+from multiprocessing import shared_memory
+from operator import mul
+from typing import Optional
+
+from .sparse import CSRMatrix, greedy_coloring, matrix_diagonal
+
+_RUN = 0
+_STOP = 1
+
+
+def _create_shared(values: array) -> shared_memory.SharedMemory:
+    shm = shared_memory.SharedMemory(create=True, size=max(len(values) * values.itemsize, 1))
+    shm.buf[: len(values) * values.itemsize] = values.tobytes()
+    return shm
+
+
+def _relax_block(
+    segments: dict[str, shared_memory.SharedMemory],
+    n: int,
+    sparse: bool,
+    lo: int,
+    hi: int,
+    slot: int,
+    barrier,
+) -> None:
+    b = segments["b"].buf.cast("d")
+    diag = segments["diag"].buf.cast("d")
+    xs = segments["x"].buf.cast("d")
+    block_max = segments["max"].buf.cast("d")
+    control = segments["control"].buf.cast("q")
+    if sparse:
+        indptr = segments["indptr"].buf.cast("q")
+        indices = segments["indices"].buf.cast("q")
+        data = segments["data"].buf.cast("d")
+    else:
+        dense = segments["A"].buf.cast("d")
+
+    parity = 0
+    while True:
+        barrier.wait()  # начало прохода
+        if control[0] == _STOP:
+            break
+        cur = xs[parity * n : (parity + 1) * n]
+        nxt = xs[(1 - parity) * n : (2 - parity) * n]
+        max_r = 0.0
+        for i in range(lo, hi):
+            if sparse:
+                acc = 0.0
+                for k in range(indptr[i], indptr[i + 1]):
+                    acc += data[k] * cur[indices[k]]
+            else:
+                acc = sum(map(mul, dense[i * n : (i + 1) * n], cur))
+            r = (b[i] - acc) / diag[i]
+            if abs(r) > max_r:
+                max_r = abs(r)
+            nxt[i] = cur[i] + r
+        block_max[slot] = max_r
+        barrier.wait()  # конец прохода
+        parity = 1 - parity
+
+
+def _relax_colors(
+    segments: dict[str, shared_memory.SharedMemory],
+    n: int,
+    sparse: bool,
+    color_bounds: list[int],
+    slot: int,
+    workers: int,
+    barrier,
+) -> None:
+    b = segments["b"].buf.cast("d")
+    diag = segments["diag"].buf.cast("d")
+    x = segments["x"].buf.cast("d")
+    order = segments["order"].buf.cast("q")
+    block_max = segments["max"].buf.cast("d")
+    control = segments["control"].buf.cast("q")
+    if sparse:
+        indptr = segments["indptr"].buf.cast("q")
+        indices = segments["indices"].buf.cast("q")
+        data = segments["data"].buf.cast("d")
+    else:
+        dense = segments["A"].buf.cast("d")
+
+    # Доля процесса в каждом цвете: непрерывный отрезок order
+    shares = []
+    for c in range(len(color_bounds) - 1):
+        lo, hi = color_bounds[c], color_bounds[c + 1]
+        size = hi - lo
+        shares.append((lo + size * slot // workers, lo + size * (slot + 1) // workers))
+
+    while True:
+        barrier.wait()  # начало прохода
+        if control[0] == _STOP:
+            break
+        max_r = 0.0
+        for c, (lo, hi) in enumerate(shares):
+            for k in range(lo, hi):
+                i = order[k]
+                if sparse:
+                    acc = 0.0
+                    for p in range(indptr[i], indptr[i + 1]):
+                        acc += data[p] * x[indices[p]]
+                else:
+                    acc = sum(map(mul, dense[i * n : (i + 1) * n], x))
+                r = (b[i] - acc) / diag[i]
+                if abs(r) > max_r:
+                    max_r = abs(r)
+                x[i] += r
+            if c == len(shares) - 1:
+                block_max[slot] = max_r
+            barrier.wait()  # конец цвета
+
+
+def _worker(names: dict[str, str], *args, kernel=_relax_block) -> None:
+    segments = {key: shared_memory.SharedMemory(name=name) for key, name in names.items()}
+    try:
+        kernel(segments, *args)
+    except threading.BrokenBarrierError:
+        pass  # главный процесс прервал решение, ошибку сообщит он
+    finally:
+        for shm in segments.values():
+            shm.close()
+
+
+def _watch(procs: list[mp.Process], barrier, stopping: threading.Event) -> None:
+    # Исполнители завершаются сами только после команды _STOP; выход до
+    # неё — аварийный, и ждать оставшихся на барьере бессмысленно
+    while not stopping.wait(0.1):
+        if any(proc.exitcode is not None for proc in procs):
+            barrier.abort()
+            return
+
+
+def _coordinate(
+    shared: dict[str, shared_memory.SharedMemory],
+    n: int,
+    barrier,
+    procs: list[mp.Process],
+    eps: float,
+    max_iter: int,
+    phases: int = 1,
+    double_buffered: bool = True,
+) -> tuple[list[float], int]:
+    block_max = shared["max"].buf.cast("d")
+    control = shared["control"].buf.cast("q")
+    xs = shared["x"].buf.cast("d")
+
+    stopping = threading.Event()
+    threading.Thread(target=_watch, args=(procs, barrier, stopping), daemon=True).start()
+    parity = 0
+    iter_count = 0
+    try:
+        while True:
+            barrier.wait()
+            for _ in range(phases):
+                barrier.wait()
+            # Глобальная редукция: максимум невязки по всем блокам
+            if max(block_max) < eps:
+                break
+            if iter_count >= max_iter:
+                print("Достигнуто максимальное количество итераций.")
+                break
+            if double_buffered:
+                parity = 1 - parity
+            iter_count += 1
+
+        stopping.set()
+        control[0] = _STOP
+        barrier.wait()
+        return list(xs[parity * n : (parity + 1) * n]), iter_count
+    except threading.BrokenBarrierError:
+        codes = [proc.exitcode for proc in procs if proc.exitcode is not None]
+        raise RuntimeError(
+            f"Процесс-исполнитель аварийно завершился (код {codes[0] if codes else '?'})."
+        ) from None
+    finally:
+        stopping.set()
+        # Представления общей памяти освобождаются явно: кадр, удержанный
+        # traceback исключения, иначе не даст закрыть сегменты
+        block_max.release()
+        control.release()
+        xs.release()
+
+
+def _share_system(shared: dict[str, shared_memory.SharedMemory], A, b) -> None:
+    """A, b и диагональ в общей памяти (в shared под фиксированными ключами)."""
+    if isinstance(A, CSRMatrix):
+        shared["indptr"] = _create_shared(array("q", A.indptr))
+        shared["indices"] = _create_shared(array("q", A.indices))
+        shared["data"] = _create_shared(array("d", A.data))
+    else:
+        dense = array("d")
+        for row in A:
+            dense.extend(row)
+        shared["A"] = _create_shared(dense)
+        del dense
+    shared["b"] = _create_shared(array("d", b))
+    shared["diag"] = _create_shared(array("d", matrix_diagonal(A)))
+
+
+def parallel_jacobi_method(
+    A,
+    b,
+    eps=1e-6,
+    max_iter=10000,
+    workers: Optional[int] = None,
+    x0: Optional[list[float]] = None,
+):
+    """
+    Блочный метод Якоби на workers процессах (по умолчанию — число ядер).
+    Критерий остановки и счёт итераций совпадают с jacobi_method.
+    """
+    n = len(b)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, n))
+    sparse = isinstance(A, CSRMatrix)
+
+    shared: dict[str, shared_memory.SharedMemory] = {}
+    procs: list[mp.Process] = []
+    try:
+        _share_system(shared, A, b)
+        xs = array("d", bytes(16 * n))
+        if x0 is not None:
+            xs[:n] = array("d", x0)
+        shared["x"] = _create_shared(xs)
+        shared["max"] = _create_shared(array("d", [0.0] * workers))
+        shared["control"] = _create_shared(array("q", [_RUN]))
+        names = {key: shm.name for key, shm in shared.items()}
+
+        barrier = mp.Barrier(workers + 1)
+        bounds = [n * w // workers for w in range(workers + 1)]
+        for w in range(workers):
+            proc = mp.Process(
+                target=_worker,
+                args=(names, n, sparse, bounds[w], bounds[w + 1], w, barrier),
+                daemon=True,
+            )
+            proc.start()
+            procs.append(proc)
+
+        x, iter_count = _coordinate(shared, n, barrier, procs, eps, max_iter)
+        for proc in procs:
+            proc.join()
+        return x, iter_count
+    finally:
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+        for shm in shared.values():
+            shm.close()
+            shm.unlink()
+
+
+def colored_gauss_seidel_method(
+    A,
+    b,
+    eps=1e-6,
+    max_iter=10000,
+    workers: Optional[int] = None,
+    x0: Optional[list[float]] = None,
+):
+    """
+    Гаусс–Зейдель по цветам жадной раскраски на workers процессах.
+    Раскраска вычисляется один раз; критерий остановки и счёт итераций
+    совпадают с gauss_seidel_method. Для плотной A все неизвестные
+    связаны, цветов n и параллелизма нет — метод рассчитан на CSR.
+    """
+    n = len(b)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, n))
+    sparse = isinstance(A, CSRMatrix)
+
+    colors = greedy_coloring(A)
+    n_colors = max(colors, default=-1) + 1
+    order = sorted(range(n), key=lambda i: colors[i])
+    color_bounds = [0] * (n_colors + 1)
+    for c in colors:
+        color_bounds[c + 1] += 1
+    for c in range(n_colors):
+        color_bounds[c + 1] += color_bounds[c]
+
+    shared: dict[str, shared_memory.SharedMemory] = {}
+    procs: list[mp.Process] = []
+    try:
+        _share_system(shared, A, b)
+        shared["order"] = _create_shared(array("q", order))
+        shared["x"] = _create_shared(array("d", [0.0] * n if x0 is None else x0))
+        shared["max"] = _create_shared(array("d", [0.0] * workers))
+        shared["control"] = _create_shared(array("q", [_RUN]))
+        names = {key: shm.name for key, shm in shared.items()}
+
+        barrier = mp.Barrier(workers + 1)
+        for w in range(workers):
+            proc = mp.Process(
+                target=_worker,
+                args=(names, n, sparse, color_bounds, w, workers, barrier),
+                kwargs={"kernel": _relax_colors},
+                daemon=True,
+            )
+            proc.start()
+            procs.append(proc)
+
+        x, iter_count = _coordinate(
+            shared, n, barrier, procs, eps, max_iter, phases=n_colors, double_buffered=False
+        )
+        for proc in procs:
+            proc.join()
+        return x, iter_count
+    finally:
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+        for shm in shared.values():
+            shm.close()
+            shm.unlink()
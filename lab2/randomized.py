@@ -0,0 +1,153 @@
+"""
+Рандомизированные методы для систем без диагонального преобладания.
+
+Рандомизированный Качмаж (Strohmer–Vershynin): на шаге выбирается строка
+i с вероятностью ||a_i||^2 / ||A||_F^2, и x проецируется на гиперплоскость
+a_i·x = b_i:
+  x += (b_i - a_i·x) / ||a_i||^2 * a_i.
+Сходится для любой совместной системы (в том числе прямоугольной m×n,
+m >= n) со скоростью, зависящей от обусловленности A, а не от
+преобладания. Шаг стоит O(nnz строки).
+
+Рандомизированный покоординатный спуск для min ||Ax - b||^2: столбец j
+выбирается с вероятностью ||a_j||^2 / ||A||_F^2, x_j сдвигается на
+точный минимум по этой координате, невязка r = b - Ax поддерживается
+обновлением вдоль столбца. Шаг стоит O(nnz столбца); для несовместной
+системы метод сходится к решению наименьших квадратов.
+
+Критерии остановки проверяются раз в m (n) шагов, чтобы полный проход
+по A не доминировал над стоимостью шагов:
+  kaczmarz            — max_i |(b - Ax)_i| / ||a_i|| < eps
+                        (расстояние до самой далёкой гиперплоскости);
+  coordinate_descent  — max_j |a_j·r| / ||a_j||^2 < eps
+                        (наибольший возможный шаг по координате).
+iter_count — число шагов (одна строка или один столбец на шаг).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from itertools import accumulate
+from operator import mul
+
+from .methods import _max_iter_reached, matvec
+from .sparse import CSRMatrix
+
+
+def matrix_shape(A) -> tuple[int, int]:
+    if isinstance(A, CSRMatrix):
+        return A.n, A.n
+    return len(A), len(A[0]) if A else 0
+
+
+def validate_general(A, b) -> None:
+    """
+    Проверки для методов без требования преобладания: непустая
+    прямоугольная A без нулевых строк с ненулевой правой частью
+    (такая система заведомо несовместна) и согласованная размерность b.
+    """
+    m, n = matrix_shape(A)
+    if m == 0 or n == 0:
+        raise ValueError("Матрица A пуста.")
+    if not isinstance(A, CSRMatrix) and any(len(row) != n for row in A):
+        raise ValueError("Строки матрицы A имеют разную длину.")
+    if m < n:
+        raise ValueError(f"Система недоопределена: строк ({m}) меньше, чем неизвестных ({n}).")
+    if len(b) != m:
+        raise ValueError(f"Размерность b ({len(b)}) не совпадает с числом строк A ({m}).")
+
+
+def _row_norms(A) -> list[float]:
+    if isinstance(A, CSRMatrix):
+        return [sum(v * v for _, v in A.row(i)) for i in range(A.n)]
+    return [sum(v * v for v in row) for row in A]
+
+
+def _columns(A, n: int) -> list[list[tuple[int, float]]]:
+    """Ненулевые элементы по столбцам: columns[j] — пары (i, a_ij)."""
+    columns: list[list[tuple[int, float]]] = [[] for _ in range(n)]
+    if isinstance(A, CSRMatrix):
+        for i in range(A.n):
+            for j, v in A.row(i):
+                columns[j].append((i, v))
+        return columns
+    for i, row in enumerate(A):
+        for j, v in enumerate(row):
+            if v != 0.0:
+                columns[j].append((i, v))
+    return columns
+
+
+def kaczmarz_method(A, b, eps=1e-6, max_iter=10000, x0=None, seed=0):
+    m, n = matrix_shape(A)
+    x = [0.0] * n if x0 is None else [float(v) for v in x0]
+    norms = _row_norms(A)
+    if not any(norms):
+        return x, 0
+    cum = list(accumulate(norms))
+    rng = random.Random(seed)
+    sparse = isinstance(A, CSRMatrix)
+
+    iter_count = 0
+    while True:
+        r = [b[i] - v for i, v in enumerate(matvec(A, x))]
+        worst = max(
+            (abs(r[i]) / math.sqrt(norms[i]) if norms[i] else abs(r[i]) for i in range(m)),
+            default=0.0,
+        )
+        if worst < eps:
+            break
+        if iter_count >= max_iter:
+            _max_iter_reached()
+            break
+        batch = min(m, max_iter - iter_count)
+        for i in rng.choices(range(m), cum_weights=cum, k=batch):
+            if sparse:
+                lo, hi = A.indptr[i], A.indptr[i + 1]
+                cols = A.indices[lo:hi]
+                vals = A.data[lo:hi]
+                t = (b[i] - sum(v * x[j] for j, v in zip(cols, vals))) / norms[i]
+                for j, v in zip(cols, vals):
+                    x[j] += t * v
+            else:
+                row = A[i]
+                t = (b[i] - sum(map(mul, row, x))) / norms[i]
+                x[:] = [xj + t * v for xj, v in zip(x, row)]
+        iter_count += batch
+
+    return x, iter_count
+
+
+def coordinate_descent_method(A, b, eps=1e-6, max_iter=10000, x0=None, seed=0):
+    m, n = matrix_shape(A)
+    x = [0.0] * n if x0 is None else [float(v) for v in x0]
+    columns = _columns(A, n)
+    norms = [sum(v * v for _, v in col) for col in columns]
+    if not any(norms):
+        return x, 0
+    cum = list(accumulate(norms))
+    rng = random.Random(seed)
+    r = [b[i] - v for i, v in enumerate(matvec(A, x))]
+
+    iter_count = 0
+    while True:
+        worst = max(
+            (abs(sum(v * r[i] for i, v in col)) / norms[j] for j, col in enumerate(columns) if norms[j]),
+            default=0.0,
+        )
+        if worst < eps:
+            break
+        if iter_count >= max_iter:
+            _max_iter_reached()
+            break
+        batch = min(n, max_iter - iter_count)
+        for j in rng.choices(range(n), cum_weights=cum, k=batch):
+            col = columns[j]
+            delta = sum(v * r[i] for i, v in col) / norms[j]
+            x[j] += delta
+            for i, v in col:
+                r[i] -= delta * v
+        iter_count += batch
+
+    return x, iter_count
@@ -0,0 +1,467 @@
+"""
+Ядро метода релаксации: итерационная форма x = Px + c и итерации
+с выбором компоненты наибольшей невязки.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from array import array
+from dataclasses import dataclass
+from operator import mul
+from typing import Generator
+
+from .checkpoint import fingerprint, load_checkpoint, save_checkpoint
+from .methods import row_dot
+from .sparse import CSCMatrix, CSRMatrix, csr_from_coo, matrix_diagonal
+
+PRECISIONS = {"float32": "f", "float64": "d"}
+
+
+@dataclass
+class PackedColumns:
+    """
+    Плотная P, уложенная по столбцам в один непрерывный массив
+    (array "f" — float32, "d" — float64). Столбец s, который нужен
+    при обновлении невязки, лежит в памяти подряд. Диагональ хранится
+    нулём: собственная невязка R[s] обнуляется отдельно.
+    Элемент занимает 4 или 8 байт вместо ~32 байт у списка float.
+    """
+
+    n: int
+    data: array
+
+    def column(self, s: int) -> memoryview:
+        return memoryview(self.data)[s * self.n : (s + 1) * self.n]
+
+
+def build_iteration_matrix(A):
+    """
+    Матрица P итерационной формы x = Px + c.
+    Для плотной A — список строк, для CSR — столбцы P в CSC
+    (диагональ не хранится, метод обновляет R[s] отдельно).
+    """
+    if isinstance(A, CSRMatrix):
+        diag = A.diagonal()
+        rows: list[int] = []
+        cols: list[int] = []
+        vals: list[float] = []
+        for i in range(A.n):
+            for j, v in A.row(i):
+                if j != i:
+                    rows.append(i)
+                    cols.append(j)
+                    vals.append(-v / diag[i])
+        return csr_from_coo(A.n, rows, cols, vals).to_csc()
+
+    n = len(A)
+    P = [[0.0 for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            P[i][j] = -1.0 if i == j else -A[i][j] / A[i][i]
+    return P
+
+def build_packed_iteration_matrix(A, precision="float32"):
+    """
+    Компактная P: для плотной A — PackedColumns, для CSR — CSC, у которой
+    значения и индексы перенесены в массивы array.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Неизвестная точность хранения: {precision}. Допустимые: {', '.join(PRECISIONS)}.")
+    typecode = PRECISIONS[precision]
+    if isinstance(A, CSRMatrix):
+        P = build_iteration_matrix(A)
+        P.indptr = array("q", P.indptr)
+        P.indices = array("q", P.indices)
+        P.data = array(typecode, P.data)
+        return P
+
+    n = len(A)
+    data = array(typecode, bytes(array(typecode).itemsize * n * n))
+    for i in range(n):
+        row = A[i]
+        scale = -1.0 / row[i]
+        # Строка i матрицы P — это элементы i, n + i, 2n + i, ... массива
+        data[i::n] = array(typecode, [0.0 if j == i else row[j] * scale for j in range(n)])
+    return PackedColumns(n, data)
+
+def relaxation_method(
+    A,
+    b,
+    eps=1e-6,
+    max_iter=10000,
+    callback=None,
+    callback_every=1,
+    x0=None,
+    checkpoint=None,
+    checkpoint_every=None,
+    checkpoint_seconds=None,
+    resume_from=None,
+):
+    n = len(b)
+
+    # Подготовка P и c
+    P = build_iteration_matrix(A)
+    diag = matrix_diagonal(A)
+    c = [0.0 for _ in range(n)]
+    for i in range(n):
+        c[i] = b[i] / diag[i]
+
+    return relax(
+        P,
+        c,
+        eps=eps,
+        max_iter=max_iter,
+        callback=callback,
+        callback_every=callback_every,
+        x0=x0,
+        checkpoint=checkpoint,
+        checkpoint_every=checkpoint_every,
+        checkpoint_seconds=checkpoint_seconds,
+        resume_from=resume_from,
+    )
+
+def initial_residual(P, c, x0):
+    """
+    Невязка итерационной формы в точке x0: R = c + P·x0 - x0.
+    В плотной P диагональ равна -1 и уже даёт слагаемое -x0,
+    в CSC-форме диагональ не хранится и вычитается явно.
+    """
+    n = len(c)
+    if len(x0) != n:
+        raise ValueError(f"Размерность x0 ({len(x0)}) не совпадает с размерностью A ({n}x{n}).")
+    if isinstance(P, PackedColumns):
+        R = [c[i] - x0[i] for i in range(n)]
+        for j in range(n):
+            xj = x0[j]
+            if xj != 0.0:
+                R[:] = [r + p * xj for r, p in zip(R, P.column(j))]
+        return R
+    if isinstance(P, CSCMatrix):
+        R = [c[i] - x0[i] for i in range(n)]
+        for j in range(n):
+            xj = x0[j]
+            if xj != 0.0:
+                for k in range(P.indptr[j], P.indptr[j + 1]):
+                    R[P.indices[k]] += P.data[k] * xj
+        return R
+    return [c[i] + sum(map(mul, P[i], x0)) for i in range(n)]
+
+def relax(
+    P,
+    c,
+    eps=1e-6,
+    max_iter=10000,
+    callback=None,
+    callback_every=1,
+    x0=None,
+    checkpoint=None,
+    checkpoint_every=None,
+    checkpoint_seconds=None,
+    resume_from=None,
+):
+    """
+    Итерации метода релаксации для готовой итерационной формы x = Px + c.
+    Отделено от relaxation_method, чтобы P можно было построить один раз
+    и переиспользовать для разных правых частей.
+
+    callback(iter_count, max_r, s, R) вызывается каждые callback_every
+    итераций после выбора индекса s; если он вернул True, итерации
+    прекращаются досрочно (например, при застое сходимости).
+    x0 — начальное приближение (по умолчанию нулевое).
+
+    checkpoint — файл контрольной точки (см. lab2/checkpoint.py); состояние
+    записывается каждые checkpoint_every итераций и/или checkpoint_seconds
+    секунд, а также при выходе. resume_from — файл, с которого продолжить
+    счёт; iter_count и max_iter считаются от начала исходного решения.
+    """
+    n = len(c)
+    digest = fingerprint(c) if checkpoint or resume_from else b""
+
+    # Начальное приближение
+    start = 0
+    if resume_from is not None:
+        x, R, start, saved = load_checkpoint(resume_from)
+        if len(x) != n or saved != digest:
+            raise ValueError("Контрольная точка относится к другой системе.")
+    elif x0 is None:
+        x = [0.0 for _ in range(n)]
+        R = c[:]  # копия c
+    else:
+        x = [float(v) for v in x0]
+        R = initial_residual(P, c, x)
+
+    if checkpoint is None:
+        iter_count = start + relax_steps(
+            P,
+            x,
+            R,
+            eps=eps,
+            max_steps=max_iter - start,
+            callback=callback,
+            callback_every=callback_every,
+            start=start,
+        )
+    else:
+        # Счёт порциями, между которыми состояние сбрасывается на диск
+        chunk = checkpoint_every or 1000
+        iter_count = start
+        last_save = time.monotonic()
+        while iter_count < max_iter:
+            steps = min(chunk, max_iter - iter_count)
+            done = relax_steps(
+                P,
+                x,
+                R,
+                eps=eps,
+                max_steps=steps,
+                callback=callback,
+                callback_every=callback_every,
+                start=iter_count,
+            )
+            iter_count += done
+            if done < steps:
+                break
+            now = time.monotonic()
+            due_by_time = checkpoint_seconds is not None and now - last_save >= checkpoint_seconds
+            if checkpoint_every is not None or due_by_time:
+                save_checkpoint(checkpoint, x, R, iter_count, digest)
+                last_save = now
+        save_checkpoint(checkpoint, x, R, iter_count, digest)
+
+    if iter_count >= max_iter:
+        print("Достигнуто максимальное количество итераций.")
+
+    return x, iter_count
+
+
+def relax_steps(P, x, R, eps, max_steps, callback=None, callback_every=1, start=0):
+    """
+    Не более max_steps итераций релаксации над состоянием (x, R),
+    которое изменяется на месте. Возвращает число выполненных итераций.
+    start — номер первой итерации (для callback при продолжении счёта).
+    """
+    n = len(R)
+    iter_count = 0
+    while iter_count < max_steps:
+        # Находим индекс максимальной по модулю невязки
+        max_r = abs(R[0])
+        s = 0
+        for i in range(1, n):
+            if abs(R[i]) > max_r:
+                max_r = abs(R[i])
+                s = i
+
+        if max_r < eps:
+            break
+
+        if callback is not None and (start + iter_count) % callback_every == 0:
+            if callback(start + iter_count, max_r, s, R):
+                break
+
+        delta = R[s]          # величина поправки
+        x[s] += delta         # обновление переменной
+
+        # Обновляем остальные невязки
+        if isinstance(P, CSCMatrix):
+            # Только ненулевые элементы столбца s: O(nnz столбца)
+            for k in range(P.indptr[s], P.indptr[s + 1]):
+                R[P.indices[k]] += P.data[k] * delta
+        elif isinstance(P, PackedColumns):
+            # Столбец непрерывен в памяти; P[s][s] = 0, R[s] обнуляется ниже
+            R[:] = [r + p * delta for r, p in zip(R, P.column(s))]
+        else:
+            for i in range(n):
+                if i != s:
+                    R[i] += P[i][s] * delta
+        R[s] = 0.0
+
+        iter_count += 1
+
+    return iter_count
+
+
+@dataclass
+class Snapshot:
+    """
+    Промежуточное состояние iter_relaxation. x — сам рабочий вектор,
+    а не копия: он меняется при следующих шагах, поэтому сохранять
+    его нужно через list(snapshot.x).
+    """
+
+    iteration: int
+    max_residual: float
+    x: list[float]
+    converged: bool
+
+
+def iter_relaxation(
+    A,
+    b,
+    eps=1e-6,
+    max_iter=10000,
+    x0=None,
+    every=100,
+) -> Generator[Snapshot, object, tuple[list[float], int]]:
+    """
+    Метод релаксации в виде генератора: после каждых every итераций
+    выдаётся Snapshot. Последний снимок имеет converged=True либо
+    соответствует max_iter.
+
+    Досрочная остановка: gen.send(True) завершает счёт (StopIteration
+    с value = (x, iter_count)), gen.close() просто прекращает его.
+    Генераторы нескольких систем можно продвигать поочерёдно.
+    Итерации те же, что у relaxation_method, поэтому при полном
+    проходе результат совпадает с ним.
+    """
+    if every < 1:
+        raise ValueError("Период выдачи снимков every должен быть не меньше 1.")
+    n = len(b)
+    P = build_iteration_matrix(A)
+    diag = matrix_diagonal(A)
+    c = [b[i] / diag[i] for i in range(n)]
+    if x0 is None:
+        x = [0.0] * n
+        R = c[:]
+    else:
+        x = [float(v) for v in x0]
+        R = initial_residual(P, c, x)
+
+    iter_count = 0
+    while True:
+        iter_count += relax_steps(P, x, R, eps=eps, max_steps=min(every, max_iter - iter_count))
+        max_r = max(map(abs, R), default=0.0)
+        converged = max_r < eps
+        stop = yield Snapshot(iter_count, max_r, x, converged)
+        if stop or converged:
+            break
+        if iter_count >= max_iter:
+            print("Достигнуто максимальное количество итераций.")
+            break
+    return x, iter_count
+
+
+def relax_sweep(P, x, R):
+    """
+    Циклический проход: каждая компонента релаксируется ровно один раз
+    в порядке 0..n-1 (без поиска максимума). В отличие от выбора по
+    наибольшей невязке, проход — линейное отображение x -> Gx + d,
+    что нужно для экстраполяции (ускорение Андерсона).
+    """
+    n = len(R)
+    for s in range(n):
+        delta = R[s]
+        if delta == 0.0:
+            continue
+        x[s] += delta
+        if isinstance(P, CSCMatrix):
+            for k in range(P.indptr[s], P.indptr[s + 1]):
+                R[P.indices[k]] += P.data[k] * delta
+        else:
+            for i in range(n):
+                if i != s:
+                    R[i] += P[i][s] * delta
+        R[s] = 0.0
+    return n
+
+
+def block_relax(P, c, eps=1e-6, max_iter=10000, x0=None, block_size=None):
+    """
+    Блочная (многоиндексная) релаксация Саутвелла: за один просмотр
+    невязки выбирается сразу несколько компонент и все они
+    релаксируются одновременно, так что стоимость просмотра O(n)
+    делится между несколькими обновлениями.
+
+    block_size — число компонент с наибольшей невязкой (через heapq.nlargest,
+    O(n log k)); None — адаптивный выбор всех компонент с |R_i| >= max|R| / 2.
+    iter_count считает просмотры (блочные итерации), а не обновления.
+    """
+    n = len(c)
+    if block_size is not None and block_size < 1:
+        raise ValueError("Размер блока должен быть не меньше 1.")
+
+    if x0 is None:
+        x = [0.0 for _ in range(n)]
+        R = c[:]
+    else:
+        x = [float(v) for v in x0]
+        R = initial_residual(P, c, x)
+
+    iter_count = 0
+    while iter_count < max_iter:
+        abs_r = list(map(abs, R))
+        max_r = max(abs_r, default=0.0)
+        if max_r < eps:
+            break
+
+        if block_size is None:
+            threshold = 0.5 * max_r
+            block = [i for i in range(n) if abs_r[i] >= threshold]
+        else:
+            block = heapq.nlargest(block_size, range(n), key=abs_r.__getitem__)
+        deltas = [R[s] for s in block]
+
+        for s, delta in zip(block, deltas):
+            x[s] += delta
+        if isinstance(P, CSCMatrix):
+            for s, delta in zip(block, deltas):
+                R[s] -= delta
+                for k in range(P.indptr[s], P.indptr[s + 1]):
+                    R[P.indices[k]] += P.data[k] * delta
+        else:
+            # Диагональ плотной P равна -1, поэтому R_new = R + P[:, block]·delta
+            # сразу обнуляет собственную невязку каждой выбранной компоненты
+            for i in range(n):
+                row = P[i]
+                acc = 0.0
+                for s, delta in zip(block, deltas):
+                    acc += row[s] * delta
+                R[i] += acc
+
+        iter_count += 1
+
+    if iter_count >= max_iter:
+        print("Достигнуто максимальное количество итераций.")
+
+    return x, iter_count
+
+
+def block_relaxation_method(A, b, eps=1e-6, max_iter=10000, x0=None, block_size=None):
+    n = len(b)
+    P = build_iteration_matrix(A)
+    diag = matrix_diagonal(A)
+    c = [b[i] / diag[i] for i in range(n)]
+    return block_relax(P, c, eps=eps, max_iter=max_iter, x0=x0, block_size=block_size)
+
+
+def mixed_precision_relaxation_method(
+    A, b, eps=1e-6, max_iter=10000, x0=None, precision="float32", max_refinements=20
+):
+    """
+    Релаксация с компактной P (см. PackedColumns) и итерационным уточнением.
+    x и R всегда хранятся в float64. Когда невязка, которую ведёт метод,
+    падает ниже eps, точная невязка пересчитывается по исходной A в float64
+    и релаксация продолжается от неё. Так ошибка округления P в float32
+    не ограничивает итоговую точность. Обычно хватает 2–3 уточнений.
+    iter_count — суммарное число итераций релаксации.
+    """
+    n = len(b)
+    P = build_packed_iteration_matrix(A, precision)
+    diag = matrix_diagonal(A)
+    x = [0.0] * n if x0 is None else [float(v) for v in x0]
+
+    iter_count = 0
+    for _ in range(max_refinements + 1):
+        # Точная невязка (b - Ax)_i / a_ii в float64
+        R = [(b[i] - row_dot(A, i, x)) / diag[i] for i in range(n)]
+        if max(map(abs, R), default=0.0) < eps:
+            break
+        if iter_count >= max_iter:
+            print("Достигнуто максимальное количество итераций.")
+            break
+        iter_count += relax_steps(P, x, R, eps, max_iter - iter_count)
+    else:
+        print("Уточнение не достигло заданной точности.")
+
+    return x, iter_count
@@ -0,0 +1,165 @@
+"""
+Локальный HTTP-сервис решения СЛАУ с кэшем подготовленных систем.
+
+Процессы, многократно решающие системы с одними и теми же матрицами,
+отправляют только правые части: подготовленная система (P, c-масштаб,
+результат проверки A) хранится в LRU-кэше по хэшу содержимого матрицы.
+
+    python -m lab2.service --port 8765 --cache-size 8
+
+POST /solve, тело JSON:
+  {"A_file": "A.txt" | "A": [[...]], "b": [...],
+   "eps": 1e-9, "max_iter": 10000, "x0": [...]}  (eps, max_iter, x0 — необязательны)
+Ответ: {"x": [...], "iterations": k, "key": "<sha256>", "cached": true|false}
+Ошибки проверки и формата возвращаются с кодом 400: {"error": "..."}.
+Запросы обрабатываются в отдельных потоках.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import threading
+from array import array
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Union
+
+from .main import load_matrix
+from .system import RelaxationSystem
+
+
+def matrix_key(A: list[list[float]]) -> str:
+    digest = hashlib.sha256(f"dense:{len(A)}:".encode())
+    for row in A:
+        digest.update(array("d", row).tobytes())
+        digest.update(b";")
+    return digest.hexdigest()
+
+
+def file_key(filename: str) -> str:
+    # Расширение входит в ключ: один и тот же байтовый поток в разных
+    # форматах означает разные матрицы
+    digest = hashlib.sha256(f"file:{Path(filename).suffix}:".encode())
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SystemCache:
+    """
+    LRU-кэш подготовленных систем. Для матриц, не прошедших проверку,
+    запоминается сообщение об ошибке, чтобы не повторять проверку.
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        self.capacity = capacity
+        self._entries: OrderedDict[str, Union[RelaxationSystem, ValueError]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, build) -> tuple[RelaxationSystem, bool]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        cached = entry is not None
+        if entry is None:
+            # Подготовка идёт вне блокировки, чтобы не задерживать другие запросы
+            try:
+                entry = build()
+            except ValueError as e:
+                entry = e
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.capacity:
+                    self._entries.popitem(last=False)
+        if isinstance(entry, ValueError):
+            raise entry
+        return entry, cached
+
+
+def handle_solve(cache: SystemCache, request: dict) -> dict:
+    if "b" not in request:
+        raise ValueError("В запросе нет вектора b.")
+    if "A" in request:
+        A = request["A"]
+        key = matrix_key(A)
+        build = lambda: RelaxationSystem(A)
+    elif "A_file" in request:
+        filename = request["A_file"]
+        try:
+            key = file_key(filename)
+        except OSError as e:
+            raise ValueError(f"Не удалось прочитать {filename}: {e.strerror}.")
+        build = lambda: RelaxationSystem(load_matrix(filename))
+    else:
+        raise ValueError("В запросе нет матрицы A или A_file.")
+
+    system, cached = cache.get(key, build)
+    x, iterations = system.solve(
+        request["b"],
+        request.get("x0"),
+        eps=request.get("eps"),
+        max_iter=request.get("max_iter"),
+    )
+    return {"x": x, "iterations": iterations, "key": key, "cached": cached}
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8765, cache_size: int = 8) -> ThreadingHTTPServer:
+    cache = SystemCache(cache_size)
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self) -> None:
+            if self.path != "/solve":
+                self._reply(404, {"error": f"Неизвестный путь {self.path}."})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                self._reply(200, handle_solve(cache, request))
+            except (ValueError, TypeError) as e:
+                self._reply(400, {"error": str(e)})
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.cache = cache
+    return server
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Локальный сервис решения СЛАУ методом релаксации")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cache-size", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, args.cache_size)
+    print(f"Сервис запущен: http://{args.host}:{server.server_address[1]}/solve")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterator
+
+
+def _compressed_set(
+    indptr: list[int],
+    indices: list[int],
+    data: list[float],
+    major: int,
+    minor: int,
+    value: float,
+) -> None:
+    """
+    Запись элемента в сжатое хранение (CSR или CSC) с сохранением
+    порядка индексов. Новый элемент вставляется в списки indices/data,
+    а границы последующих строк (столбцов) сдвигаются на 1.
+    """
+    lo, hi = indptr[major], indptr[major + 1]
+    k = bisect_left(indices, minor, lo, hi)
+    if k < hi and indices[k] == minor:
+        data[k] = value
+        return
+    if value == 0.0:
+        return
+    indices.insert(k, minor)
+    data.insert(k, value)
+    for m in range(major + 1, len(indptr)):
+        indptr[m] += 1
+
+
+@dataclass
+class CSRMatrix:
+    """
+    Квадратная разреженная матрица n×n в формате CSR (сжатые строки).
+    Элементы строки i лежат в data[indptr[i]:indptr[i+1]],
+    их столбцы — в indices[indptr[i]:indptr[i+1]] (по возрастанию).
+    """
+
+    n: int
+    indptr: list[int]
+    indices: list[int]
+    data: list[float]
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def row(self, i: int) -> Iterator[tuple[int, float]]:
+        for k in range(self.indptr[i], self.indptr[i + 1]):
+            yield self.indices[k], self.data[k]
+
+    def get(self, i: int, j: int) -> float:
+        for k in range(self.indptr[i], self.indptr[i + 1]):
+            if self.indices[k] == j:
+                return self.data[k]
+        return 0.0
+
+    def set(self, i: int, j: int, value: float) -> None:
+        """A[i][j] = value; существующий элемент при value = 0 хранится явным нулём."""
+        _compressed_set(self.indptr, self.indices, self.data, i, j, value)
+
+    def diagonal(self) -> list[float]:
+        diag = [0.0] * self.n
+        for i in range(self.n):
+            diag[i] = self.get(i, i)
+        return diag
+
+    def matvec(self, x: list[float]) -> list[float]:
+        y = [0.0] * self.n
+        for i in range(self.n):
+            acc = 0.0
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                acc += self.data[k] * x[self.indices[k]]
+            y[i] = acc
+        return y
+
+    def to_csc(self) -> CSCMatrix:
+        n = self.n
+        counts = [0] * (n + 1)
+        for j in self.indices:
+            counts[j + 1] += 1
+        for j in range(n):
+            counts[j + 1] += counts[j]
+        indptr = counts[:]
+        pos = counts[:n]
+        indices = [0] * self.nnz
+        data = [0.0] * self.nnz
+        # Обход строк по возрастанию даёт отсортированные индексы строк в столбцах
+        for i in range(n):
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                j = self.indices[k]
+                dst = pos[j]
+                indices[dst] = i
+                data[dst] = self.data[k]
+                pos[j] += 1
+        return CSCMatrix(n, indptr, indices, data)
+
+    def to_dense(self) -> list[list[float]]:
+        dense = [[0.0] * self.n for _ in range(self.n)]
+        for i in range(self.n):
+            for j, v in self.row(i):
+                dense[i][j] = v
+        return dense
+
+
+@dataclass
+class CSCMatrix:
+    """
+    Квадратная разреженная матрица n×n в формате CSC (сжатые столбцы).
+    Элементы столбца j лежат в data[indptr[j]:indptr[j+1]],
+    их строки — в indices[indptr[j]:indptr[j+1]].
+    """
+
+    n: int
+    indptr: list[int]
+    indices: list[int]
+    data: list[float]
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def column(self, j: int) -> Iterator[tuple[int, float]]:
+        for k in range(self.indptr[j], self.indptr[j + 1]):
+            yield self.indices[k], self.data[k]
+
+    def set(self, i: int, j: int, value: float) -> None:
+        """A[i][j] = value (индексы строк в столбце должны быть упорядочены)."""
+        _compressed_set(self.indptr, self.indices, self.data, j, i, value)
+
+
+def csr_from_coo(
+    n: int,
+    rows: list[int],
+    cols: list[int],
+    vals: list[float],
+) -> CSRMatrix:
+    """
+    Сборка CSR из координатного формата (i, j, value), индексы с нуля.
+    Повторяющиеся позиции суммируются, явные нули отбрасываются.
+    """
+    entries: list[dict[int, float]] = [{} for _ in range(n)]
+    for i, j, v in zip(rows, cols, vals):
+        if not (0 <= i < n and 0 <= j < n):
+            raise ValueError(f"Индекс ({i + 1}, {j + 1}) выходит за пределы матрицы {n}x{n}.")
+        row = entries[i]
+        row[j] = row.get(j, 0.0) + v
+
+    indptr = [0]
+    indices: list[int] = []
+    data: list[float] = []
+    for row in entries:
+        for j in sorted(row):
+            if row[j] != 0.0:
+                indices.append(j)
+                data.append(row[j])
+        indptr.append(len(data))
+    return CSRMatrix(n, indptr, indices, data)
+
+
+def csr_from_dense(A: list[list[float]]) -> CSRMatrix:
+    n = len(A)
+    indptr = [0]
+    indices: list[int] = []
+    data: list[float] = []
+    for i in range(n):
+        for j, v in enumerate(A[i]):
+            if v != 0.0:
+                indices.append(j)
+                data.append(v)
+        indptr.append(len(data))
+    return CSRMatrix(n, indptr, indices, data)
+
+
+def matrix_diagonal(A: list[list[float]] | CSRMatrix) -> list[float]:
+    # CSR и компактные формы из lab2/packed.py знают свою диагональ
+    if hasattr(A, "diagonal"):
+        return A.diagonal()
+    return [A[i][i] for i in range(len(A))]
+
+
+def _adjacency(A: list[list[float]] | CSRMatrix) -> list[list[int]]:
+    """Соседи в симметризованном шаблоне A (без диагонали)."""
+    if isinstance(A, CSRMatrix):
+        n = A.n
+        neighbors: list[set[int]] = [set() for _ in range(n)]
+        for i in range(n):
+            for j in A.indices[A.indptr[i] : A.indptr[i + 1]]:
+                if j != i:
+                    neighbors[i].add(j)
+                    neighbors[j].add(i)
+    else:
+        n = len(A)
+        neighbors = [set() for _ in range(n)]
+        for i in range(n):
+            row = A[i]
+            for j in range(n):
+                if j != i and (row[j] != 0.0 or A[j][i] != 0.0):
+                    neighbors[i].add(j)
+    return [sorted(nb) for nb in neighbors]
+
+
+def reverse_cuthill_mckee(A: list[list[float]] | CSRMatrix) -> list[int]:
+    """
+    Перестановка Reverse Cuthill–McKee, уменьшающая ширину ленты.
+    perm[k] — старый индекс неизвестной, ставшей k-й.
+    Каждая компонента связности обходится в ширину от вершины
+    минимальной степени, соседи добавляются по возрастанию степени.
+    """
+    adj = _adjacency(A)
+    n = len(adj)
+    degree = [len(nb) for nb in adj]
+    visited = [False] * n
+    order: list[int] = []
+    for start in sorted(range(n), key=lambda v: degree[v]):
+        if visited[start]:
+            continue
+        visited[start] = True
+        head = len(order)
+        order.append(start)
+        while head < len(order):
+            v = order[head]
+            head += 1
+            fresh = [u for u in adj[v] if not visited[u]]
+            fresh.sort(key=lambda u: degree[u])
+            for u in fresh:
+                visited[u] = True
+            order.extend(fresh)
+    order.reverse()
+    return order
+
+
+def greedy_coloring(A: list[list[float]] | CSRMatrix) -> list[int]:
+    """
+    Жадная раскраска графа шаблона A: вершины обходятся по порядку и
+    получают наименьший цвет, не занятый соседями. Для пятиточечной
+    сетки и трёхдиагональной матрицы в естественной нумерации это
+    красно-чёрная раскраска (2 цвета). colors[i] — цвет неизвестной i.
+    """
+    adj = _adjacency(A)
+    colors = [-1] * len(adj)
+    for v, nb in enumerate(adj):
+        used = {colors[u] for u in nb}
+        c = 0
+        while c in used:
+            c += 1
+        colors[v] = c
+    return colors
+
+
+def bandwidth(A: list[list[float]] | CSRMatrix) -> int:
+    """Ширина ленты: max |i - j| по ненулевым элементам."""
+    width = 0
+    if isinstance(A, CSRMatrix):
+        for i in range(A.n):
+            for j in A.indices[A.indptr[i] : A.indptr[i + 1]]:
+                width = max(width, abs(i - j))
+        return width
+    for i, row in enumerate(A):
+        for j, v in enumerate(row):
+            if v != 0.0:
+                width = max(width, abs(i - j))
+    return width
+
+
+def permute_matrix(
+    A: list[list[float]] | CSRMatrix,
+    perm: list[int],
+) -> list[list[float]] | CSRMatrix:
+    """Симметричная перестановка строк и столбцов: B[k][l] = A[perm[k]][perm[l]]."""
+    if isinstance(A, CSRMatrix):
+        inverse = [0] * A.n
+        for k, old in enumerate(perm):
+            inverse[old] = k
+        rows: list[int] = []
+        cols: list[int] = []
+        vals: list[float] = []
+        for k, old in enumerate(perm):
+            for j, v in A.row(old):
+                rows.append(k)
+                cols.append(inverse[j])
+                vals.append(v)
+        return csr_from_coo(A.n, rows, cols, vals)
+    return [[A[old][j] for j in perm] for old in perm]
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from .main import Matrix, solve_relaxation, validate_matrix
+from .methods import row_dot
+from .relaxation import build_iteration_matrix, initial_residual, relax_steps
+from .sparse import CSCMatrix, CSRMatrix, matrix_diagonal
+
+
+class RelaxationSystem:
+    """
+    Подготовленная система с фиксированной матрицей A.
+    Проверки A и построение P выполняются один раз в конструкторе,
+    поэтому на каждую правую часть тратятся только итерации.
+
+    solve не меняет объект, поэтому одну систему можно решать из
+    нескольких потоков (так её использует сервис lab2/service.py).
+
+    Для пошаговых правок решение запускается через solve_and_track:
+    система запоминает b, x и невязку R. update меняет отдельные
+    элементы A и b (A изменяется на месте): пересчитываются только
+    затронутые строки — диагональ, строка P, c_i, проверка преобладания
+    и R_i = (b_i - a_i·x) / a_ii. resolve продолжает релаксацию с прежнего
+    x, поэтому малая правка стоит работы, пропорциональной изменению.
+    Запомненное состояние защищено блокировкой; update меняет A и P,
+    поэтому одновременно с ним solve вызывать нельзя.
+    """
+
+    def __init__(
+        self,
+        A: Matrix,
+        *,
+        eps: float = 1e-9,
+        max_iter: int = 10000,
+        dominance_tol: float = 0.0,
+    ) -> None:
+        validate_matrix(A, dominance_tol=dominance_tol)
+        self.A = A
+        self.eps = eps
+        self.max_iter = max_iter
+        self.dominance_tol = dominance_tol
+        self.diag = matrix_diagonal(A)
+        self.n = len(self.diag)
+        self.P = build_iteration_matrix(A)
+        # Состояние решения из solve_and_track (для update/resolve)
+        self.b: Optional[list[float]] = None
+        self.x: Optional[list[float]] = None
+        self.R: Optional[list[float]] = None
+        self._lock = threading.RLock()
+
+    def _check_rhs(self, size: int) -> None:
+        if size != self.n:
+            raise ValueError(
+                f"Размерность b ({size}) не совпадает с размерностью A ({self.n}x{self.n})."
+            )
+
+    def _initial_state(self, b: list[float], x0: Optional[list[float]]) -> tuple[list[float], list[float]]:
+        self._check_rhs(len(b))
+        c = [b[i] / self.diag[i] for i in range(self.n)]
+        if x0 is None:
+            return [0.0] * self.n, c
+        x = [float(v) for v in x0]
+        return x, initial_residual(self.P, c, x)
+
+    def _relax(self, x: list[float], R: list[float], eps: Optional[float], max_iter: Optional[int]) -> int:
+        max_iter = self.max_iter if max_iter is None else max_iter
+        iter_count = relax_steps(
+            self.P,
+            x,
+            R,
+            eps=self.eps if eps is None else eps,
+            max_steps=max_iter,
+        )
+        if iter_count >= max_iter:
+            print("Достигнуто максимальное количество итераций.")
+        return iter_count
+
+    def solve(
+        self,
+        b: list[float],
+        x0: Optional[list[float]] = None,
+        *,
+        eps: Optional[float] = None,
+        max_iter: Optional[int] = None,
+    ) -> tuple[list[float], int]:
+        """eps и max_iter, если заданы, заменяют значения из конструктора."""
+        x, R = self._initial_state(b, x0)
+        return x, self._relax(x, R, eps, max_iter)
+
+    def solve_and_track(
+        self,
+        b: list[float],
+        x0: Optional[list[float]] = None,
+        *,
+        eps: Optional[float] = None,
+        max_iter: Optional[int] = None,
+    ) -> tuple[list[float], int]:
+        """То же, что solve, но система запоминает b, x и R для update/resolve."""
+        x, R = self._initial_state(b, x0)
+        with self._lock:
+            self.b = [float(v) for v in b]
+            self.x = x
+            self.R = R
+            return self.resolve(eps=eps, max_iter=max_iter)
+
+    def resolve(
+        self,
+        *,
+        eps: Optional[float] = None,
+        max_iter: Optional[int] = None,
+    ) -> tuple[list[float], int]:
+        """Продолжение релаксации с текущего x после update."""
+        with self._lock:
+            if self.x is None:
+                raise ValueError("Система ещё не решалась: сначала вызовите solve_and_track(b).")
+            iter_count = self._relax(self.x, self.R, eps, max_iter)
+            # Копия: последующие resolve не должны менять уже выданный результат
+            return self.x[:], iter_count
+
+    def update(
+        self,
+        A_changes: Optional[dict[tuple[int, int], float]] = None,
+        b_changes: Optional[dict[int, float]] = None,
+    ) -> None:
+        """
+        Изменение элементов: A_changes = {(i, j): a_ij}, b_changes = {i: b_i}.
+        Проверка преобладания выполняется только для затронутых строк и
+        до внесения правок, так что при ошибке система не меняется.
+        """
+        with self._lock:
+            self._update(A_changes or {}, b_changes or {})
+
+    def _update(self, A_changes: dict[tuple[int, int], float], b_changes: dict[int, float]) -> None:
+        if b_changes and self.b is None:
+            raise ValueError("Система ещё не решалась: сначала вызовите solve_and_track(b).")
+        for i, j in A_changes:
+            if not (0 <= i < self.n and 0 <= j < self.n):
+                raise ValueError(f"Индекс ({i + 1}, {j + 1}) выходит за пределы матрицы {self.n}x{self.n}.")
+        for i in b_changes:
+            if not 0 <= i < self.n:
+                raise ValueError(f"Индекс {i + 1} выходит за пределы b размерности {self.n}.")
+
+        changed: dict[int, dict[int, float]] = {}
+        for (i, j), v in A_changes.items():
+            changed.setdefault(i, {})[j] = float(v)
+        for i, row_changes in changed.items():
+            self._check_row(i, row_changes)
+
+        for i, row_changes in changed.items():
+            self._patch_row(i, row_changes)
+        for i, v in b_changes.items():
+            self.b[i] = float(v)
+
+        if self.x is not None:
+            for i in set(changed) | set(b_changes):
+                self.R[i] = (self.b[i] - row_dot(self.A, i, self.x)) / self.diag[i]
+
+    def _row(self, i: int) -> dict[int, float]:
+        if isinstance(self.A, CSRMatrix):
+            return dict(self.A.row(i))
+        return {j: v for j, v in enumerate(self.A[i]) if v != 0.0}
+
+    def _check_row(self, i: int, row_changes: dict[int, float]) -> None:
+        row = self._row(i)
+        row.update(row_changes)
+        d = row.get(i, 0.0)
+        if d == 0:
+            raise ValueError(f"Диагональный элемент A[{i}][{i}] равен 0.")
+        others = sum(abs(v) for j, v in row.items() if j != i)
+        if not (abs(d) > others + self.dominance_tol):
+            raise ValueError("Матрица A не удовлетворяет условию диагонального преобладания")
+
+    def _patch_row(self, i: int, row_changes: dict[int, float]) -> None:
+        A = self.A
+        if isinstance(A, CSRMatrix):
+            for j, v in row_changes.items():
+                A.set(i, j, v)
+        else:
+            if not isinstance(A[i], list):
+                # Строка-представление mmap только для чтения
+                A[i] = list(A[i])
+            for j, v in row_changes.items():
+                A[i][j] = v
+
+        d = row_changes.get(i, self.diag[i])
+        diag_changed = d != self.diag[i]
+        self.diag[i] = d
+        P = self.P
+        if isinstance(P, CSCMatrix):
+            # При смене a_ii меняется вся строка P, иначе — только правленые элементы
+            entries = self._row(i).items() if diag_changed else row_changes.items()
+            for j, v in entries:
+                if j != i:
+                    P.set(i, j, -v / d)
+        else:
+            P[i] = [-1.0 if j == i else -v / d for j, v in enumerate(A[i])]
+
+    def solve_many(self, B: list[list[float]]) -> tuple[list[list[float]], int]:
+        """
+        Решение для блока правых частей B размера n×m (столбец — одна b).
+        Невязки всех m систем хранятся построчно и обновляются вместе:
+        на каждой итерации выбирается строка s с наибольшей невязкой
+        среди всех систем, и столбец P[:, s] применяется ко всему блоку.
+        Возвращает X размера n×m и число итераций.
+        """
+        self._check_rhs(len(B))
+        n = self.n
+        m = len(B[0]) if n else 0
+        P = self.P
+
+        X = [[0.0] * m for _ in range(n)]
+        R = [[B[i][k] / self.diag[i] for k in range(m)] for i in range(n)]
+
+        iter_count = 0
+        while iter_count < self.max_iter:
+            max_r = 0.0
+            s = 0
+            for i in range(n):
+                r = max(map(abs, R[i]), default=0.0)
+                if r > max_r:
+                    max_r = r
+                    s = i
+
+            if max_r < self.eps:
+                break
+
+            delta = R[s]
+            X[s] = [x + d for x, d in zip(X[s], delta)]
+
+            if isinstance(P, CSCMatrix):
+                for k in range(P.indptr[s], P.indptr[s + 1]):
+                    p = P.data[k]
+                    i = P.indices[k]
+                    R[i] = [r + p * d for r, d in zip(R[i], delta)]
+            else:
+                for i in range(n):
+                    p = P[i][s]
+                    if i != s and p != 0.0:
+                        R[i] = [r + p * d for r, d in zip(R[i], delta)]
+            R[s] = [0.0] * m
+
+            iter_count += 1
+
+        if iter_count >= self.max_iter:
+            print("Достигнуто максимальное количество итераций.")
+
+        return X, iter_count
+
+
+class RelaxationStepper:
+    """
+    Решатель для последовательности медленно меняющихся систем
+    (шаги по времени): решение каждого шага становится начальным
+    приближением x0 для следующего. Параметры конструктора передаются
+    в solve_relaxation без изменений.
+    """
+
+    def __init__(self, x0: Optional[list[float]] = None, **options) -> None:
+        self.x = x0
+        self.options = options
+        self.iterations: list[int] = []
+
+    def step(self, A: Matrix, b: list[float]) -> tuple[list[float], int]:
+        # При смене размерности прошлое решение как приближение не годится
+        x0 = self.x if self.x is not None and len(self.x) == len(b) else None
+        x, iter_count = solve_relaxation(A=A, b=b, x0=x0, **self.options)
+        self.x = x
+        self.iterations.append(iter_count)
+        return x, iter_count
+
+    def reset(self) -> None:
+        self.x = None
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Sample:
+    iteration: int
+    max_residual: float
+    residual_norm: float
+    index: int
+    elapsed: float
+
+
+@dataclass
+class ConvergenceRecorder:
+    """
+    Регистратор истории сходимости для relax(callback=...).
+    Вызывается каждые callback_every итераций; 2-норма невязки считается
+    только в эти моменты, поэтому при редкой выборке накладные расходы малы.
+
+    Застой: если за последние stagnation_window выборок максимальная
+    невязка уменьшилась меньше чем в (1 - stagnation_ratio) раз,
+    регистратор возвращает True и итерации прекращаются.
+    stagnation_window = 0 отключает проверку.
+    """
+
+    stagnation_window: int = 0
+    stagnation_ratio: float = 1e-3
+    samples: list[Sample] = field(default_factory=list)
+    stagnated: bool = False
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+
+    def __call__(self, iteration: int, max_r: float, s: int, R: list[float]) -> bool:
+        norm = math.sqrt(sum(r * r for r in R))
+        self.samples.append(Sample(iteration, max_r, norm, s, time.perf_counter() - self._start))
+
+        window = self.stagnation_window
+        if window and len(self.samples) > window:
+            before = self.samples[-window - 1].max_residual
+            best = min(sample.max_residual for sample in self.samples[-window:])
+            if best > before * (1.0 - self.stagnation_ratio):
+                self.stagnated = True
+                return True
+        return False
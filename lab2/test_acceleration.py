@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from .acceleration import anderson_relax
+from .main import solve_relaxation
+from .relaxation import build_iteration_matrix, initial_residual, relax_sweep
+from .sparse import csr_from_dense
+
+
+def weak_tridiagonal(n: int, diag: float = 2.05) -> list[list[float]]:
+    # Запас диагонального преобладания всего 0.05: релаксация сходится медленно
+    A = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        A[i][i] = diag
+        if i > 0:
+            A[i][i - 1] = -1.0
+        if i < n - 1:
+            A[i][i + 1] = -1.0
+    return A
+
+
+def matvec(A: list[list[float]], x: list[float]) -> list[float]:
+    return [sum(A[i][j] * x[j] for j in range(len(x))) for i in range(len(A))]
+
+
+def test_sweep_keeps_residual_consistent() -> None:
+    A = weak_tridiagonal(6)
+    b = [1.0, -2.0, 0.5, 3.0, 0.0, 1.0]
+    P = build_iteration_matrix(A)
+    c = [b[i] / A[i][i] for i in range(6)]
+    x = [0.0] * 6
+    R = c[:]
+    assert relax_sweep(P, x, R) == 6
+    for got, exp in zip(R, initial_residual(P, c, x)):
+        assert abs(got - exp) < 1e-12
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_anderson_cuts_iterations(sparse: bool) -> None:
+    n = 50
+    A = weak_tridiagonal(n)
+    rng = random.Random(1)
+    x_true = [rng.uniform(-1.0, 1.0) for _ in range(n)]
+    b = matvec(A, x_true)
+    matrix = csr_from_dense(A) if sparse else A
+    _, plain = solve_relaxation(A=matrix, b=b, eps=1e-9, max_iter=10**6)
+    x, accelerated = solve_relaxation(A=matrix, b=b, eps=1e-9, max_iter=10**6, accelerate="anderson")
+    assert accelerated < plain / 2
+    assert max(abs(g - e) for g, e in zip(x, x_true)) < 1e-6
+
+
+def test_safeguard_falls_back_to_plain_sweeps() -> None:
+    # depth=0 эквивалентно обычным проходам — результат тот же, что у циклической релаксации
+    A = weak_tridiagonal(10, diag=3.0)
+    b = matvec(A, [1.0] * 10)
+    P = build_iteration_matrix(A)
+    c = [b[i] / A[i][i] for i in range(10)]
+    x, it = anderson_relax(P, c, eps=1e-12, max_iter=10**5, depth=0)
+    assert it % 10 == 0
+    assert max(abs(v - 1.0) for v in x) < 1e-10
+
+
+def test_acceleration_arguments() -> None:
+    A = weak_tridiagonal(3, diag=4.0)
+    with pytest.raises(ValueError, match="способ ускорения"):
+        solve_relaxation(A=A, b=[1.0] * 3, accelerate="chebyshev")
+    with pytest.raises(ValueError, match="только методом релаксации"):
+        solve_relaxation(A=A, b=[1.0] * 3, method="jacobi", accelerate="anderson")
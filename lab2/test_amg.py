@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from .amg import amg_method, build_hierarchy
+from .bench import poisson2d, random_dense
+from .main import solve_relaxation
+from .methods import matvec
+
+
+def _system(n: int):
+    A = poisson2d(n)
+    rng = random.Random(0)
+    x_true = [rng.uniform(-1.0, 1.0) for _ in range(A.n)]
+    return A, x_true, matvec(A, x_true)
+
+
+class TestHierarchy:
+    def test_levels_shrink(self) -> None:
+        levels = build_hierarchy(poisson2d(1600))
+        sizes = [level.A.n for level in levels]
+        assert len(sizes) >= 3
+        assert all(a > b for a, b in zip(sizes, sizes[1:]))
+        assert sizes[-1] <= 40
+        assert levels[-1].coarse_lu is not None
+
+    def test_galerkin_operator_is_symmetric(self) -> None:
+        coarse = build_hierarchy(poisson2d(400))[1].A
+        for i in range(coarse.n):
+            for j, v in coarse.row(i):
+                assert v == pytest.approx(coarse.get(j, i), abs=1e-12)
+
+
+class TestAMG:
+    def test_solves_poisson(self) -> None:
+        A, x_true, b = _system(900)
+        x, iterations = solve_relaxation(A=A, b=b, eps=1e-10, method="amg")
+        assert max(abs(g - e) for g, e in zip(x, x_true)) < 1e-8
+        assert iterations < 30
+
+    def test_iterations_do_not_grow_with_n(self) -> None:
+        counts = []
+        for n in (100, 1600):
+            A, _, b = _system(n)
+            counts.append(amg_method(A, b, eps=1e-9)[1])
+        assert counts[1] <= counts[0] + 4
+
+    def test_small_dense_system_is_solved_directly(self) -> None:
+        A = random_dense(10, seed=1)
+        b = matvec(A, [1.0] * 10)
+        x, iterations = solve_relaxation(A=A, b=b, eps=1e-12, method="amg")
+        assert iterations == 1
+        assert x == pytest.approx([1.0] * 10, abs=1e-10)
+
+    def test_warm_start(self) -> None:
+        A, x_true, b = _system(400)
+        _, iterations = amg_method(A, b, eps=1e-9, x0=x_true)
+        assert iterations == 0
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from .analysis import dominance_margins, estimate_spectral_radius, predict_convergence
+from .bench import poisson2d, random_dense, tridiagonal
+from .main import solve_relaxation
+from .methods import matvec
+from .sparse import csr_from_dense
+
+
+class TestMargins:
+    def test_margins(self) -> None:
+        A = [[4.0, 1.0, -1.0], [1.0, 5.0, 0.0], [0.0, 2.0, 2.5]]
+        assert dominance_margins(A) == pytest.approx([0.5, 0.8, 0.2])
+        assert dominance_margins(csr_from_dense(A)) == pytest.approx([0.5, 0.8, 0.2])
+
+    def test_diagonal_matrix_has_zero_radius(self) -> None:
+        assert estimate_spectral_radius([[2.0, 0.0], [0.0, 3.0]]) == 0.0
+
+
+class TestSpectralRadius:
+    def test_tridiagonal_exact(self) -> None:
+        # Якоби для трёхдиагональной (-1, 4, -1): rho = cos(pi / (n + 1)) / 2
+        n = 20
+        rho = estimate_spectral_radius(tridiagonal(n), steps=200)
+        assert rho == pytest.approx(math.cos(math.pi / (n + 1)) / 2, rel=1e-2)
+
+    def test_bounded_by_dominance(self) -> None:
+        A = random_dense(15, seed=2)
+        bound = max(1.0 - m for m in dominance_margins(A))
+        assert 0.0 < estimate_spectral_radius(A) <= bound
+
+
+class TestPrediction:
+    def test_prediction_close_to_actual(self) -> None:
+        A = tridiagonal(50)
+        b = matvec(A, [1.0] * 50)
+        prediction = predict_convergence(A, b, eps=1e-10)
+        seidel, _ = prediction.candidates["gauss_seidel"]
+        _, actual = solve_relaxation(A=A, b=b, eps=1e-10, method="gauss_seidel")
+        assert seidel / 2 <= actual <= 2 * seidel
+
+    def test_symmetric_prefers_cg_for_slow_convergence(self) -> None:
+        A = poisson2d(400, shift=0.01)
+        prediction = predict_convergence(A, [1.0] * A.n, eps=1e-9)
+        assert "cg" in prediction.candidates
+        assert prediction.method == "cg"
+
+    def test_nonsymmetric_has_no_cg(self) -> None:
+        prediction = predict_convergence(random_dense(10), [1.0] * 10)
+        assert "cg" not in prediction.candidates
+        assert prediction.predicted_iterations is not None
+
+    def test_budget(self) -> None:
+        prediction = predict_convergence(tridiagonal(10), [1.0] * 10)
+        assert prediction.budget(5) > prediction.predicted_iterations
+
+
+class TestAutoMethod:
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_auto_solves(self, sparse: bool, capsys) -> None:
+        A = random_dense(12, seed=5)
+        x_true = [float(i % 3) - 1.0 for i in range(12)]
+        b = matvec(A, x_true)
+        matrix = csr_from_dense(A) if sparse else A
+        x, iterations = solve_relaxation(A=matrix, b=b, eps=1e-12, method="auto")
+        assert max(abs(g - e) for g, e in zip(x, x_true)) < 1e-9
+        out = capsys.readouterr().out
+        assert "прогноз итераций" in out
+        assert f"фактически {iterations}" in out
+
+    def test_auto_rejects_callback(self) -> None:
+        with pytest.raises(ValueError, match="callback"):
+            solve_relaxation(A=[[2.0]], b=[1.0], method="auto", callback=lambda *a: False)
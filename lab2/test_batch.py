@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from .batch import main, read_manifest, run_batch
+from .binary import write_npy
+
+
+A = [[10.0, 1.0, 1.0], [2.0, 10.0, 1.0], [2.0, 2.0, 10.0]]
+B = [12.0, 13.0, 14.0]
+
+
+def _write_manifest(path: Path, tasks: list[dict]) -> None:
+    path.write_text("".join(json.dumps(t) + "\n" for t in tasks), encoding="utf-8")
+
+
+class TestManifest:
+    def test_jsonl_paths_are_relative_to_manifest(self, tmp_path: Path) -> None:
+        (tmp_path / "A.txt").write_text("1 0\n0 1\n", encoding="utf-8")
+        _write_manifest(tmp_path / "m.jsonl", [{"A": "A.txt", "b": [1.0, 2.0]}, {"id": "x", "A": A, "b": B}])
+        tasks = read_manifest(str(tmp_path / "m.jsonl"))
+        assert tasks[0]["id"] == "1"
+        assert tasks[0]["A"] == str(tmp_path / "A.txt")
+        assert tasks[1]["id"] == "x"
+        assert tasks[1]["A"] == A
+
+    def test_missing_fields(self, tmp_path: Path) -> None:
+        _write_manifest(tmp_path / "m.jsonl", [{"A": A}])
+        with pytest.raises(ValueError, match="нужны поля A и b"):
+            read_manifest(str(tmp_path / "m.jsonl"))
+
+    def test_directory(self, tmp_path: Path) -> None:
+        for name in ("b_sys", "a_sys"):
+            (tmp_path / name).mkdir()
+            write_npy(str(tmp_path / name / "A.npy"), A)
+            write_npy(str(tmp_path / name / "B.npy"), B)
+        (tmp_path / "empty").mkdir()
+        tasks = read_manifest(str(tmp_path))
+        assert [t["id"] for t in tasks] == ["a_sys", "b_sys"]
+
+
+class TestRunBatch:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_in_order(self, workers: int) -> None:
+        tasks = [{"id": str(k), "A": A, "b": [k * v for v in B]} for k in range(1, 6)]
+        results = list(run_batch(tasks, eps=1e-12, workers=workers, chunksize=2))
+        assert [r["id"] for r in results] == ["1", "2", "3", "4", "5"]
+        for k, record in enumerate(results, start=1):
+            assert record["x"] == pytest.approx([k, k, k], abs=1e-10)
+            assert record["iterations"] > 0
+            assert record["time_s"] >= 0
+
+    def test_errors_and_overrides(self) -> None:
+        tasks = [
+            {"id": "bad", "A": [[1.0, 2.0], [3.0, 1.0]], "b": [1.0, 1.0]},
+            {"id": "jacobi", "A": A, "b": B, "method": "jacobi", "max_iter": 1},
+        ]
+        bad, limited = run_batch(tasks, workers=1)
+        assert "диагонального преобладания" in bad["error"]
+        assert limited["iterations"] == 1
+        assert limited["messages"] == ["Достигнуто максимальное количество итераций."]
+
+
+def test_cli_writes_jsonl(tmp_path: Path) -> None:
+    _write_manifest(tmp_path / "m.jsonl", [{"id": "a", "A": A, "b": B}, {"id": "b", "A": A, "b": B}])
+    out = tmp_path / "out.jsonl"
+    main([str(tmp_path / "m.jsonl"), "--workers", "2", "--eps", "1e-12", "--out", str(out)])
+    records = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [r["id"] for r in records] == ["a", "b"]
+    assert records[0]["x"] == pytest.approx([1.0, 1.0, 1.0], abs=1e-10)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from .bench import generate, main, run_benchmark
+from .main import is_diagonally_dominant
+
+
+@pytest.mark.parametrize("kind", ["random", "tridiagonal", "poisson"])
+def test_generated_systems_are_dominant(kind: str) -> None:
+    assert is_diagonally_dominant(generate(kind, 16))
+
+
+def test_report_fields() -> None:
+    report = run_benchmark(sizes=(9,), eps=1e-10)
+    assert [r["kind"] for r in report["results"]] == ["random", "tridiagonal", "poisson"]
+    for record in report["results"]:
+        assert record["n"] == 9
+        assert record["iterations"] > 0
+        assert record["error"] < 1e-8
+        assert record["peak_memory_bytes"] > 0
+        for key in ("load_s", "validate_s", "solve_s", "iterations_per_s"):
+            assert record[key] >= 0
+    assert "determinant_s" in report["results"][0]
+    assert "nnz" in report["results"][1]
+
+
+def test_dense_limit_skips_large_dense() -> None:
+    report = run_benchmark(kinds=("random", "tridiagonal"), sizes=(50,), dense_limit=10, method="gauss_seidel")
+    assert [r["kind"] for r in report["results"]] == ["tridiagonal"]
+
+
+def test_cli_writes_json(tmp_path: Path) -> None:
+    out = tmp_path / "report.json"
+    main(["--kinds", "tridiagonal", "--sizes", "5", "--out", str(out)])
+    report = json.loads(out.read_text(encoding="utf-8"))
+    assert report["results"][0]["n"] == 5
+
+
+def test_memory_measurement_can_be_disabled() -> None:
+    report = run_benchmark(kinds=("tridiagonal",), sizes=(5,), memory=False)
+    assert "peak_memory_bytes" not in report["results"][0]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from .binary import read_npy, write_npy, write_raw
+from .main import load_matrix, load_vector, read_matrix, read_vector, solve_relaxation
+
+
+A = [[10.0, 1.0, 1.0], [2.0, 10.0, 1.0], [2.0, 2.0, 10.0]]
+B = [15.0, 25.0, 36.0]
+
+
+class TestTextReaders:
+    def test_blank_lines_are_skipped(self, tmp_path: Path) -> None:
+        (tmp_path / "A.txt").write_text("1 2\n\n3 4\n", encoding="utf-8")
+        (tmp_path / "B.txt").write_text("5\n\n6\n", encoding="utf-8")
+        assert read_matrix(str(tmp_path / "A.txt")) == [[1.0, 2.0], [3.0, 4.0]]
+        assert read_vector(str(tmp_path / "B.txt")) == [5.0, 6.0]
+
+    def test_bulk_parse_keeps_row_shape(self, tmp_path: Path) -> None:
+        path = tmp_path / "A.txt"
+        path.write_text("1 2 3\n4 5 6\n7 8 9", encoding="utf-8")
+        assert read_matrix(str(path)) == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]
+        path.write_text("1 2 3\n4 5\n6 7 8\n", encoding="utf-8")
+        assert read_matrix(str(path)) == [[1.0, 2.0, 3.0], [4.0, 5.0], [6.0, 7.0, 8.0]]
+        path.write_text("\n\n", encoding="utf-8")
+        assert read_matrix(str(path)) == []
+
+
+class TestBinaryFormats:
+    def test_npy_roundtrip(self, tmp_path: Path) -> None:
+        path = tmp_path / "A.npy"
+        write_npy(str(path), A)
+        shape, values = read_npy(str(path))
+        assert shape == (3, 3)
+        assert list(values) == [v for row in A for v in row]
+        # Смещение данных выровнено по 64 байтам, как в NumPy
+        assert (path.stat().st_size - 9 * 8) % 64 == 0
+
+    def test_raw_matrix_must_be_square(self, tmp_path: Path) -> None:
+        path = tmp_path / "A.bin"
+        write_raw(str(path), [1.0, 2.0, 3.0])
+        with pytest.raises(ValueError, match="не является квадратной"):
+            load_matrix(str(path))
+
+    def test_rows_are_views(self, tmp_path: Path) -> None:
+        path = tmp_path / "A.f64"
+        write_raw(str(path), A)
+        rows = load_matrix(str(path))
+        assert isinstance(rows[0], memoryview)
+        assert [list(r) for r in rows] == A
+
+    @pytest.mark.parametrize("ext", [".npy", ".bin"])
+    def test_solve_from_binary(self, tmp_path: Path, ext: str) -> None:
+        a_path = tmp_path / f"A{ext}"
+        b_path = tmp_path / f"B{ext}"
+        writer = write_npy if ext == ".npy" else write_raw
+        writer(str(a_path), A)
+        writer(str(b_path), B)
+        assert list(load_vector(str(b_path))) == B
+        x, _ = solve_relaxation(A_file=str(a_path), B_file=str(b_path), eps=1e-12)
+        for got, exp in zip(x, [1.0, 2.0, 3.0]):
+            assert abs(got - exp) < 1e-9
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from .checkpoint import load_checkpoint
+from .main import solve_relaxation
+from .sparse import csr_from_dense
+
+
+A = [
+    [30.0, 1.0, 0.0, -1.0, 0.5],
+    [2.0, 28.0, 1.0, 0.0, -1.0],
+    [0.0, -1.0, 27.0, 2.0, 1.0],
+    [1.0, 0.0, 1.0, 29.0, -1.0],
+    [-0.5, 1.0, 0.0, 2.0, 26.0],
+]
+B = [24.5, -52.5, 20.5, 89.5, -22.5]
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_resume_continues_exactly(tmp_path: Path, sparse: bool) -> None:
+    matrix = csr_from_dense(A) if sparse else A
+    path = str(tmp_path / "state.ckpt")
+    full = solve_relaxation(A=matrix, b=B, eps=1e-13)
+
+    # Прерванный счёт: состояние на момент остановки сохраняется
+    _, stopped = solve_relaxation(A=matrix, b=B, eps=1e-13, max_iter=7, checkpoint=path, checkpoint_every=3)
+    assert stopped == 7
+    x, R, iter_count, _ = load_checkpoint(path)
+    assert iter_count == 7
+    assert len(x) == len(R) == 5
+
+    resumed = solve_relaxation(A=matrix, b=B, eps=1e-13, resume_from=path)
+    assert resumed == full
+
+
+def test_periodic_checkpoints(tmp_path: Path) -> None:
+    path = tmp_path / "state.ckpt"
+    x, it = solve_relaxation(A=A, b=B, eps=1e-13, checkpoint=str(path), checkpoint_seconds=0.0)
+    saved_x, _, saved_it, _ = load_checkpoint(str(path))
+    assert saved_it == it
+    assert saved_x == x
+
+
+def test_resume_rejects_other_system(tmp_path: Path) -> None:
+    path = str(tmp_path / "state.ckpt")
+    solve_relaxation(A=A, b=B, max_iter=3, checkpoint=path)
+    with pytest.raises(ValueError, match="другой системе"):
+        solve_relaxation(A=A, b=[1.0] * 5, resume_from=path)
+
+
+def test_rejects_non_checkpoint_file(tmp_path: Path) -> None:
+    path = tmp_path / "junk.ckpt"
+    path.write_bytes(b"not a checkpoint at all, definitely not" * 2)
+    with pytest.raises(ValueError, match="не является контрольной точкой"):
+        solve_relaxation(A=A, b=B, resume_from=str(path))
+
+
+def test_only_for_relaxation(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Контрольные точки"):
+        solve_relaxation(A=A, b=B, method="jacobi", checkpoint=str(tmp_path / "s.ckpt"))
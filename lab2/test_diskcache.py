@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from . import main
+from .diskcache import PreparedCache
+from .main import load_validated_matrix, solve_relaxation
+from .sparse import CSRMatrix
+
+
+A_TEXT = "10 1 1\n2 10 1\n2 2 10\n"
+MTX = "%%MatrixMarket matrix coordinate real general\n3 3 5\n1 1 4\n1 2 1\n2 2 4\n3 2 1\n3 3 4\n"
+
+
+def _count_validations(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    original = main.validate_matrix
+    monkeypatch.setattr(main, "validate_matrix", lambda *a, **kw: calls.append(1) or original(*a, **kw))
+    return calls
+
+
+class TestPreparedCache:
+    def test_hit_skips_parsing_and_validation(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "A.txt").write_text(A_TEXT, encoding="utf-8")
+        calls = _count_validations(monkeypatch)
+        cache = str(tmp_path / "cache")
+        first = load_validated_matrix(str(tmp_path / "A.txt"), cache)
+        monkeypatch.setattr(main, "load_matrix", lambda *_: pytest.fail("файл разобран повторно"))
+        second = load_validated_matrix(str(tmp_path / "A.txt"), cache)
+        assert [list(row) for row in second] == first
+        assert len(calls) == 1
+
+    def test_sparse_roundtrip(self, tmp_path: Path) -> None:
+        (tmp_path / "A.mtx").write_text(MTX, encoding="utf-8")
+        cache = str(tmp_path / "cache")
+        first = load_validated_matrix(str(tmp_path / "A.mtx"), cache)
+        second = load_validated_matrix(str(tmp_path / "A.mtx"), cache)
+        assert isinstance(second, CSRMatrix)
+        assert second == first
+
+    def test_rejection_is_cached(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "A.txt").write_text("1 2\n3 1\n", encoding="utf-8")
+        calls = _count_validations(monkeypatch)
+        for _ in range(2):
+            with pytest.raises(ValueError, match="диагонального преобладания"):
+                load_validated_matrix(str(tmp_path / "A.txt"), str(tmp_path / "cache"))
+        assert len(calls) == 1
+
+    def test_changed_file_is_reloaded(self, tmp_path: Path) -> None:
+        path = tmp_path / "A.txt"
+        path.write_text(A_TEXT, encoding="utf-8")
+        cache = str(tmp_path / "cache")
+        load_validated_matrix(str(path), cache)
+        path.write_text("5 1\n1 5\n", encoding="utf-8")
+        os.utime(path, ns=(1, 1))
+        assert [list(row) for row in load_validated_matrix(str(path), cache)] == [[5.0, 1.0], [1.0, 5.0]]
+
+    def test_size_bound_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = PreparedCache(str(tmp_path / "cache"), max_bytes=450)
+        for k in range(3):
+            cache.put(f"k{k}", [[float(k), 1.0], [1.0, 2.0]])
+            os.utime(tmp_path / "cache" / f"k{k}.json", ns=(k + 1, k + 1))
+        cache.evict()
+        kept = sorted(p.stem for p in (tmp_path / "cache").glob("k*.json"))
+        assert kept == ["k1", "k2"]
+
+
+def test_solve_relaxation_with_cache(tmp_path: Path) -> None:
+    (tmp_path / "A.txt").write_text(A_TEXT, encoding="utf-8")
+    (tmp_path / "B.txt").write_text("12 13 14\n", encoding="utf-8")
+    kwargs = dict(A_file=str(tmp_path / "A.txt"), B_file=str(tmp_path / "B.txt"), eps=1e-12)
+    expected = solve_relaxation(**kwargs)
+    for _ in range(2):
+        assert solve_relaxation(cache_dir=str(tmp_path / "cache"), **kwargs) == expected
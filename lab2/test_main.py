@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 import os
 import re
 import subprocess
@@ -8,6 +9,8 @@ from pathlib import Path
 
 import pytest
 
+from .main import determinant, is_nonsingular, log_determinant, validate_inputs
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
@@ -99,6 +102,38 @@ class TestMainProgram:
         assert "Матрица A не удовлетворяет условию диагонального преобладания" in res.stdout
 
 
+class TestDeterminant:
+    def test_known_values(self) -> None:
+        assert determinant([[5.0]]) == 5.0
+        assert abs(determinant([[4.0, 1.0], [2.0, 3.0]]) - 10.0) < 1e-12
+        # Требует перестановки строк: знак должен учитываться
+        assert abs(determinant([[0.0, 1.0, 2.0], [1.0, 0.0, 3.0], [4.0, -3.0, 8.0]]) - (-2.0)) < 1e-12
+
+    def test_singular(self) -> None:
+        A = [[1.0, 2.0, 3.0], [2.0, 4.0, 6.0], [1.0, 0.0, 1.0]]
+        assert abs(determinant(A)) < 1e-12
+        assert not is_nonsingular(A)
+
+    def test_log_determinant_does_not_overflow(self) -> None:
+        n = 200
+        A = [[1e3 if i == j else (1.0 if j == i + 1 else 0.0) for j in range(n)] for i in range(n)]
+        sign, logabs = log_determinant(A)
+        assert sign == 1.0
+        assert abs(logabs - n * math.log(1e3)) < 1e-9
+        assert determinant(A) == math.inf
+
+    def test_validation_with_weak_dominance_checks_singularity(self) -> None:
+        # Нестрогое преобладание (tol < 0) не доказывает невырожденность
+        A = [[1.0, 1.0], [1.0, 1.0]]
+        with pytest.raises(ValueError, match="вырожденной"):
+            validate_inputs(A, [1.0, 1.0], eps=1e-9, max_iter=10, dominance_tol=-0.5)
+
+    def test_validation_is_fast_for_large_dominant_matrix(self) -> None:
+        n = 60
+        A = [[float(n) if i == j else 0.5 for j in range(n)] for i in range(n)]
+        validate_inputs(A, [1.0] * n, eps=1e-9, max_iter=10)
+
+
 @pytest.mark.parametrize(
     "A,x_true",
     [
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from .main import solve_relaxation
+from .sparse import csr_from_dense
+
+
+A = [
+    [20.0, 1.0, 0.0, -1.0],
+    [2.0, 18.0, 1.0, 0.0],
+    [0.0, -1.0, 16.0, 2.0],
+    [1.0, 0.0, 1.0, 17.0],
+]
+X_TRUE = [1.0, -2.0, 0.5, 3.0]
+SPD = [
+    [6.0, 1.0, 0.0],
+    [1.0, 7.0, 1.0],
+    [0.0, 1.0, 8.0],
+]
+
+
+def matvec(A: list[list[float]], x: list[float]) -> list[float]:
+    return [sum(A[i][j] * x[j] for j in range(len(x))) for i in range(len(A))]
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize(
+    "method,omega",
+    [("relaxation", 1.0), ("jacobi", 1.0), ("gauss_seidel", 1.0), ("sor", 1.1)],
+)
+def test_methods_agree(method: str, omega: float, sparse: bool) -> None:
+    matrix = csr_from_dense(A) if sparse else A
+    x, it = solve_relaxation(A=matrix, b=matvec(A, X_TRUE), eps=1e-12, method=method, omega=omega)
+    assert it > 0
+    for got, exp in zip(x, X_TRUE):
+        assert abs(got - exp) < 1e-9
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_conjugate_gradient(sparse: bool) -> None:
+    x_true = [1.5, -2.0, 0.25]
+    matrix = csr_from_dense(SPD) if sparse else SPD
+    x, it = solve_relaxation(A=matrix, b=matvec(SPD, x_true), eps=1e-12, method="cg")
+    # В точной арифметике CG сходится не более чем за n шагов
+    assert it <= 4
+    for got, exp in zip(x, x_true):
+        assert abs(got - exp) < 1e-9
+
+
+def test_gauss_seidel_needs_fewer_sweeps_than_jacobi() -> None:
+    b = matvec(A, X_TRUE)
+    _, it_jacobi = solve_relaxation(A=A, b=b, eps=1e-12, method="jacobi")
+    _, it_gs = solve_relaxation(A=A, b=b, eps=1e-12, method="gauss_seidel")
+    assert it_gs < it_jacobi
+
+
+def test_cg_rejects_nonsymmetric() -> None:
+    with pytest.raises(ValueError, match="симметричной"):
+        solve_relaxation(A=A, b=matvec(A, X_TRUE), method="cg")
+
+
+def test_invalid_parameters() -> None:
+    with pytest.raises(ValueError, match="Неизвестный метод"):
+        solve_relaxation(A=A, b=[1.0] * 4, method="newton")
+    with pytest.raises(ValueError, match="omega"):
+        solve_relaxation(A=A, b=[1.0] * 4, method="sor", omega=2.5)
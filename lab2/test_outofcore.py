@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import random
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+from .binary import NPY_MAGIC, npy_header, write_npy, write_raw
+from .main import solve_relaxation
+from .methods import matvec
+from .outofcore import matrix_file_shape, out_of_core_relaxation_method, row_blocks, validate_out_of_core
+
+
+def _dominant(n: int, seed: int = 0) -> list[list[float]]:
+    rng = random.Random(seed)
+    A = [[rng.uniform(-1.0, 1.0) for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        A[i][i] = sum(abs(v) for j, v in enumerate(A[i]) if j != i) + 1.0
+    return A
+
+
+class TestRowBlocks:
+    def test_blocks_cover_matrix(self, tmp_path: Path) -> None:
+        A = _dominant(7)
+        path = str(tmp_path / "A.npy")
+        write_npy(path, A)
+        seen = []
+        for start, rows in row_blocks(path, block_rows=3):
+            assert len(rows) <= 3
+            seen.extend((start + k, list(row)) for k, row in enumerate(rows))
+        assert seen == list(enumerate(A))
+
+    def test_raw_file_shape(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "A.f64")
+        write_raw(path, _dominant(4))
+        assert matrix_file_shape(path) == (4, 0, False)
+
+    def test_npy_header_offset(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "A.npy")
+        write_npy(path, _dominant(3))
+        shape, offset, swap = npy_header(path)
+        assert shape == (3, 3)
+        assert offset % 64 == 0
+        assert swap is False
+
+    def test_big_endian_npy(self, tmp_path: Path) -> None:
+        A = [[4.0, 1.0], [1.0, 3.0]]
+        values = array("d", [v for row in A for v in row])
+        if sys.byteorder == "little":
+            values.byteswap()
+        header = "{'descr': '>f8', 'fortran_order': False, 'shape': (2, 2), }"
+        header += " " * (64 - (len(header) + 11) % 64) + "\n"
+        path = tmp_path / "A.npy"
+        path.write_bytes(
+            NPY_MAGIC + b"\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1") + values.tobytes()
+        )
+        rows = [list(row) for _, block in row_blocks(str(path), block_rows=1) for row in block]
+        assert rows == A
+
+    def test_not_square(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "A.bin")
+        write_raw(path, [1.0, 2.0, 3.0])
+        with pytest.raises(ValueError, match="не является квадратной"):
+            matrix_file_shape(path)
+
+
+class TestValidation:
+    def test_returns_diagonal(self, tmp_path: Path) -> None:
+        A = _dominant(5)
+        path = str(tmp_path / "A.npy")
+        write_npy(path, A)
+        assert validate_out_of_core(path, block_rows=2) == [A[i][i] for i in range(5)]
+
+    def test_not_dominant(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "A.npy")
+        write_npy(path, [[1.0, 2.0], [0.0, 1.0]])
+        with pytest.raises(ValueError, match="диагонального преобладания"):
+            validate_out_of_core(path)
+
+    def test_zero_diagonal(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "A.npy")
+        write_npy(path, [[0.0, 0.0], [0.0, 1.0]])
+        with pytest.raises(ValueError, match="равен 0"):
+            validate_out_of_core(path)
+
+
+class TestOutOfCoreSolve:
+    @pytest.mark.parametrize("block_rows", [1, 4, None])
+    def test_matches_solution(self, tmp_path: Path, block_rows) -> None:
+        n = 12
+        A = _dominant(n, seed=3)
+        x_true = [random.Random(4).uniform(-1.0, 1.0) for _ in range(n)]
+        b = matvec(A, x_true)
+        path = str(tmp_path / "A.npy")
+        write_npy(path, A)
+        x, _ = out_of_core_relaxation_method(path, b, eps=1e-12, block_rows=block_rows)
+        assert max(abs(g - e) for g, e in zip(x, x_true)) < 1e-9
+
+    def test_solve_relaxation_out_of_core(self, tmp_path: Path) -> None:
+        A = [[10.0, 1.0, 1.0], [2.0, 10.0, 1.0], [2.0, 2.0, 10.0]]
+        write_raw(str(tmp_path / "A.f64"), A)
+        write_npy(str(tmp_path / "B.npy"), [12.0, 13.0, 14.0])
+        x, _ = solve_relaxation(
+            A_file=str(tmp_path / "A.f64"),
+            B_file=str(tmp_path / "B.npy"),
+            eps=1e-12,
+            out_of_core=True,
+            block_rows=2,
+        )
+        assert x == pytest.approx([1.0, 1.0, 1.0], abs=1e-10)
+
+    def test_requires_binary_file(self, tmp_path: Path) -> None:
+        (tmp_path / "A.txt").write_text("1 0\n0 1\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="двоичный файл"):
+            solve_relaxation(A_file=str(tmp_path / "A.txt"), b=[1.0, 1.0], out_of_core=True)
+
+    def test_rhs_size_mismatch(self, tmp_path: Path) -> None:
+        write_npy(str(tmp_path / "A.npy"), [[2.0, 0.0], [0.0, 2.0]])
+        with pytest.raises(ValueError, match="Размерность b"):
+            solve_relaxation(A_file=str(tmp_path / "A.npy"), b=[1.0], out_of_core=True)
+
+    def test_rejects_other_methods(self, tmp_path: Path) -> None:
+        write_npy(str(tmp_path / "A.npy"), [[2.0, 0.0], [0.0, 2.0]])
+        with pytest.raises(ValueError, match="out_of_core"):
+            solve_relaxation(A_file=str(tmp_path / "A.npy"), b=[1.0, 1.0], method="jacobi", out_of_core=True)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import random
+from array import array
+from pathlib import Path
+
+import pytest
+
+from .main import relaxation_method, solve_relaxation
+from .methods import matvec
+from .packed import BandMatrix, SymmetricPackedMatrix, read_packed_matrix, thomas_solve
+
+
+def _write(path: Path, A: list[list[float]]) -> str:
+    path.write_text("".join(" ".join(repr(v) for v in row) + "\n" for row in A), encoding="utf-8")
+    return str(path)
+
+
+def banded(n: int, lower: int, upper: int, seed: int = 0) -> list[list[float]]:
+    rng = random.Random(seed)
+    A = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(max(0, i - lower), min(n, i + upper + 1)):
+            A[i][j] = rng.uniform(-1.0, 1.0)
+        A[i][i] = sum(abs(v) for v in A[i]) + 1.0
+    return A
+
+
+def symmetric(n: int, seed: int = 0) -> list[list[float]]:
+    rng = random.Random(seed)
+    A = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            A[i][j] = A[j][i] = rng.uniform(-1.0, 1.0)
+    for i in range(n):
+        A[i][i] = sum(abs(v) for v in A[i]) + 1.0
+    return A
+
+
+class TestDetection:
+    def test_band(self, tmp_path: Path) -> None:
+        A = banded(12, 2, 1)
+        M = read_packed_matrix(_write(tmp_path / "A.txt", A))
+        assert isinstance(M, BandMatrix)
+        assert (M.lower, M.upper) == (2, 1)
+        assert len(M.data) == 12 * 4
+        assert M.to_dense() == A
+
+    def test_symmetric(self, tmp_path: Path) -> None:
+        A = symmetric(7)
+        M = read_packed_matrix(_write(tmp_path / "A.txt", A))
+        assert isinstance(M, SymmetricPackedMatrix)
+        assert len(M.data) == 7 * 8 // 2
+        assert M.to_dense() == A
+        assert [list(M.row(i)) for i in range(7)] == [list(enumerate(row)) for row in A]
+
+    def test_general_and_non_square_stay_dense(self, tmp_path: Path) -> None:
+        A = [[4.0, 1.0, 0.5], [2.0, 5.0, 1.0], [0.0, 1.0, 3.0]]
+        assert read_packed_matrix(_write(tmp_path / "A.txt", A)) == A
+        assert read_packed_matrix(_write(tmp_path / "B.txt", [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])) == [
+            [1.0, 2.0, 3.0],
+            [4.0, 5.0, 6.0],
+        ]
+
+    @pytest.mark.parametrize("make", [lambda: banded(10, 1, 2), lambda: symmetric(6)])
+    def test_matvec(self, tmp_path: Path, make) -> None:
+        A = make()
+        M = read_packed_matrix(_write(tmp_path / "A.txt", A))
+        x = [float(i) - 2.5 for i in range(len(A))]
+        assert M.matvec(x) == pytest.approx(matvec(A, x), abs=1e-12)
+
+
+class TestThomas:
+    def test_matches_exact_solution(self, tmp_path: Path) -> None:
+        A = banded(50, 1, 1, seed=2)
+        x_true = [random.Random(3).uniform(-1.0, 1.0) for _ in range(50)]
+        T = read_packed_matrix(_write(tmp_path / "A.txt", A))
+        assert x_true == pytest.approx(thomas_solve(T, matvec(A, x_true)), abs=1e-12)
+
+    def test_rejects_wide_band(self) -> None:
+        with pytest.raises(ValueError, match="трёхдиагональной"):
+            thomas_solve(BandMatrix(4, 2, 0, array("d", [0.0] * 12)), [0.0] * 4)
+
+
+class TestSolveRelaxation:
+    def test_tridiagonal_file_skips_iterations(self, tmp_path: Path) -> None:
+        A = banded(40, 1, 1, seed=4)
+        x_true = [float(i % 5) for i in range(40)]
+        x, iterations = solve_relaxation(A_file=_write(tmp_path / "A.txt", A), b=matvec(A, x_true))
+        assert iterations == 0
+        assert x == pytest.approx(x_true, abs=1e-10)
+
+    @pytest.mark.parametrize("make", [lambda: banded(20, 2, 2, seed=5), lambda: symmetric(9, seed=6)])
+    def test_packed_relaxation_matches_dense(self, tmp_path: Path, make) -> None:
+        A = make()
+        b = [1.0] * len(A)
+        x, iterations = solve_relaxation(A_file=_write(tmp_path / "A.txt", A), b=b, eps=1e-12)
+        x_dense, it_dense = relaxation_method(A, b, eps=1e-12)
+        assert iterations == it_dense
+        assert x == pytest.approx(x_dense, abs=1e-12)
+
+    def test_other_methods_use_csr(self, tmp_path: Path) -> None:
+        A = banded(30, 1, 1, seed=7)
+        b = matvec(A, [1.0] * 30)
+        x, iterations = solve_relaxation(A_file=_write(tmp_path / "A.txt", A), b=b, eps=1e-12, method="jacobi")
+        assert iterations > 0
+        assert x == pytest.approx([1.0] * 30, abs=1e-10)
+
+    def test_general_methods_read_rows(self, tmp_path: Path) -> None:
+        A = banded(12, 1, 1, seed=8)
+        b = matvec(A, [2.0] * 12)
+        x, _ = solve_relaxation(
+            A_file=_write(tmp_path / "A.txt", A), b=b, eps=1e-10, max_iter=10**6, method="kaczmarz"
+        )
+        assert x == pytest.approx([2.0] * 12, abs=1e-8)
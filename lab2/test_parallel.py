@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import signal
+import threading
+
+import pytest
+
+from .bench import poisson2d
+from .main import solve_relaxation
+from .methods import gauss_seidel_method, jacobi_method
+from .parallel import colored_gauss_seidel_method, parallel_jacobi_method
+from .sparse import csr_from_dense, greedy_coloring, permute_matrix
+
+
+A = [
+    [30.0, 1.0, 0.0, -1.0, 0.5],
+    [2.0, 28.0, 1.0, 0.0, -1.0],
+    [0.0, -1.0, 27.0, 2.0, 1.0],
+    [1.0, 0.0, 1.0, 29.0, -1.0],
+    [-0.5, 1.0, 0.0, 2.0, 26.0],
+]
+B = [24.5, -52.5, 20.5, 89.5, -22.5]
+X_TRUE = [1.0, -2.0, 0.5, 3.0, -1.0]
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_matches_sequential_jacobi(sparse: bool, workers: int) -> None:
+    matrix = csr_from_dense(A) if sparse else A
+    x, it = parallel_jacobi_method(matrix, B, eps=1e-12, workers=workers)
+    x_seq, it_seq = jacobi_method(A, B, eps=1e-12)
+    assert it == it_seq
+    for got, exp in zip(x, x_seq):
+        assert abs(got - exp) < 1e-12
+
+
+def test_solve_relaxation_parallel_mode() -> None:
+    x, _ = solve_relaxation(A=A, b=B, eps=1e-12, method="parallel_jacobi", workers=2)
+    for got, exp in zip(x, X_TRUE):
+        assert abs(got - exp) < 1e-9
+
+
+def test_more_workers_than_unknowns() -> None:
+    x, _ = parallel_jacobi_method([[2.0, 0.0], [0.0, 4.0]], [2.0, 8.0], eps=1e-12, workers=8)
+    assert x == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("method", [parallel_jacobi_method, colored_gauss_seidel_method])
+def test_dead_worker_raises(method) -> None:
+    def kill_one() -> None:
+        os.kill(mp.active_children()[0].pid, signal.SIGKILL)
+
+    # eps=0: без гибели исполнителя проходы шли бы до max_iter
+    timer = threading.Timer(0.5, kill_one)
+    timer.start()
+    try:
+        with pytest.raises(RuntimeError, match="аварийно"):
+            method(csr_from_dense(A), B, eps=0.0, max_iter=10**9, workers=2)
+    finally:
+        timer.cancel()
+
+
+class TestColoredGaussSeidel:
+    def test_grid_is_red_black(self) -> None:
+        colors = greedy_coloring(poisson2d(16))
+        assert set(colors) == {0, 1}
+        # Соседи по сетке 4×4 получают разные цвета
+        assert colors[0] != colors[1] and colors[0] != colors[4]
+
+    @pytest.mark.parametrize("workers", [1, 2, 3])
+    def test_independent_of_workers(self, workers: int) -> None:
+        A_grid = poisson2d(64)
+        b = [1.0] * A_grid.n
+        x, it = colored_gauss_seidel_method(A_grid, b, eps=1e-12, workers=workers)
+        x_ref, it_ref = colored_gauss_seidel_method(A_grid, b, eps=1e-12, workers=1)
+        assert it == it_ref
+        assert x == x_ref
+
+    def test_matches_gauss_seidel_in_color_order(self) -> None:
+        A_grid = poisson2d(36)
+        b = [float(i % 5) for i in range(A_grid.n)]
+        order = sorted(range(A_grid.n), key=lambda i: greedy_coloring(A_grid)[i])
+        x_seq, it_seq = gauss_seidel_method(permute_matrix(A_grid, order), [b[i] for i in order], eps=1e-12)
+        x, it = colored_gauss_seidel_method(A_grid, b, eps=1e-12, workers=2)
+        assert it == it_seq
+        for k, i in enumerate(order):
+            assert abs(x[i] - x_seq[k]) < 1e-14
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_via_solve_relaxation(self, sparse: bool) -> None:
+        matrix = csr_from_dense(A) if sparse else A
+        x, _ = solve_relaxation(A=matrix, b=B, eps=1e-12, method="colored_gauss_seidel", workers=2)
+        for got, exp in zip(x, X_TRUE):
+            assert abs(got - exp) < 1e-10
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from .main import solve_relaxation
+from .methods import matvec
+from .randomized import coordinate_descent_method, kaczmarz_method, validate_general
+from .sparse import csr_from_dense
+
+
+def _system(m: int, n: int, seed: int = 0):
+    rng = random.Random(seed)
+    A = [[rng.gauss(0.0, 1.0) for _ in range(n)] for _ in range(m)]
+    x_true = [rng.uniform(-1.0, 1.0) for _ in range(n)]
+    return A, x_true, matvec(A, x_true)
+
+
+# Не удовлетворяет условию преобладания, но невырождена
+NON_DOMINANT = [[1.0, 2.0, 0.0], [3.0, 1.0, 1.0], [0.0, 4.0, 1.0]]
+
+
+@pytest.mark.parametrize("method", ["kaczmarz", "coordinate_descent"])
+class TestRandomizedMethods:
+    def test_non_dominant_square(self, method: str) -> None:
+        x_true = [1.0, -1.0, 2.0]
+        x, _ = solve_relaxation(
+            A=NON_DOMINANT, b=matvec(NON_DOMINANT, x_true), eps=1e-10, max_iter=10**6, method=method
+        )
+        assert x == pytest.approx(x_true, abs=1e-8)
+
+    def test_tall_consistent(self, method: str) -> None:
+        A, x_true, b = _system(30, 6)
+        x, iterations = solve_relaxation(A=A, b=b, eps=1e-10, max_iter=10**6, method=method)
+        assert iterations > 0
+        assert x == pytest.approx(x_true, abs=1e-8)
+
+    def test_sparse(self, method: str) -> None:
+        x_true = [0.5, 0.0, -2.0]
+        A = csr_from_dense(NON_DOMINANT)
+        x, _ = solve_relaxation(A=A, b=matvec(NON_DOMINANT, x_true), eps=1e-10, max_iter=10**6, method=method)
+        assert x == pytest.approx(x_true, abs=1e-8)
+
+    def test_exact_x0(self, method: str) -> None:
+        A, x_true, b = _system(10, 4)
+        assert solve_relaxation(A=A, b=b, x0=x_true, eps=1e-9, method=method) == (x_true, 0)
+
+
+def test_same_seed_is_reproducible() -> None:
+    A, _, b = _system(12, 5, seed=2)
+    assert kaczmarz_method(A, b, eps=1e-9, max_iter=10**5) == kaczmarz_method(A, b, eps=1e-9, max_iter=10**5)
+
+
+def test_coordinate_descent_least_squares() -> None:
+    # Несовместная система: решение наименьших квадратов для y = c0 + c1 t
+    A = [[1.0, 0.0], [1.0, 1.0], [1.0, 2.0]]
+    b = [0.0, 2.0, 1.0]
+    x, _ = coordinate_descent_method(A, b, eps=1e-12, max_iter=10**6)
+    assert x == pytest.approx([0.5, 0.5], abs=1e-9)
+
+
+def test_validation() -> None:
+    with pytest.raises(ValueError, match="недоопределена"):
+        validate_general([[1.0, 2.0, 3.0]], [1.0])
+    with pytest.raises(ValueError, match="Размерность b"):
+        validate_general([[1.0], [2.0]], [1.0])
+    with pytest.raises(ValueError, match="разную длину"):
+        solve_relaxation(A=[[1.0, 2.0], [1.0]], b=[1.0, 1.0], method="kaczmarz")
+    with pytest.raises(ValueError, match="Перенумерация"):
+        solve_relaxation(A=NON_DOMINANT, b=[1.0, 1.0, 1.0], method="kaczmarz", reorder="rcm")
+
+
+def test_dominance_still_required_for_relaxation() -> None:
+    with pytest.raises(ValueError, match="диагонального преобладания"):
+        solve_relaxation(A=NON_DOMINANT, b=[1.0, 1.0, 1.0])
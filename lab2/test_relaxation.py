@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from .main import solve_relaxation
+from .relaxation import (
+    PackedColumns,
+    block_relax,
+    build_iteration_matrix,
+    build_packed_iteration_matrix,
+    initial_residual,
+    iter_relaxation,
+    relaxation_method,
+)
+from .sparse import csr_from_dense
+
+
+def random_dominant(n: int, seed: int = 0) -> list[list[float]]:
+    rng = random.Random(seed)
+    A = [[rng.uniform(-1.0, 1.0) for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        A[i][i] = 1.5 * sum(abs(v) for j, v in enumerate(A[i]) if j != i)
+    return A
+
+
+def matvec(A: list[list[float]], x: list[float]) -> list[float]:
+    return [sum(A[i][j] * x[j] for j in range(len(x))) for i in range(len(A))]
+
+
+class TestBlockRelaxation:
+    @pytest.mark.parametrize("sparse", [False, True])
+    @pytest.mark.parametrize("block_size", [None, 1, 4])
+    def test_converges(self, sparse: bool, block_size) -> None:
+        A = random_dominant(20)
+        x_true = [float(i % 4) - 1.5 for i in range(20)]
+        matrix = csr_from_dense(A) if sparse else A
+        x, it = solve_relaxation(
+            A=matrix, b=matvec(A, x_true), eps=1e-11, method="block_relaxation", block_size=block_size
+        )
+        assert it > 0
+        assert max(abs(g - e) for g, e in zip(x, x_true)) < 1e-9
+
+    def test_block_of_one_is_plain_relaxation(self) -> None:
+        A = random_dominant(10)
+        b = matvec(A, [1.0] * 10)
+        assert solve_relaxation(A=A, b=b, method="block_relaxation", block_size=1) == solve_relaxation(A=A, b=b)
+
+    def test_fewer_scans_than_single_index(self) -> None:
+        A = random_dominant(40, seed=3)
+        b = matvec(A, [float(i) for i in range(40)])
+        _, single = solve_relaxation(A=A, b=b, eps=1e-9)
+        _, scans = solve_relaxation(A=A, b=b, eps=1e-9, method="block_relaxation", block_size=8)
+        assert scans < single / 4
+
+    def test_invalid_block_size(self) -> None:
+        A = random_dominant(3)
+        with pytest.raises(ValueError, match="Размер блока"):
+            block_relax(build_iteration_matrix(A), [1.0] * 3, block_size=0)
+
+
+class TestMixedPrecision:
+    def test_packed_matrix_matches_dense(self) -> None:
+        A = random_dominant(6)
+        P = build_iteration_matrix(A)
+        packed = build_packed_iteration_matrix(A, "float64")
+        assert isinstance(packed, PackedColumns)
+        for s in range(6):
+            column = packed.column(s)
+            for i in range(6):
+                assert abs(column[i] - (0.0 if i == s else P[i][s])) < 1e-15
+        x0 = [0.5 * i for i in range(6)]
+        c = [1.0] * 6
+        for got, exp in zip(initial_residual(packed, c, x0), initial_residual(P, c, x0)):
+            assert abs(got - exp) < 1e-12
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    @pytest.mark.parametrize("precision", ["float32", "float64"])
+    def test_refinement_reaches_full_accuracy(self, sparse: bool, precision: str) -> None:
+        A = random_dominant(25, seed=5)
+        x_true = [1.0 / (i + 1) for i in range(25)]
+        matrix = csr_from_dense(A) if sparse else A
+        x, it = solve_relaxation(A=matrix, b=matvec(A, x_true), eps=1e-12, precision=precision)
+        assert it > 0
+        # float32 сам по себе дал бы ошибку порядка 1e-7
+        assert max(abs(g - e) for g, e in zip(x, x_true)) < 1e-10
+
+    def test_float32_storage_is_compact(self) -> None:
+        packed = build_packed_iteration_matrix(random_dominant(30), "float32")
+        assert packed.data.itemsize == 4
+        assert len(packed.data) == 30 * 30
+
+    def test_invalid_precision(self) -> None:
+        A = random_dominant(3)
+        with pytest.raises(ValueError, match="точность"):
+            solve_relaxation(A=A, b=[1.0] * 3, precision="float16")
+        with pytest.raises(ValueError, match="Компактное хранение"):
+            solve_relaxation(A=A, b=[1.0] * 3, method="jacobi", precision="float32")
+
+
+class TestIterRelaxation:
+    def test_full_run_matches_relaxation_method(self) -> None:
+        A = random_dominant(20, seed=3)
+        b = [float(i % 4) for i in range(20)]
+        snapshots = []
+        gen = iter_relaxation(A, b, eps=1e-10, every=7)
+        try:
+            while True:
+                snap = next(gen)
+                snapshots.append((snap.iteration, snap.max_residual, snap.converged))
+        except StopIteration as stop:
+            x, iterations = stop.value
+        assert (x, iterations) == relaxation_method(A, b, eps=1e-10)
+        assert all(it % 7 == 0 for it, _, _ in snapshots[:-1])
+        assert snapshots[-1][2] and snapshots[-1][1] < 1e-10
+        assert not any(done for _, _, done in snapshots[:-1])
+
+    def test_send_stops_early(self) -> None:
+        A = random_dominant(15, seed=4)
+        gen = iter_relaxation(A, [1.0] * 15, eps=1e-12, every=5)
+        snap = next(gen)
+        assert snap.iteration == 5
+        with pytest.raises(StopIteration) as stop:
+            gen.send(True)
+        x, iterations = stop.value.value
+        assert iterations == 5
+        assert x is snap.x
+
+    def test_interleaved_solves(self) -> None:
+        systems = [random_dominant(10, seed=s) for s in range(3)]
+        gens = [iter_relaxation(A, [1.0] * 10, eps=1e-9, every=3) for A in systems]
+        pending = list(gens)
+        while pending:
+            for gen in list(pending):
+                if next(gen).converged:
+                    pending.remove(gen)
+                    gen.close()
+        assert not pending
+
+    def test_max_iter(self, capsys) -> None:
+        gen = iter_relaxation(random_dominant(10), [1.0] * 10, eps=1e-15, max_iter=4, every=3)
+        assert [snap.iteration for snap in gen] == [3, 4]
+        assert "Достигнуто максимальное количество итераций." in capsys.readouterr().out
+
+    def test_bad_period(self) -> None:
+        with pytest.raises(ValueError, match="every"):
+            next(iter_relaxation([[1.0]], [1.0], every=0))
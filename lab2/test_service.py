@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from .service import SystemCache, handle_solve, make_server
+
+
+A = [[10.0, 1.0, 1.0], [2.0, 10.0, 1.0], [2.0, 2.0, 10.0]]
+B = [15.0, 25.0, 36.0]
+
+
+@pytest.fixture
+def server() -> Iterator:
+    srv = make_server(port=0, cache_size=2)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def post(srv, payload: dict) -> tuple[int, dict]:
+    url = f"http://127.0.0.1:{srv.server_address[1]}/solve"
+    req = urllib.request.Request(url, data=json.dumps(payload).encode(), method="POST")
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_inline_matrix_is_cached(server) -> None:
+    status, first = post(server, {"A": A, "b": B, "eps": 1e-12})
+    assert status == 200
+    assert not first["cached"]
+    for got, exp in zip(first["x"], [1.0, 2.0, 3.0]):
+        assert abs(got - exp) < 1e-9
+    status, second = post(server, {"A": A, "b": [11.0, 12.0, 14.0]})
+    assert second["cached"]
+    assert second["key"] == first["key"]
+
+
+def test_file_matrix_and_lru_eviction(server, tmp_path: Path) -> None:
+    path = tmp_path / "A.txt"
+    path.write_text("4 1\n2 3\n", encoding="utf-8")
+    assert not post(server, {"A_file": str(path), "b": [9.0, 13.0]})[1]["cached"]
+    assert post(server, {"A_file": str(path), "b": [9.0, 13.0]})[1]["cached"]
+    post(server, {"A": A, "b": B})
+    post(server, {"A": [[2.0, 0.0], [0.0, 2.0]], "b": [1.0, 1.0]})
+    assert len(server.cache) == 2
+    assert not post(server, {"A_file": str(path), "b": [9.0, 13.0]})[1]["cached"]
+
+
+def test_validation_errors(server) -> None:
+    status, reply = post(server, {"A": [[1.0, 2.0], [2.0, 1.0]], "b": [1.0, 1.0]})
+    assert status == 400
+    assert "диагонального преобладания" in reply["error"]
+    status, reply = post(server, {"A": A, "b": [1.0]})
+    assert status == 400
+    assert "Размерность b" in reply["error"]
+    status, reply = post(server, {"b": [1.0]})
+    assert status == 400
+
+
+def test_concurrent_requests(server) -> None:
+    results: list[tuple[int, dict]] = []
+
+    def worker(k: int) -> None:
+        b = [v * (k + 1) for v in B]
+        for _ in range(5):
+            results.append((k, post(server, {"A": A, "b": b, "eps": 1e-12})[1]))
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(results) == 40
+    assert len({r["key"] for _, r in results}) == 1
+    for k, r in results:
+        assert r["x"] == pytest.approx([(k + 1) * v for v in (1.0, 2.0, 3.0)], abs=1e-9)
+
+
+def test_concurrent_solves_share_cached_system() -> None:
+    # Частое переключение потоков, чтобы решения на одной системе перемежались
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    n = 60
+    big = [[4.0 if i == j else (-1.0 if abs(i - j) == 1 else 0.0) for j in range(n)] for i in range(n)]
+    cache = SystemCache()
+    results: list[tuple[int, dict]] = []
+
+    def worker(k: int) -> None:
+        x_true = [float(k + 1)] * n
+        b = [sum(a * v for a, v in zip(row, x_true)) for row in big]
+        for _ in range(5):
+            results.append((k, handle_solve(cache, {"A": big, "b": b, "eps": 1e-12})))
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(8)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(previous)
+    assert len(results) == 40
+    for k, r in results:
+        assert r["x"] == pytest.approx([float(k + 1)] * n, abs=1e-9)
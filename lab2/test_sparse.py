@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from .main import is_diagonally_dominant, read_coo_matrix, relaxation_method, solve_relaxation, validate_inputs
+from .sparse import bandwidth, csr_from_coo, csr_from_dense, permute_matrix, reverse_cuthill_mckee
+
+
+def tridiagonal_csr(n: int):
+    rows: list[int] = []
+    cols: list[int] = []
+    vals: list[float] = []
+    for i in range(n):
+        rows.append(i)
+        cols.append(i)
+        vals.append(4.0)
+        if i > 0:
+            rows.append(i)
+            cols.append(i - 1)
+            vals.append(-1.0)
+        if i < n - 1:
+            rows.append(i)
+            cols.append(i + 1)
+            vals.append(-1.0)
+    return csr_from_coo(n, rows, cols, vals)
+
+
+class TestSparseStorage:
+    def test_csr_roundtrip_and_csc(self) -> None:
+        A = [[4.0, 0.0, 1.0], [0.0, 5.0, 0.0], [2.0, 0.0, 6.0]]
+        csr = csr_from_dense(A)
+        assert csr.nnz == 5
+        assert csr.to_dense() == A
+        csc = csr.to_csc()
+        assert list(csc.column(0)) == [(0, 4.0), (2, 2.0)]
+        assert list(csc.column(2)) == [(0, 1.0), (2, 6.0)]
+
+    def test_duplicates_are_summed(self) -> None:
+        csr = csr_from_coo(2, [0, 0, 1], [0, 0, 1], [1.0, 2.0, 5.0])
+        assert csr.to_dense() == [[3.0, 0.0], [0.0, 5.0]]
+
+    def test_read_matrix_market_symmetric(self, tmp_path: Path) -> None:
+        path = tmp_path / "A.mtx"
+        path.write_text(
+            "%%MatrixMarket matrix coordinate real symmetric\n"
+            "% комментарий\n"
+            "3 3 4\n"
+            "1 1 4\n"
+            "2 1 1\n"
+            "2 2 5\n"
+            "3 3 6\n",
+            encoding="utf-8",
+        )
+        csr = read_coo_matrix(str(path))
+        assert csr.to_dense() == [[4.0, 1.0, 0.0], [1.0, 5.0, 0.0], [0.0, 0.0, 6.0]]
+
+    def test_read_plain_coordinates_non_square(self, tmp_path: Path) -> None:
+        path = tmp_path / "A.coo"
+        path.write_text("1 1 2\n1 3 1\n2 2 3\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="не является квадратной"):
+            read_coo_matrix(str(path))
+
+
+class TestSparseRelaxation:
+    def test_matches_dense(self) -> None:
+        A = [[10.0, 1.0, 1.0], [2.0, 10.0, 1.0], [2.0, 2.0, 10.0]]
+        b = [15.0, 25.0, 36.0]
+        x_dense, it_dense = relaxation_method(A, b, eps=1e-10)
+        x_sparse, it_sparse = relaxation_method(csr_from_dense(A), b, eps=1e-10)
+        assert it_dense == it_sparse
+        for got, exp in zip(x_sparse, x_dense):
+            assert abs(got - exp) < 1e-12
+
+    def test_large_tridiagonal(self) -> None:
+        n = 2000
+        A = tridiagonal_csr(n)
+        x_true = [float(i % 7) for i in range(n)]
+        b = A.matvec(x_true)
+        x, _ = solve_relaxation(A=A, b=b, eps=1e-9, max_iter=10**6)
+        assert max(abs(g - e) for g, e in zip(x, x_true)) < 1e-8
+
+    def test_validation(self) -> None:
+        A = csr_from_dense([[1.0, 2.0], [2.0, 1.0]])
+        assert not is_diagonally_dominant(A)
+        with pytest.raises(ValueError, match="диагонального преобладания"):
+            validate_inputs(A, [1.0, 1.0], eps=1e-9, max_iter=10)
+        with pytest.raises(ValueError, match="равен 0"):
+            validate_inputs(csr_from_dense([[0.0, 0.0], [0.0, 1.0]]), [1.0, 1.0], eps=1e-9, max_iter=10)
+
+    def test_solve_from_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "A.mtx"
+        path.write_text(
+            "%%MatrixMarket matrix coordinate real general\n2 2 3\n1 1 4\n1 2 1\n2 2 3\n",
+            encoding="utf-8",
+        )
+        x, _ = solve_relaxation(A_file=str(path), b=[9.0, 6.0], eps=1e-12)
+        assert abs(x[0] - 1.75) < 1e-9
+        assert abs(x[1] - 2.0) < 1e-9
+
+
+class TestReordering:
+    def scrambled_tridiagonal(self, n: int):
+        # Ленточная матрица в "перемешанной" нумерации
+        shuffle = [(7 * i) % n for i in range(n)]
+        return permute_matrix(tridiagonal_csr(n), shuffle)
+
+    def test_rcm_is_permutation_and_narrows_band(self) -> None:
+        A = self.scrambled_tridiagonal(31)
+        perm = reverse_cuthill_mckee(A)
+        assert sorted(perm) == list(range(31))
+        assert bandwidth(A) > 10
+        assert bandwidth(permute_matrix(A, perm)) == 1
+
+    def test_dense_and_sparse_permutations_agree(self) -> None:
+        A = self.scrambled_tridiagonal(12)
+        perm = reverse_cuthill_mckee(A)
+        assert reverse_cuthill_mckee(A.to_dense()) == perm
+        assert permute_matrix(A.to_dense(), perm) == permute_matrix(A, perm).to_dense()
+
+    @pytest.mark.parametrize("method", ["relaxation", "gauss_seidel"])
+    def test_solve_with_rcm_returns_original_order(self, method: str) -> None:
+        A = self.scrambled_tridiagonal(40)
+        x_true = [float(i) for i in range(40)]
+        x, _ = solve_relaxation(A=A, b=A.matvec(x_true), eps=1e-11, max_iter=10**5, method=method, reorder="rcm")
+        assert max(abs(g - e) for g, e in zip(x, x_true)) < 1e-9
+
+    def test_unknown_reorder(self) -> None:
+        with pytest.raises(ValueError, match="перенумерации"):
+            solve_relaxation(A=tridiagonal_csr(3), b=[1.0] * 3, reorder="amd")
+
+
+def test_set_keeps_sorted_storage() -> None:
+    A = csr_from_dense([[1.0, 0.0, 2.0], [0.0, 3.0, 0.0], [4.0, 0.0, 5.0]])
+    A.set(0, 1, 7.0)
+    A.set(2, 2, 6.0)
+    A.set(1, 0, 0.0)  # отсутствующий ноль не хранится
+    assert A.to_dense() == [[1.0, 7.0, 2.0], [0.0, 3.0, 0.0], [4.0, 0.0, 6.0]]
+    assert A.indptr == [0, 3, 4, 6]
+    C = A.to_csc()
+    C.set(1, 2, 8.0)
+    assert list(C.column(2)) == [(0, 2.0), (1, 8.0), (2, 6.0)]
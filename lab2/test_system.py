@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import pytest
+
+from . import main
+from .sparse import csr_from_dense
+from .system import RelaxationStepper, RelaxationSystem
+
+
+A = [[10.0, 1.0, 1.0], [2.0, 10.0, 1.0], [2.0, 2.0, 10.0]]
+
+
+def matvec(A: list[list[float]], x: list[float]) -> list[float]:
+    return [sum(A[i][j] * x[j] for j in range(len(x))) for i in range(len(A))]
+
+
+class TestRelaxationSystem:
+    def test_validates_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls = []
+        original = main.is_diagonally_dominant
+        monkeypatch.setattr(main, "is_diagonally_dominant", lambda *a, **kw: calls.append(1) or original(*a, **kw))
+        system = RelaxationSystem(A, eps=1e-12)
+        for x_true in ([1.0, 2.0, 3.0], [-1.0, 0.0, 4.0]):
+            x, _ = system.solve(matvec(A, x_true))
+            assert max(abs(g - e) for g, e in zip(x, x_true)) < 1e-10
+        assert len(calls) == 1
+
+    def test_solve_matches_solve_relaxation(self) -> None:
+        b = [15.0, 25.0, 36.0]
+        assert RelaxationSystem(A).solve(b) == main.solve_relaxation(A=A, b=b)
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_solve_many(self, sparse: bool) -> None:
+        xs = [[1.0, 2.0, 3.0], [-1.0, 0.0, 4.0], [0.5, -0.5, 0.0], [0.0, 0.0, 0.0]]
+        bs = [matvec(A, x) for x in xs]
+        B = [[b[i] for b in bs] for i in range(3)]
+        system = RelaxationSystem(csr_from_dense(A) if sparse else A, eps=1e-12)
+        X, it = system.solve_many(B)
+        assert it > 0
+        for k, x_true in enumerate(xs):
+            for i in range(3):
+                assert abs(X[i][k] - x_true[i]) < 1e-10
+
+    def test_rejects_wrong_rhs_size(self) -> None:
+        with pytest.raises(ValueError, match="Размерность b"):
+            RelaxationSystem(A).solve([1.0, 2.0])
+
+    def test_rejects_invalid_matrix(self) -> None:
+        with pytest.raises(ValueError, match="диагонального преобладания"):
+            RelaxationSystem([[1.0, 2.0], [2.0, 1.0]])
+
+
+class TestWarmStart:
+    @pytest.mark.parametrize("method", ["relaxation", "jacobi", "gauss_seidel", "cg", "parallel_jacobi"])
+    def test_exact_x0_needs_no_iterations(self, method: str) -> None:
+        S = [[6.0, 1.0, 0.0], [1.0, 7.0, 1.0], [0.0, 1.0, 8.0]]
+        x_true = [1.5, -2.0, 0.25]
+        x, it = main.solve_relaxation(A=S, b=matvec(S, x_true), x0=x_true, method=method, workers=1)
+        assert it == 0
+        assert x == x_true
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_initial_residual_includes_diagonal(self, sparse: bool) -> None:
+        b = matvec(A, [1.0, 2.0, 3.0])
+        matrix = csr_from_dense(A) if sparse else A
+        P = main.build_iteration_matrix(matrix)
+        c = [b[i] / A[i][i] for i in range(3)]
+        x0 = [0.5, -1.0, 2.0]
+        R = main.initial_residual(P, c, x0)
+        expected = [(b[i] - sum(A[i][j] * x0[j] for j in range(3))) / A[i][i] for i in range(3)]
+        for got, exp in zip(R, expected):
+            assert abs(got - exp) < 1e-12
+
+    def test_wrong_x0_size(self) -> None:
+        with pytest.raises(ValueError, match="Размерность x0"):
+            main.solve_relaxation(A=A, b=[1.0, 2.0, 3.0], x0=[0.0])
+
+    def test_stepper_reuses_previous_solution(self) -> None:
+        stepper = RelaxationStepper(eps=1e-10)
+        x_true = [1.0, 2.0, 3.0]
+        _, cold = stepper.step(A, matvec(A, x_true))
+        # Малое изменение правой части: тёплый старт сходится быстрее
+        x_next = [v + 1e-4 for v in x_true]
+        x, warm = stepper.step(A, matvec(A, x_next))
+        assert warm < cold
+        assert stepper.iterations == [cold, warm]
+        assert max(abs(g - e) for g, e in zip(x, x_next)) < 1e-9
+
+
+class TestIncrementalUpdate:
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_update_matches_fresh_solve(self, sparse: bool) -> None:
+        n = 30
+        dense = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            dense[i][i] = 4.0
+            if i > 0:
+                dense[i][i - 1] = -1.0
+            if i + 1 < n:
+                dense[i][i + 1] = -1.0
+        b = [1.0] * n
+        system = RelaxationSystem(csr_from_dense(dense) if sparse else [row[:] for row in dense], eps=1e-12)
+        _, cold = system.solve_and_track(b)
+
+        # Новый элемент вне шаблона, смена диагонали и правой части
+        changes = {(5, 20): 0.5, (7, 7): 5.0, (7, 6): -1.5}
+        system.update(changes, {3: 2.0})
+        x, warm = system.resolve()
+
+        for (i, j), v in changes.items():
+            dense[i][j] = v
+        b[3] = 2.0
+        residual = [b[i] - sum(dense[i][j] * x[j] for j in range(n)) for i in range(n)]
+        assert max(map(abs, residual)) < 1e-10
+        assert warm < cold
+        assert system.R == pytest.approx(
+            [residual[i] / dense[i][i] for i in range(n)], abs=1e-12
+        )
+
+    def test_rejected_update_leaves_system_unchanged(self) -> None:
+        system = RelaxationSystem([row[:] for row in A], eps=1e-12)
+        x, _ = system.solve_and_track([12.0, 13.0, 14.0])
+        with pytest.raises(ValueError, match="диагонального преобладания"):
+            system.update({(0, 1): 0.5, (1, 0): 20.0})
+        assert system.A == A
+        assert system.resolve() == (x, 0)
+
+    def test_update_before_solve(self) -> None:
+        system = RelaxationSystem([row[:] for row in A], eps=1e-12)
+        with pytest.raises(ValueError, match="сначала вызовите solve_and_track"):
+            system.update(b_changes={0: 1.0})
+        system.update({(0, 0): 20.0})
+        b = [22.0, 13.0, 14.0]
+        x, _ = system.solve(b)
+        assert x == pytest.approx([1.0, 1.0, 1.0], abs=1e-10)
+
+    def test_solve_keeps_tracked_state(self) -> None:
+        system = RelaxationSystem([row[:] for row in A], eps=1e-12)
+        x, _ = system.solve_and_track([12.0, 13.0, 14.0])
+        system.solve([1.0, 2.0, 3.0])
+        assert system.x == x
+        assert system.b == [12.0, 13.0, 14.0]
+        with pytest.raises(ValueError, match="сначала вызовите solve_and_track"):
+            RelaxationSystem(A).resolve()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from .main import build_iteration_matrix, relax, solve_relaxation
+from .telemetry import ConvergenceRecorder
+
+
+A = [[10.0, 1.0, 1.0], [2.0, 10.0, 1.0], [2.0, 2.0, 10.0]]
+B = [15.0, 25.0, 36.0]
+
+
+def test_records_every_k_iterations() -> None:
+    recorder = ConvergenceRecorder()
+    _, it = solve_relaxation(A=A, b=B, eps=1e-12, callback=recorder, callback_every=3)
+    assert [s.iteration for s in recorder.samples] == list(range(0, it, 3))
+    first = recorder.samples[0]
+    assert first.index == 2
+    assert first.max_residual == pytest.approx(3.6)
+    assert first.residual_norm >= first.max_residual
+    assert recorder.samples[-1].max_residual < first.max_residual
+    assert all(a.elapsed <= b.elapsed for a, b in zip(recorder.samples, recorder.samples[1:]))
+    assert not recorder.stagnated
+
+
+def test_aborts_on_stagnation() -> None:
+    # P с |p| = 1: поправка по одной компоненте полностью переходит в другую
+    P = [[-1.0, -1.0], [-1.0, -1.0]]
+    recorder = ConvergenceRecorder(stagnation_window=5)
+    _, it = relax(P, [1.0, 0.0], eps=1e-9, max_iter=10000, callback=recorder)
+    assert recorder.stagnated
+    assert it < 10
+
+
+def test_callback_only_for_relaxation() -> None:
+    with pytest.raises(ValueError, match="callback"):
+        solve_relaxation(A=A, b=B, method="jacobi", callback=ConvergenceRecorder())
+
+
+def test_callback_does_not_change_result() -> None:
+    P = build_iteration_matrix(A)
+    c = [B[i] / A[i][i] for i in range(3)]
+    assert relax(P, c, eps=1e-12, callback=lambda *args: False) == relax(P, c, eps=1e-12)